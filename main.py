@@ -1,10 +1,88 @@
+"""
+main.py
+
+Entry point: play the game at the console, or play a script of input lines
+to completion.
+
+    python main.py                                  # interactive
+    python main.py --script moves.txt               # play a script file
+    cat moves.txt | python main.py --script -       # play a pipe
+    python main.py --script moves.txt --format jsonl
+
+Scripts hold one input per line (commands and answers to prompts alike);
+lines starting with '#' are skipped. They run at full speed, without
+sleeps or prompts, and their exit status tells which ending was reached
+(see EXIT_CODES). Interactive sessions exit with status 0.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from collections.abc import Iterable
+
 from src import gameloop
+from src.io_interface import ConsoleIO
+from src.scriptio import FORMATS, ScriptIO
+
+# Exit status for each ending; None is a game left without an ending
+EXIT_CODES = {
+    "victory": 0,
+    "partial_victory": 10,
+    "defeat": 11,
+    "secret": 12,
+    None: 20,
+}
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Read the command line."""
+    parser = argparse.ArgumentParser(description="Play the game.")
+    parser.add_argument("--script", metavar="FILE",
+                        help="play the input lines of FILE ('-' for stdin) to completion")
+    parser.add_argument("--format", choices=FORMATS, default="text",
+                        help="script output: plain text or JSON lines (default: text)")
+    args = parser.parse_args(argv)
+    if args.format != "text" and args.script is None:
+        parser.error("--format requires --script")
+    return args
+
+
+def play_lines(lines: Iterable[str], format: str) -> str | None:
+    """Play the given input lines, writing output to stdout; returns the ending."""
+    io = ScriptIO(lines, sys.stdout, format)
+    state = gameloop.new_world(io)
+    try:
+        gameloop.run(io, state)
+    except EOFError:
+        pass
+    io.close(state.ending_type)
+    return state.ending_type
+
 
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run the game as the command line asks; returns the exit status, which
+    reports the ending only for scripts.
+    """
+    args = parse_args(argv)
+    if args.script is not None:
+        if args.script == "-":
+            return EXIT_CODES[play_lines(sys.stdin, args.format)]
+        try:
+            script = open(args.script, encoding="utf-8")
+        except OSError as error:
+            print(f"Cannot read script: {error}", file=sys.stderr)
+            return 2
+        with script:
+            return EXIT_CODES[play_lines(script, args.format)]
 
-def main():
-    # TODO: starting options?
-    gameloop.run()
+    try:
+        gameloop.run(ConsoleIO())
+    except (EOFError, KeyboardInterrupt):
+        print()
+    return 0
 
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
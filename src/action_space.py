@@ -0,0 +1,166 @@
+"""
+action_space.py
+
+Legal-action enumeration for AI agents.
+
+legal_actions(state) lists every input the parser accepts that makes sense
+from the hero's current position. The commands come from
+turn_context.candidate_commands(), kept only if their can_execute() passes
+against the shared TurnContext, and each is written out as the first
+template in COMMANDS that builds it, so aliases ("go to" / "go in" /
+"enter") appear once. Ponder, undo and redo, which the candidates leave
+out, are added when available. The list is sorted the same way every time
+for the same world, so an agent can address actions by index, and it is
+rebuilt only when the world version (or one of the few other inputs) has
+changed since the last query.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from functools import cache
+from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
+
+from . import inputparser
+from .commands.base_command import BaseCommand
+from .commands.turn_context import TurnContext, candidate_commands
+from .core.game_objects import world_version
+
+if TYPE_CHECKING:
+    from .core.game_world import GameState
+
+# Inputs that only mean something during the dream confrontation
+DREAM_ACTIONS = ("let go", "hold on")
+
+# The arguments a candidate command was built from, in placeholder order,
+# keyed by the factory that builds it; factories without placeholders need none
+ARGUMENTS: dict[Callable[..., object], Callable[[BaseCommand], tuple[str, ...]]] = {
+    inputparser.create_enter_room_command: lambda command: (command.room_name,),
+    inputparser.create_examine_command: lambda command: (command.object_name,),
+    inputparser.create_open_command: lambda command: (command.object_name,),
+    inputparser.create_close_command: lambda command: (command.object_name,),
+    inputparser.create_watch_tv_command: lambda command: (command.obj_name,),
+    inputparser.create_get_object_command:
+        lambda command: (command.obj_name, command.container_name),
+    inputparser.create_eat_command: lambda command: (command.food_name,),
+    inputparser.create_cancel_order_command: lambda command: (command.item_name,),
+}
+
+
+@cache
+def _templates() -> dict[type, tuple[int, str, Callable[..., object]]]:
+    """
+    For each command class the parser builds, the first COMMANDS template
+    that builds it: (position in COMMANDS, template, factory).
+    """
+    found: dict[type, tuple[int, str, Callable[..., object]]] = {}
+    for position, (template, factory) in enumerate(inputparser.COMMANDS.items()):
+        if factory is inputparser.create_ponder_command:
+            continue  # Prompts for its hours
+        placeholders = sum(1 for token in template.split() if inputparser.PatVar(token))
+        found.setdefault(type(factory(*[""] * placeholders)), (position, template, factory))
+    return found
+
+
+def _fill(template: str, args: tuple[str, ...]) -> str:
+    """Substitute arguments for a template's placeholders, in order."""
+    values = iter(args)
+    return " ".join(next(values) if inputparser.PatVar(token) else token
+                    for token in template.split())
+
+
+class ActionSpace:
+    """
+    The legal inputs for one game, cached until the world changes.
+
+    Indexable and iterable like a tuple of strings. The cache key is the
+    world version plus the state the version does not cover: the dream
+    confrontation flag, pending orders, undo/redo availability, the closet
+    door and the device's built components.
+    """
+
+    def __init__(self, state: GameState) -> None:
+        self.state = state
+        self._key: tuple[object, ...] | None = None
+        self._actions: tuple[str, ...] = ()
+        self._positions: dict[str, int] = {}
+
+    def _current_key(self) -> tuple[object, ...]:
+        state = self.state
+        queue = state.event_queue
+        history = state.command_history
+        return (world_version(), state.in_dream_confrontation,
+                (queue.orders.placed, len(queue.orders)) if queue is not None else None,
+                history.can_undo(), history.can_redo(),
+                state.apartment.closet.state,
+                tuple(state.device_state.get_built_components()))
+
+    @property
+    def actions(self) -> tuple[str, ...]:
+        """The legal inputs, rebuilt only if the world changed."""
+        key = self._current_key()
+        if key != self._key:
+            self._actions = self._enumerate()
+            self._positions = {action: i for i, action in enumerate(self._actions)}
+            self._key = key
+        return self._actions
+
+    def _enumerate(self) -> tuple[str, ...]:
+        state = self.state
+        if state.in_dream_confrontation:
+            return DREAM_ACTIONS
+
+        templates = _templates()
+        context = TurnContext(state)
+        found: list[tuple[int, tuple[str, ...], str]] = []
+        for command in candidate_commands(context):
+            if not command.can_execute(state, context):
+                continue
+            position, template, factory = templates[type(command)]
+            args = ARGUMENTS[factory](command) if factory in ARGUMENTS else ()
+            found.append((position, args, template))
+
+        # Ponder asks for its hours when played; undo/redo follow the history
+        positions = {template: i for i, template in enumerate(inputparser.COMMANDS)}
+        history = state.command_history
+        for template, available in (("ponder", True), ("undo", history.can_undo()),
+                                    ("redo", history.can_redo())):
+            if available:
+                found.append((positions[template], (), template))
+
+        # COMMANDS order, then by argument, each input once
+        return tuple(dict.fromkeys(_fill(template, args) for _, args, template in sorted(found)))
+
+    def __len__(self) -> int:
+        return len(self.actions)
+
+    def __getitem__(self, index: int) -> str:
+        return self.actions[index]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.actions)
+
+    def __contains__(self, action: object) -> bool:
+        self.actions
+        return action in self._positions
+
+    def index(self, action: str) -> int:
+        """Position of an action; raises ValueError if it is not legal."""
+        self.actions
+        if action not in self._positions:
+            raise ValueError(f"{action!r} is not a legal action")
+        return self._positions[action]
+
+
+_spaces: WeakKeyDictionary[GameState, ActionSpace] = WeakKeyDictionary()
+
+
+def legal_actions(state: GameState) -> ActionSpace:
+    """
+    The ActionSpace of a game, shared by every caller asking about it.
+    """
+    space = _spaces.get(state)
+    if space is None:
+        space = _spaces[state] = ActionSpace(state)
+    return space
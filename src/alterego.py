@@ -22,12 +22,16 @@ Phases:
 
 from __future__ import annotations
 
+from collections import Counter
 from datetime import timedelta
 from typing import TYPE_CHECKING
 
+from .core.game_objects import Container, Object
+from .core.rooms import Closet
+from .recipes import AE_PHASE_BUILDS, Recipe, apartment_items
+
 if TYPE_CHECKING:
     from .gamestate import GameState
-    from .core.game_objects import Object, Container
 
 
 class AlterEgo:
@@ -118,21 +122,7 @@ class AlterEgo:
         Creates: device-frame Object in bedroom
         Then orders: soldering-iron ($25), insulated-cable ($8), copper-coil ($18)
         """
-        from .core.game_objects import Object as GameObj
-
-        plywood = self._find_item_in_apartment(gamestate, "plywood-sheet")
-        brackets = self._find_item_in_apartment(gamestate, "metal-brackets")
-        nails = self._find_item_in_apartment(gamestate, "box-of-nails")
-        hammer = self._find_item_in_apartment(gamestate, "hammer")
-
-        if plywood and brackets and nails and hammer:
-            self._consume_item(plywood)
-            self._consume_item(brackets)
-            self._consume_item(nails)
-            # Leave hammer in bedroom
-            self._move_item_to(hammer, gamestate.apartment.bedroom)
-            GameObj("device-frame", gamestate.apartment.bedroom)
-            gamestate.device_state.build_component("device-frame")
+        self._build_phase(gamestate, 2)
 
         # Order next round of materials
         next_orders = [
@@ -152,23 +142,7 @@ class AlterEgo:
         Creates: wiring-harness Object in bedroom
         Then orders: crystal-oscillator ($35), signal-amplifier ($40), ice-cubes ($6)
         """
-        from .core.game_objects import Object as GameObj
-
-        if not gamestate.device_state.is_component_built("device-frame"):
-            # Can't build wiring without the frame
-            pass
-        else:
-            copper_wire = self._find_item_in_apartment(gamestate, "copper-wire")
-            cable = self._find_item_in_apartment(gamestate, "insulated-cable")
-            iron = self._find_item_in_apartment(gamestate, "soldering-iron")
-
-            if copper_wire and cable and iron:
-                self._consume_item(copper_wire)
-                self._consume_item(cable)
-                # Leave soldering-iron in bedroom
-                self._move_item_to(iron, gamestate.apartment.bedroom)
-                GameObj("wiring-harness", gamestate.apartment.bedroom)
-                gamestate.device_state.build_component("wiring-harness")
+        self._build_phase(gamestate, 3)
 
         # Order next round of materials
         next_orders = [
@@ -187,29 +161,7 @@ class AlterEgo:
         Focusing Array: crystal-oscillator + ice-cubes → focusing-array
         No new orders.
         """
-        from .core.game_objects import Object as GameObj
-
-        # Build power-core
-        battery = self._find_item_in_apartment(gamestate, "battery-pack")
-        coil = self._find_item_in_apartment(gamestate, "copper-coil")
-
-        if battery and coil:
-            self._consume_item(battery)
-            self._consume_item(coil)
-            GameObj("power-core", gamestate.apartment.bedroom)
-            gamestate.device_state.build_component("power-core")
-
-        # Build focusing-array
-        oscillator = self._find_item_in_apartment(
-            gamestate, "crystal-oscillator"
-        )
-        ice = self._find_item_in_apartment(gamestate, "ice-cubes")
-
-        if oscillator and ice:
-            self._consume_item(oscillator)
-            self._consume_item(ice)
-            GameObj("focusing-array", gamestate.apartment.bedroom)
-            gamestate.device_state.build_component("focusing-array")
+        self._build_phase(gamestate, 4)
 
     def _phase_activation(self, gamestate: GameState) -> None:
         """
@@ -218,20 +170,45 @@ class AlterEgo:
         Requires: signal-amplifier → convergence-device
         If device complete: set device_activated = True
         """
-        from .core.game_objects import Object as GameObj
-
-        amplifier = self._find_item_in_apartment(
-            gamestate, "signal-amplifier"
-        )
-        if amplifier:
-            self._consume_item(amplifier)
-            GameObj("convergence-device", gamestate.apartment.bedroom)
-            gamestate.device_state.build_component("convergence-device")
+        self._build_phase(gamestate, 5)
 
         # Check for full activation
         if gamestate.device_state.is_device_complete():
             gamestate.device_activated = True
 
+    def _build_phase(self, gamestate: GameState, phase: int) -> None:
+        """Build every component of a phase whose recipe can be met."""
+        for recipe in AE_PHASE_BUILDS[phase]:
+            self._build(gamestate, recipe)
+
+    def _build(self, gamestate: GameState, recipe: Recipe) -> bool:
+        """
+        Build a component in the bedroom if its recipe can be met.
+
+        Consumed items come from wherever they are found first (see
+        recipes.apartment_items); kept tools are left in the bedroom.
+
+        Returns:
+            True if the component was built
+        """
+        if not recipe.components_ready(gamestate.device_state):
+            return False
+        counts, found = apartment_items(gamestate)
+        if not recipe.has_items(counts):
+            return False
+
+        taken: Counter[str] = Counter()
+        for name in recipe.consumes:
+            self._consume_item(gamestate, found[name][taken[name]])
+            taken[name] += 1
+        bedroom = gamestate.apartment.bedroom
+        for name in recipe.tools:
+            self._move_item_to(found[name][taken[name]], bedroom)
+            taken[name] += 1
+        Object(recipe.builds, bedroom)
+        gamestate.device_state.build_component(recipe.builds)
+        return True
+
     # ------------------------------------------------------------------ #
     #                     Counter-mechanic helpers                        #
     # ------------------------------------------------------------------ #
@@ -246,8 +223,6 @@ class AlterEgo:
         Returns:
             True if the AE was trapped (turn wasted), False otherwise.
         """
-        from .core.rooms import Closet
-
         closet = gamestate.apartment.closet
         hero_room = gamestate.hero.GetRoom()
 
@@ -283,67 +258,41 @@ class AlterEgo:
     #                        Item search helpers                          #
     # ------------------------------------------------------------------ #
 
-    def _find_item_in_apartment(
-        self, gamestate: GameState, name: str
-    ) -> Object | None:
-        """
-        Recursively search all rooms and containers in the apartment
-        for a named item.
-
-        Also checks hero's inventory.
-
-        Args:
-            gamestate: The current game state
-            name: The item name to search for
-
-        Returns:
-            The Object if found, None otherwise
-        """
-        # Check hero inventory first
-        item = gamestate.hero.GetFirstItemByName(name)
-        if item:
-            return item
-
-        # Recursively search all rooms/containers in the apartment
-        return self._search_container(gamestate.apartment, name)
-
-    def _search_container(
-        self, container: Container, name: str
-    ) -> Object | None:
-        """
-        Recursively search a container and its sub-containers for an item.
-
-        Args:
-            container: The container to search
-            name: The item name to find
-
-        Returns:
-            The Object if found, None otherwise
-        """
-        from .core.game_objects import Container as ContainerClass
-
-        for item in container.contents:
-            if item.name == name:
-                return item
-            # Recurse into sub-containers
-            if isinstance(item, ContainerClass):
-                found = self._search_container(item, name)
-                if found:
-                    return found
-        return None
-
-    def _consume_item(self, item: Object) -> None:
+    def _consume_item(self, gamestate: GameState, item: Object) -> None:
         """
         Remove an item from its parent container (simulating the AE
         picking it up and using it as construction material).
 
         Args:
+            gamestate: The current game state
             item: The item to consume/remove
         """
         if item.parent is not None and hasattr(item.parent, 'contents'):
             if item in item.parent.contents:
                 item.parent.contents.remove(item)
         item.parent = None
+        self._use_order(gamestate, item.name)
+
+    def _use_order(self, gamestate: GameState, name: str) -> None:
+        """
+        Drop one delivered AE order of an item from orders_placed.
+
+        The pending-orders index says how many of the AE's orders of the
+        item are still on the way; those stay in orders_placed, so using
+        up an item the hero bought never drops an order yet to arrive.
+
+        Args:
+            gamestate: The current game state
+            name: The item that was used up
+        """
+        placed = self.orders_placed.count(name)
+        if not placed:
+            return
+        on_the_way = 0
+        if gamestate.event_queue is not None:
+            on_the_way = len(gamestate.event_queue.orders.expected(name, placed_by="alter-ego"))
+        if placed > on_the_way:
+            self.orders_placed.remove(name)
 
     def _move_item_to(self, item: Object, target: Container) -> None:
         """
@@ -385,15 +334,10 @@ class AlterEgo:
         self.orders_placed.append(item_name)
 
         # Schedule delivery to toolbox in 1 day
-        from .core.game_objects import Object as GameObj
-        from datetime import datetime
-
         delivery_time = gamestate.watch.curr_time + timedelta(days=1)
 
-        def deliver(_curr_time: datetime, _event_time: datetime) -> None:
-            GameObj(item_name, gamestate.apartment.main.toolbox)
-
         if gamestate.event_queue is not None:
-            gamestate.event_queue.AddEvent(deliver, delivery_time)
+            gamestate.event_queue.AddDelivery(gamestate.apartment.main.toolbox, item_name,
+                                              delivery_time, cost=cost, placed_by="alter-ego")
 
         return True
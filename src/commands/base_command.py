@@ -4,13 +4,26 @@ Abstract Command interface for the Command Pattern implementation.
 This module provides the foundation for converting action functions into 
 Command objects, enabling features like undo/redo, action replay, macros,
 and AI agent compatibility.
+
+A command's preconditions and its execution usually need the same objects
+(the container to take from, the hammer to use). resolve() looks them up
+once and bindings() keeps the result until the world changes, so
+can_execute() and execute() share one set of lookups however many times
+invokers and macros re-check a command.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
+
+from ..core.game_objects import world_version
+from ..lazy import lazy_module
+
+# turn_context imports this module for BaseCommand
+turn_context = lazy_module(".turn_context", __package__)
 
 if TYPE_CHECKING:
     from src.core.game_world import GameState
+    from .turn_context import TurnContext
 
 
 class CommandResult:
@@ -58,6 +71,9 @@ class BaseCommand(ABC):
         self.description = description
         self._executed = False
         self._undo_data: Optional[Dict[str, Any]] = None
+        # ((game id, world version), bindings), replaced as one so shared
+        # commands never pair one game's key with another's objects
+        self._bound: Tuple[Optional[Tuple[int, int]], Dict[str, Any]] = (None, {})
     
     @abstractmethod
     def execute(self, game_state: "GameState") -> CommandResult:
@@ -72,18 +88,80 @@ class BaseCommand(ABC):
         """
         pass
     
-    def can_execute(self, game_state: "GameState") -> bool:
+    async def execute_async(self, game_state: "GameState") -> CommandResult:
+        """
+        Execute the command from an asyncio task.
+        
+        Commands that prompt the player override this to await their
+        prompts through the session's AsyncIOInterface instead of blocking.
+        The default runs execute(), which is fine for commands that never
+        prompt.
+        
+        Args:
+            game_state: Current game state to operate on
+            
+        Returns:
+            CommandResult indicating success/failure and any output
+        """
+        return self.execute(game_state)
+    
+    def can_execute(self, game_state: "GameState",
+                    context: Optional["TurnContext"] = None) -> bool:
         """
         Check if the command can be executed in the current game state.
         
         Args:
             game_state: Current game state to check against
+            context: Lookups shared by every check made this turn; built
+                on demand when omitted
             
         Returns:
             True if the command can be executed, False otherwise
         """
         return True
     
+    def resolve(self, game_state: "GameState",
+                context: "TurnContext") -> Dict[str, Any]:
+        """
+        Look up the objects this command acts on.
+        
+        Subclasses override this to find what both can_execute() and
+        execute() need. Only lookups in the object tree belong here
+        (containment and open/closed state), since the result is reused
+        until the world version changes; flags such as the device's
+        components must still be checked where they are used.
+        
+        Args:
+            game_state: Current game state to look things up in
+            context: Lookups shared by every check made this turn
+            
+        Returns:
+            The resolved objects by name; missing ones map to None
+        """
+        return {}
+    
+    def bindings(self, game_state: "GameState",
+                 context: Optional["TurnContext"] = None) -> Dict[str, Any]:
+        """
+        The objects resolve() found, resolving again only if the world
+        has changed since the last call.
+        
+        Args:
+            game_state: Current game state
+            context: Lookups shared by every check made this turn; built
+                on demand when omitted
+            
+        Returns:
+            The resolved objects by name
+        """
+        key = (id(game_state), world_version())
+        bound_key, bound = self._bound
+        if bound_key != key:
+            context = context or turn_context.TurnContext(game_state)
+            bound = self.resolve(game_state, context)
+            self._bound = (key, bound)
+        return bound
+    
     def undo(self, game_state: "GameState") -> CommandResult:
         """
         Undo the effects of this command.
@@ -211,17 +289,19 @@ class MacroCommand(BaseCommand):
             time_advanced=any(r.time_advanced for r in results)
         )
     
-    def can_execute(self, game_state: "GameState") -> bool:
+    def can_execute(self, game_state: "GameState",
+                    context: Optional["TurnContext"] = None) -> bool:
         """
         Check if all commands in the macro can be executed.
         
         Args:
             game_state: Current game state to check against
+            context: Lookups shared by every check made this turn
             
         Returns:
             True if all commands can be executed, False otherwise
         """
-        return all(cmd.can_execute(game_state) for cmd in self.commands)
+        return all(cmd.can_execute(game_state, context) for cmd in self.commands)
     
     def undo(self, game_state: "GameState") -> CommandResult:
         """
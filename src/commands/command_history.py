@@ -13,6 +13,7 @@ from .base_command import BaseCommand, CommandResult
 
 if TYPE_CHECKING:
     from ..core.game_world import GameState
+    from .turn_context import TurnContext
 
 
 class CommandHistory:
@@ -345,7 +346,8 @@ class UndoCommand(BaseCommand):
         super().__init__("Undo last command")
         self.history = history
     
-    def can_execute(self, game_state: "GameState") -> bool:
+    def can_execute(self, game_state: "GameState",
+                    context: Optional["TurnContext"] = None) -> bool:
         """Check if undo is possible."""
         return self.history.can_undo()
     
@@ -373,7 +375,8 @@ class RedoCommand(BaseCommand):
         super().__init__("Redo last undone command")
         self.history = history
     
-    def can_execute(self, game_state: "GameState") -> bool:
+    def can_execute(self, game_state: "GameState",
+                    context: Optional["TurnContext"] = None) -> bool:
         """Check if redo is possible."""
         return self.history.can_redo()
     
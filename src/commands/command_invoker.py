@@ -6,15 +6,25 @@ The CommandInvoker is responsible for:
 - Managing command queues
 - Coordinating with command history
 - Providing a clean interface for command execution
+- Serializing commands submitted to one shared world from several threads
+  or asyncio tasks (SerializedCommandInvoker)
 """
 
 from __future__ import annotations
+import threading
+import time
 from typing import TYPE_CHECKING, List, Optional
-from queue import Queue
+from queue import Empty, Full, Queue
 
 from .base_command import BaseCommand, CommandResult
+from ..lazy import lazy_module
+
+# Only needed by the concurrent invokers; kept off the start-up path
+asyncio = lazy_module("asyncio")
+futures = lazy_module("concurrent.futures")
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
     from ..core.game_world import GameState
     from .command_history import CommandHistory
 
@@ -276,4 +286,234 @@ class BatchCommandInvoker(CommandInvoker):
                     command.undo(game_state)
                 except Exception:
                     # Log error but continue with rollback
-                    pass
\ No newline at end of file
+                    pass
+
+
+class AsyncCommandInvoker(CommandInvoker):
+    """
+    Command invoker for sessions driven by an asyncio event loop.
+    
+    Commands run through their execute_async(), so a command waiting on the
+    player (a phone call) parks its coroutine instead of blocking a thread,
+    and one event loop can interleave many sessions. The session's game
+    state must be bound to an AsyncIOInterface.
+    """
+    
+    async def execute_command_async(self, command: BaseCommand,
+                                    game_state: "GameState") -> CommandResult:
+        """
+        Execute a single command, awaiting any prompts it makes.
+        
+        Args:
+            command: The command to execute
+            game_state: Current game state
+            
+        Returns:
+            CommandResult indicating success/failure and any output
+        """
+        try:
+            result = await command.execute_async(game_state)
+            
+            if result.success and self.history and command.executed:
+                self.history.add_command(command)
+            
+            return result
+            
+        except Exception as e:
+            return CommandResult(
+                success=False,
+                message=f"Command execution failed: {str(e)}"
+            )
+    
+    async def execute_command_sequence_async(self, commands: List[BaseCommand],
+                                             game_state: "GameState") -> List[CommandResult]:
+        """
+        Execute a sequence of commands, stopping on first failure.
+        
+        Args:
+            commands: List of commands to execute in order
+            game_state: Current game state
+            
+        Returns:
+            List of CommandResults for each command that was attempted
+        """
+        results = []
+        
+        for command in commands:
+            result = await self.execute_command_async(command, game_state)
+            results.append(result)
+            
+            if not result.success:
+                break
+        
+        return results
+
+
+class SerializedCommandInvoker(CommandInvoker):
+    """
+    Command invoker for a world shared by several agents.
+
+    Commands submitted from any thread or asyncio task are executed one at
+    a time, in submission order, by a single worker thread that owns the
+    game state (an actor). Each submission returns a Future for its
+    CommandResult. The submission queue is bounded: when it is full,
+    submit() blocks (or times out), so a fast agent cannot run arbitrarily
+    far ahead of the world.
+
+    execute_command() can still be called directly; it takes the same
+    session lock the worker holds while executing, so direct calls and
+    submitted commands never interleave. Hold session_lock yourself to
+    make several steps atomic with respect to the other agents.
+
+    The plain CommandInvoker keeps the lock-free single-threaded path.
+    """
+
+    _STOP = object()
+
+    def __init__(self, game_state: "GameState", history: Optional["CommandHistory"] = None,
+                 max_pending: int = 64):
+        """
+        Initialize the invoker and start its worker thread.
+
+        Args:
+            game_state: The shared game state commands are executed against
+            history: Optional command history manager for undo/redo functionality
+            max_pending: Most submitted commands that may wait to execute
+        """
+        super().__init__(history)
+        self.game_state = game_state
+        self.session_lock = threading.RLock()
+        # The bound is enforced by submit(), so close() can always queue _STOP
+        self._submissions: Queue[tuple[BaseCommand, Future[CommandResult]] | object] = Queue()
+        self._max_pending = max_pending
+        # Guards _closed and queueing; notified whenever room frees up or on close
+        self._room = threading.Condition()
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name="command-invoker", daemon=True)
+        self._worker.start()
+
+    def execute_command(self, command: BaseCommand, game_state: "GameState") -> CommandResult:
+        """
+        Execute a single command immediately, under the session lock.
+
+        Args:
+            command: The command to execute
+            game_state: Current game state
+
+        Returns:
+            CommandResult indicating success/failure and any output
+        """
+        with self.session_lock:
+            return super().execute_command(command, game_state)
+
+    def submit(self, command: BaseCommand,
+               timeout: Optional[float] = None) -> Future[CommandResult]:
+        """
+        Queue a command for execution against the shared world.
+
+        Args:
+            command: The command to execute
+            timeout: Seconds to wait for room in a full queue (None waits forever)
+
+        Returns:
+            A Future resolving to the command's CommandResult
+
+        Raises:
+            queue.Full: If the queue stayed full for timeout seconds
+            RuntimeError: If the invoker has been closed
+        """
+        future: Future[CommandResult] = futures.Future()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._room:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Invoker is closed")
+                if self._submissions.qsize() < self._max_pending:
+                    self._submissions.put_nowait((command, future))
+                    return future
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise Full
+                self._room.wait(remaining)
+
+    async def submit_async(self, command: BaseCommand) -> CommandResult:
+        """
+        Submit a command from an asyncio task and await its result.
+
+        Waiting for room in a full queue happens off the event loop.
+        """
+        try:
+            future = self.submit(command, timeout=0)
+        except Full:
+            loop = asyncio.get_running_loop()
+            future = await loop.run_in_executor(None, self.submit, command)
+        return await asyncio.wrap_future(future)
+
+    def pending(self) -> int:
+        """
+        Get the number of submitted commands waiting to execute.
+
+        Returns:
+            Number of commands in the submission queue
+        """
+        return self._submissions.qsize()
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Stop accepting commands and shut the worker down.
+
+        Commands already submitted still execute; submissions waiting for
+        room in a full queue fail with RuntimeError. Never blocks unless
+        wait is set.
+
+        Args:
+            wait: Block until the worker has finished
+        """
+        with self._room:
+            if not self._closed:
+                self._closed = True
+                self._submissions.put_nowait(self._STOP)
+                self._room.notify_all()
+        if wait:
+            self._worker.join()
+
+    def _fail_queued(self) -> None:
+        """Fail the futures of any submissions left behind the stop marker."""
+        while True:
+            try:
+                item = self._submissions.get_nowait()
+            except Empty:
+                return
+            if item is not self._STOP:
+                _, future = item
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(RuntimeError("Invoker is closed"))
+
+    def __enter__(self) -> "SerializedCommandInvoker":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        """Worker loop: execute submissions in order until closed."""
+        while True:
+            item = self._submissions.get()
+            with self._room:
+                self._room.notify_all()
+            if item is self._STOP:
+                self._fail_queued()
+                return
+            command, future = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            with self.session_lock:
+                self._is_executing = True
+                try:
+                    result = super().execute_command(command, self.game_state)
+                except BaseException as error:
+                    future.set_exception(error)
+                else:
+                    future.set_result(result)
+                finally:
+                    self._is_executing = False
@@ -7,14 +7,57 @@ enabling undo/redo, action replay, macros, and AI compatibility.
 
 from __future__ import annotations
 from datetime import timedelta
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Dict, Optional, Type, TypeVar
 
 from .base_command import BaseCommand, CommandResult
+from ..core.game_objects import Container, Object, Openable
+from ..core.items import Food
+from ..core.rooms import Closet, Room
+from ..endings import GameEndings
+from ..io_interface import run_dialogue_async
+from ..recipes import RECIPES, Recipe
+from .turn_context import TurnContext
 
 if TYPE_CHECKING:
     from ..core.game_world import GameState
-    from ..core.game_objects import Object
-    from ..core.rooms import Room
+
+C = TypeVar("C", bound=BaseCommand)
+
+_shared_commands: Dict[type, BaseCommand] = {}
+
+
+def shared_command(command_class: Type[C]) -> C:
+    """
+    The one shared instance of a command that takes no arguments.
+    
+    Only for commands that keep nothing between runs that matters: they
+    cannot be undone, so history never holds them, and their bindings are
+    keyed by game. Undoable commands need a fresh instance per run.
+    """
+    command = _shared_commands.get(command_class)
+    if command is None:
+        command = _shared_commands.setdefault(command_class, command_class())
+    return command
+
+
+def _tear_down(game_state: "GameState", recipe: Recipe) -> None:
+    """Remove a recipe's component from the bedroom and spend its costs."""
+    bedroom = game_state.apartment.bedroom
+    component = bedroom.GetFirstItemByName(recipe.removes)
+    if component:
+        bedroom.contents.remove(component)
+    game_state.device_state.remove_component(recipe.removes)
+    recipe.charge(game_state)
+
+
+def _resolve_recipe(recipe: Recipe, context: TurnContext) -> dict:
+    """
+    Bindings for a hero recipe: the hero's room, the item names missing
+    from their inventory and, when nothing is missing, the items consumed.
+    """
+    missing = recipe.missing_items(context.inventory_counts)
+    consumed = [] if missing else [context.inventory[name] for name in recipe.consumes]
+    return {"room": context.room, "missing": missing, "consumed": consumed}
 
 
 # Movement Commands
@@ -26,19 +69,18 @@ class EnterRoomCommand(BaseCommand):
         self.room_name = room_name
         self.previous_room = None
     
-    def can_execute(self, game_state: "GameState") -> bool:
+    def resolve(self, game_state: "GameState", context: TurnContext) -> dict:
+        """Find the room to enter."""
+        return {"room": context.rooms.get(self.room_name)}
+    
+    def can_execute(self, game_state: "GameState",
+                    context: Optional[TurnContext] = None) -> bool:
         """Check if the room exists and is accessible."""
-        from ..core.rooms import Room
-        
-        to_room = game_state.apartment.GetFirstItemByName(self.room_name)
-        return to_room and isinstance(to_room, Room)
+        return isinstance(self.bindings(game_state, context)["room"], Room)
     
     def execute(self, game_state: "GameState") -> CommandResult:
         """Execute the room transition."""
-        from ..core.rooms import Room
-        from ..game_actions.action_decorators import attempt
-        
-        to_room = game_state.apartment.GetFirstItemByName(self.room_name)
+        to_room = self.bindings(game_state)["room"]
         if not to_room or not isinstance(to_room, Room):
             return CommandResult(
                 success=False, 
@@ -104,6 +146,13 @@ class EnterRoomCommand(BaseCommand):
 class NailSelfInCommand(BaseCommand):
     """Command to nail yourself into the closet."""
     
+    # What to suggest for each missing item, in the order suggested
+    MISSING_HINTS = {
+        "plywood-sheet": "Perhaps some wood?",
+        "hammer": "Perhaps a hammer?",
+        "box-of-nails": "Perhaps some nails?",
+    }
+    
     def __init__(self):
         super().__init__("Nail self into closet")
         self.items_consumed = []
@@ -111,31 +160,25 @@ class NailSelfInCommand(BaseCommand):
         self.previous_feel = None
         self.time_advanced = None
     
-    def can_execute(self, game_state: "GameState") -> bool:
+    def resolve(self, game_state: "GameState", context: TurnContext) -> dict:
+        """Find the hero's room and the wood and nails to use up."""
+        return _resolve_recipe(RECIPES["nail-self-in"], context)
+    
+    def can_execute(self, game_state: "GameState",
+                    context: Optional[TurnContext] = None) -> bool:
         """Check if hero is in closet with required items."""
-        from ..core.rooms import Closet
-        
-        closet = game_state.apartment.closet
-        if game_state.hero.GetRoom() != closet:
-            return False
-        
-        if closet.state == Closet.State.NAILED:
+        if game_state.apartment.closet.state == Closet.State.NAILED:
             return False
-        
-        hero = game_state.hero
-        hammer = hero.GetFirstItemByName('hammer')
-        nails = hero.GetFirstItemByName('box-of-nails')
-        plywood = hero.GetFirstItemByName('plywood-sheet')
-        
-        return bool(hammer and nails and plywood)
+        bound = self.bindings(game_state, context)
+        return RECIPES["nail-self-in"].in_place(bound["room"].name) and not bound["missing"]
     
     def execute(self, game_state: "GameState") -> CommandResult:
         """Execute the nailing action."""
-        from ..core.rooms import Closet
-        
         closet = game_state.apartment.closet
+        recipe = RECIPES["nail-self-in"]
+        bound = self.bindings(game_state)
         
-        if game_state.hero.GetRoom() != closet:
+        if bound["room"] != closet:
             return CommandResult(
                 success=False,
                 message="Gotta be in the closet to start nailing!"
@@ -155,39 +198,28 @@ class NailSelfInCommand(BaseCommand):
                 message="You have no objects with which to do that"
             )
         
-        hammer = hero.GetFirstItemByName('hammer')
-        nails = hero.GetFirstItemByName('box-of-nails')
-        plywood = hero.GetFirstItemByName('plywood-sheet')
-        
-        if not hammer or not nails or not plywood:
-            missing_items = []
-            if not plywood:
-                missing_items.append("Perhaps some wood?")
-            if not hammer:
-                missing_items.append("Perhaps a hammer?")
-            if not nails:
-                missing_items.append("Perhaps some nails?")
-            
+        missing = bound["missing"]
+        if missing:
+            hints = [hint for name, hint in self.MISSING_HINTS.items() if name in missing]
             return CommandResult(
                 success=False,
-                message=f"You are missing something. {' '.join(missing_items)}"
+                message=f"You are missing something. {' '.join(hints)}"
             )
         
+        consumed = bound["consumed"]
+        
         # Store undo data
         self.store_undo_data({
-            "items_consumed": [nails.name, plywood.name],
+            "items_consumed": [item.name for item in consumed],
             "previous_closet_state": closet.state,
             "previous_feel": hero.feel,
             "previous_time": game_state.watch.curr_time
         })
         
         # Execute the action
-        hero.Destroy([plywood, nails])
+        hero.Destroy(consumed)
         closet.state = Closet.State.NAILED
-        
-        num_hours = 2
-        game_state.watch.curr_time += timedelta(hours=num_hours)
-        hero.feel -= 10 * num_hours
+        recipe.charge(game_state)
         
         self.mark_executed()
         return CommandResult(
@@ -237,16 +269,18 @@ class ExamineThingCommand(BaseCommand):
         super().__init__(f"Examine {object_name}")
         self.object_name = object_name
     
-    def can_execute(self, game_state: "GameState") -> bool:
+    def resolve(self, game_state: "GameState", context: TurnContext) -> dict:
+        """Find the object in the current room."""
+        return {"target": context.room_items.get(self.object_name)}
+    
+    def can_execute(self, game_state: "GameState",
+                    context: Optional[TurnContext] = None) -> bool:
         """Check if the object exists in the current room."""
-        room_object = game_state.hero.GetRoom().GetFirstItemByName(self.object_name)
-        return room_object is not None
+        return self.bindings(game_state, context)["target"] is not None
     
     def execute(self, game_state: "GameState") -> CommandResult:
         """Execute the examine action."""
-        from ..game_actions.action_decorators import attempt
-        
-        room_object = game_state.hero.GetRoom().GetFirstItemByName(self.object_name)
+        room_object = self.bindings(game_state)["target"]
         if not room_object:
             return CommandResult(
                 success=False,
@@ -272,18 +306,18 @@ class OpenThingCommand(BaseCommand):
         self.object_name = object_name
         self.previous_state = None
     
-    def can_execute(self, game_state: "GameState") -> bool:
+    def resolve(self, game_state: "GameState", context: TurnContext) -> dict:
+        """Find the object in the current room."""
+        return {"target": context.room_items.get(self.object_name)}
+    
+    def can_execute(self, game_state: "GameState",
+                    context: Optional[TurnContext] = None) -> bool:
         """Check if the object exists and can be opened."""
-        from ..core.game_objects import Openable
-        
-        room_object = game_state.hero.GetRoom().GetFirstItemByName(self.object_name)
-        return room_object and isinstance(room_object, Openable)
+        return isinstance(self.bindings(game_state, context)["target"], Openable)
     
     def execute(self, game_state: "GameState") -> CommandResult:
         """Execute the open action."""
-        from ..core.game_objects import Openable
-        
-        room_object = game_state.hero.GetRoom().GetFirstItemByName(self.object_name)
+        room_object = self.bindings(game_state)["target"]
         if not room_object:
             return CommandResult(
                 success=False,
@@ -315,8 +349,6 @@ class OpenThingCommand(BaseCommand):
     
     def undo(self, game_state: "GameState") -> CommandResult:
         """Undo by closing the container."""
-        from ..core.game_objects import Openable
-        
         room_object = game_state.hero.GetRoom().GetFirstItemByName(self.object_name)
         if not room_object or not isinstance(room_object, Openable):
             return CommandResult(
@@ -342,18 +374,18 @@ class CloseThingCommand(BaseCommand):
         self.object_name = object_name
         self.previous_state = None
     
-    def can_execute(self, game_state: "GameState") -> bool:
+    def resolve(self, game_state: "GameState", context: TurnContext) -> dict:
+        """Find the object in the current room."""
+        return {"target": context.room_items.get(self.object_name)}
+    
+    def can_execute(self, game_state: "GameState",
+                    context: Optional[TurnContext] = None) -> bool:
         """Check if the object exists and can be closed."""
-        from ..core.game_objects import Openable
-        
-        room_object = game_state.hero.GetRoom().GetFirstItemByName(self.object_name)
-        return room_object and isinstance(room_object, Openable)
+        return isinstance(self.bindings(game_state, context)["target"], Openable)
     
     def execute(self, game_state: "GameState") -> CommandResult:
         """Execute the close action."""
-        from ..core.game_objects import Openable
-        
-        room_object = game_state.hero.GetRoom().GetFirstItemByName(self.object_name)
+        room_object = self.bindings(game_state)["target"]
         if not room_object:
             return CommandResult(
                 success=False,
@@ -385,8 +417,6 @@ class CloseThingCommand(BaseCommand):
     
     def undo(self, game_state: "GameState") -> CommandResult:
         """Undo by opening the container."""
-        from ..core.game_objects import Openable
-        
         room_object = game_state.hero.GetRoom().GetFirstItemByName(self.object_name)
         if not room_object or not isinstance(room_object, Openable):
             return CommandResult(
@@ -414,90 +444,68 @@ class GetObjectCommand(BaseCommand):
         self.retrieved_object = None
         self.original_container = None
     
-    def can_execute(self, game_state: "GameState") -> bool:
+    def resolve(self, game_state: "GameState", context: TurnContext) -> dict:
+        """Find the container in the room and the object inside it."""
+        container = context.room_items.get(self.container_name)
+        item = None
+        if isinstance(container, Container):
+            item = context.items_in(container).get(self.obj_name)
+        return {"container": container, "item": item}
+    
+    def can_execute(self, game_state: "GameState",
+                    context: Optional[TurnContext] = None) -> bool:
         """Check if the container and object exist."""
-        from ..core.game_objects import Container, Openable
-        
-        room_obj = game_state.hero.GetRoom().GetFirstItemByName(self.container_name)
-        if not room_obj or not isinstance(room_obj, Container):
-            return False
-        
+        bound = self.bindings(game_state, context)
+        room_obj = bound["container"]
         if isinstance(room_obj, Openable) and room_obj.state != Openable.State.OPEN:
             return False
         
-        thing = room_obj.GetFirstItemByName(self.obj_name)
-        return thing is not None
+        return bound["item"] is not None
     
     def execute(self, game_state: "GameState") -> CommandResult:
         """Execute the pickup action."""
-        from ..core.game_objects import Container, Openable
-        from ..game_actions.action_decorators import attempt
-        
-        room_obj = game_state.hero.GetRoom().GetFirstItemByName(self.container_name)
+        bound = self.bindings(game_state)
+        room_obj = bound["container"]
         if not room_obj:
             return CommandResult(
                 success=False,
                 message="I don't see that in the room."
             )
         
-        if isinstance(room_obj, Openable):
-            if room_obj.state != Openable.State.OPEN:
-                return CommandResult(
-                    success=False,
-                    message="Try opening it first."
-                )
-            
-            thing = room_obj.GetFirstItemByName(self.obj_name)
-            if thing:
-                # Store undo data
-                self.store_undo_data({
-                    "retrieved_object": thing,
-                    "original_container": room_obj
-                })
-                
-                try:
-                    game_state.hero.Pickup(thing)
-                    self.mark_executed()
-                    return CommandResult(success=True)  # Hero.Pickup handles output directly
-                except Exception as e:
-                    return CommandResult(
-                        success=False,
-                        message=str(e) if str(e) else "Cannot pick up that item"
-                    )
-            else:
-                return CommandResult(
-                    success=False,
-                    message=f"I don't see that in the {room_obj.name}."
-                )
+        if not isinstance(room_obj, Container):
+            return CommandResult(
+                success=False,
+                message="I can't get anything from that."
+            )
         
-        elif isinstance(room_obj, Container):
-            thing = room_obj.GetFirstItemByName(self.obj_name)
-            if thing:
-                # Store undo data
-                self.store_undo_data({
-                    "retrieved_object": thing,
-                    "original_container": room_obj
-                })
-                
-                try:
-                    game_state.hero.Pickup(thing)
-                    self.mark_executed()
-                    return CommandResult(success=True)  # Hero.Pickup handles output directly
-                except Exception as e:
-                    return CommandResult(
-                        success=False,
-                        message=str(e) if str(e) else "Cannot pick up that item"
-                    )
-            else:
-                return CommandResult(
-                    success=False,
-                    message=f"I don't see that in the {room_obj.name}."
-                )
+        if isinstance(room_obj, Openable) and room_obj.state != Openable.State.OPEN:
+            return CommandResult(
+                success=False,
+                message="Try opening it first."
+            )
         
-        return CommandResult(
-            success=False,
-            message="I can't get anything from that."
-        )
+        thing = bound["item"]
+        if not thing:
+            return CommandResult(
+                success=False,
+                message=f"I don't see that in the {room_obj.name}."
+            )
+        
+        # Store undo data
+        self.store_undo_data({
+            "retrieved_object": thing,
+            "original_container": room_obj
+        })
+        
+        try:
+            game_state.hero.Pickup(thing)
+            self.mark_executed()
+            return CommandResult(success=True)  # Hero.Pickup handles output directly
+        except Exception as e:
+            return CommandResult(
+                success=False,
+                message=str(e) if str(e) else "Cannot pick up that item"
+            )
     
     def can_undo(self) -> bool:
         """Pickup can be undone by returning the object."""
@@ -679,9 +687,6 @@ class DebugItemsCommand(BaseCommand):
     
     def execute(self, game_state: "GameState") -> CommandResult:
         """Give debug items to the player."""
-        from ..core.game_objects import Object
-        from ..core.items import Food
-        
         # Create debug items
         hammer = Object("hammer", None)
         hammer.weight = 15
@@ -724,15 +729,14 @@ class CallPhoneCommand(BaseCommand):
     def __init__(self):
         super().__init__("Make a phone call")
     
-    def can_execute(self, game_state: "GameState") -> bool:
+    def can_execute(self, game_state: "GameState",
+                    context: Optional[TurnContext] = None) -> bool:
         """Check if hero is near the phone."""
-        phone = game_state.apartment.main.phone
-        return game_state.hero.GetRoom() == phone.GetRoom()
+        context = context or TurnContext(game_state)
+        return context.in_room(game_state.apartment.main)
     
     def execute(self, game_state: "GameState") -> CommandResult:
         """Execute the phone call."""
-        from ..game_actions.action_decorators import attempt
-        
         phone = game_state.apartment.main.phone
         if game_state.hero.GetRoom() != phone.GetRoom():
             return CommandResult(
@@ -749,6 +753,25 @@ class CallPhoneCommand(BaseCommand):
                 success=False,
                 message="I can't call."
             )
+    
+    async def execute_async(self, game_state: "GameState") -> CommandResult:
+        """Execute the phone call, awaiting each prompt."""
+        phone = game_state.apartment.main.phone
+        if game_state.hero.GetRoom() != phone.GetRoom():
+            return CommandResult(
+                success=False,
+                message="I need to get close to the phone first."
+            )
+        
+        try:
+            await run_dialogue_async(phone.Dialogue(game_state.hero), game_state.io)
+            self.mark_executed()
+            return CommandResult(success=True)
+        except Exception:
+            return CommandResult(
+                success=False,
+                message="I can't call."
+            )
 
 
 class EatThingCommand(BaseCommand):
@@ -759,25 +782,18 @@ class EatThingCommand(BaseCommand):
         self.food_name = food_name
         self.previous_feel = None
     
-    def can_execute(self, game_state: "GameState") -> bool:
+    def can_execute(self, game_state: "GameState",
+                    context: Optional[TurnContext] = None) -> bool:
         """Check if the food exists and can be eaten."""
-        from ..core.items import Food
-        
-        # Check if food is in hero's inventory or in an open fridge
-        food_item = game_state.hero.GetFirstItemByName(self.food_name)
-        if not food_item:
-            # Check fridge
-            fridge = game_state.apartment.main.fridge
-            if hasattr(fridge, 'state') and fridge.state == fridge.State.OPEN:
-                food_item = fridge.GetFirstItemByName(self.food_name)
-        
-        return food_item and isinstance(food_item, Food)
+        context = context or TurnContext(game_state)
+        # Food is eaten from the open fridge, standing next to it
+        fridge = game_state.apartment.main.fridge
+        if fridge.parent is not context.room or fridge.isClosed():
+            return False
+        return isinstance(context.items_in(fridge).get(self.food_name), Food)
     
     def execute(self, game_state: "GameState") -> CommandResult:
         """Execute the eating action."""
-        from ..core.items import Food
-        from ..game_actions.action_decorators import attempt
-        
         fridge = game_state.apartment.main.fridge
         if game_state.hero.GetRoom() != fridge.GetRoom():
             return CommandResult(
@@ -822,10 +838,11 @@ class WatchTvCommand(BaseCommand):
     def __init__(self):
         super().__init__("Watch TV")
     
-    def can_execute(self, game_state: "GameState") -> bool:
+    def can_execute(self, game_state: "GameState",
+                    context: Optional[TurnContext] = None) -> bool:
         """Check if TV is accessible."""
-        tv = game_state.apartment.main.tv
-        return game_state.hero.GetRoom() == tv.GetRoom()
+        context = context or TurnContext(game_state)
+        return context.in_room(game_state.apartment.main)
     
     def execute(self, game_state: "GameState") -> CommandResult:
         """Execute watching TV."""
@@ -847,6 +864,23 @@ class WatchTvCommand(BaseCommand):
             )
 
 
+class WatchObjectCommand(BaseCommand):
+    """Command to watch something; only the TV can be watched."""
+    
+    def __init__(self, obj_name: str):
+        super().__init__(f"Watch {obj_name}")
+        self.obj_name = obj_name
+    
+    def execute(self, game_state: "GameState") -> CommandResult:
+        """Watch TV, or explain that nothing else is worth watching."""
+        if self.obj_name.lower() != 'tv':
+            return CommandResult(
+                success=False,
+                message="I don't know how to watch that!  Not for very long, at least."
+            )
+        return shared_command(WatchTvCommand).execute(game_state)
+
+
 class MailCheckCommand(BaseCommand):
     """Command to mail a government check."""
     
@@ -854,10 +888,13 @@ class MailCheckCommand(BaseCommand):
         super().__init__("Mail government check")
         self.check = None
     
+    def can_execute(self, game_state: "GameState",
+                    context: Optional[TurnContext] = None) -> bool:
+        """Check if the hero is holding a check."""
+        return "check" in (context or TurnContext(game_state)).inventory
+    
     def execute(self, game_state: "GameState") -> CommandResult:
         """Execute mailing a check for money."""
-        from datetime import timedelta
-        
         check = game_state.hero.GetFirstItemByName("check")
         if check:
             # Store undo data
@@ -900,6 +937,56 @@ class MailCheckCommand(BaseCommand):
         return CommandResult(success=True, message="Undid check mailing")
 
 
+class CheckOrdersCommand(BaseCommand):
+    """Command to list the hero's deliveries that have not arrived yet."""
+    
+    def __init__(self):
+        super().__init__("Check orders")
+    
+    def execute(self, game_state: "GameState") -> CommandResult:
+        """Display pending orders, soonest first."""
+        queue = game_state.event_queue
+        orders = queue.orders.expected(placed_by="hero") if queue is not None else []
+        self.mark_executed()
+        if not orders:
+            return CommandResult(success=True, message="Nothing on order.")
+        
+        hero = game_state.hero
+        hero.io.output("Expected deliveries:")
+        for order in orders:
+            hero.io.output(f"     {order.name} - {order.due.strftime('%A at %I:%M %p')}")
+        hero.io.output("")
+        return CommandResult(success=True)
+
+
+class CancelOrderCommand(BaseCommand):
+    """Command to cancel the most recent pending order of an item."""
+    
+    def __init__(self, item_name: str):
+        super().__init__(f"Cancel order of {item_name}")
+        self.item_name = item_name
+    
+    def execute(self, game_state: "GameState") -> CommandResult:
+        """Cancel the order and refund what was paid."""
+        queue = game_state.event_queue
+        orders = (queue.orders.expected(self.item_name, placed_by="hero")
+                  if queue is not None else [])
+        if not orders:
+            return CommandResult(
+                success=False,
+                message=f"You don't have any {self.item_name} on order."
+            )
+        
+        order = max(orders, key=lambda order: order.sequence)
+        order.cancel()
+        game_state.hero.curr_balance += order.cost
+        self.mark_executed()
+        return CommandResult(
+            success=True,
+            message=f"Cancelled the {self.item_name}. ${order.cost} refunded."
+        )
+
+
 class RolodexCommand(BaseCommand):
     """Command to show available phone numbers."""
     
@@ -963,27 +1050,29 @@ class TakeIceBathCommand(BaseCommand):
         self.previous_time = None
         self.ice_cubes = None
     
-    def can_execute(self, game_state: "GameState") -> bool:
+    def resolve(self, game_state: "GameState", context: TurnContext) -> dict:
+        """Find the hero's room and their ice cubes."""
+        return {"room": context.room, "ice_cubes": context.inventory.get("ice-cubes")}
+    
+    def can_execute(self, game_state: "GameState",
+                    context: Optional[TurnContext] = None) -> bool:
         """Check if hero is in bathroom with ice cubes."""
-        # Check if hero is in bathroom
-        if game_state.hero.GetRoom() != game_state.apartment.bathroom:
-            return False
-        
-        # Check if hero has ice cubes
-        ice_cubes = game_state.hero.GetFirstItemByName("ice-cubes")
-        return ice_cubes is not None
+        bound = self.bindings(game_state, context)
+        return bound["room"] is game_state.apartment.bathroom and bound["ice_cubes"] is not None
     
     def execute(self, game_state: "GameState") -> CommandResult:
         """Execute the ice bath action."""
+        bound = self.bindings(game_state)
+        
         # Check if hero is in bathroom
-        if game_state.hero.GetRoom() != game_state.apartment.bathroom:
+        if bound["room"] != game_state.apartment.bathroom:
             return CommandResult(
                 success=False,
                 message="I need to be in the bathroom to take an ice bath."
             )
         
         # Check if hero has ice cubes
-        ice_cubes = game_state.hero.GetFirstItemByName("ice-cubes")
+        ice_cubes = bound["ice_cubes"]
         if not ice_cubes:
             return CommandResult(
                 success=False,
@@ -1046,49 +1135,47 @@ def create_ice_bath_command() -> BaseCommand:
 
 # Phase 3: Sabotage and Investigation Commands
 
-class DisassembleFrameCommand(BaseCommand):
-    """Command to disassemble the device frame in the bedroom.
-    
-    Requires: hero in bedroom + hammer in inventory + device-frame is BUILT.
-    Effect: sets device-frame to MISSING, removes device-frame Object from bedroom.
-    Cost: +1 hour time, -15 feel.
+class TearDownCommand(BaseCommand):
+    """Base for sabotage commands that tear a component out of the device.
+
+    The rule (room, tool, component, time and feel) is the RECIPE entry in
+    recipes.RECIPES; subclasses supply it and their messages.
     """
 
-    def __init__(self):
-        super().__init__("Disassemble device frame")
+    RECIPE: str
+    NEEDS_TOOL: str = ""
+    NOTHING_HERE: str
+    SUCCESS: str
 
-    def can_execute(self, game_state: "GameState") -> bool:
-        """Check prerequisites: in bedroom, has hammer, frame is built."""
-        hero = game_state.hero
-        if hero.GetRoom() != game_state.apartment.bedroom:
-            return False
-        if not hero.GetFirstItemByName("hammer"):
-            return False
-        return game_state.device_state.is_component_built("device-frame")
+    def resolve(self, game_state: "GameState", context: TurnContext) -> dict:
+        """Find the hero's room and check their tools."""
+        return _resolve_recipe(RECIPES[self.RECIPE], context)
+
+    def can_execute(self, game_state: "GameState",
+                    context: Optional[TurnContext] = None) -> bool:
+        """Check the recipe: in the right room, has the tool, component is built."""
+        recipe = RECIPES[self.RECIPE]
+        bound = self.bindings(game_state, context)
+        return (recipe.in_place(bound["room"].name) and not bound["missing"]
+                and recipe.components_ready(game_state.device_state))
 
     def execute(self, game_state: "GameState") -> CommandResult:
-        """Disassemble the device frame."""
+        """Tear the component out."""
         hero = game_state.hero
-        bedroom = game_state.apartment.bedroom
+        recipe = RECIPES[self.RECIPE]
+        bound = self.bindings(game_state)
 
-        if hero.GetRoom() != bedroom:
+        if not recipe.in_place(bound["room"].name):
             return CommandResult(
                 success=False,
-                message="You need to be in the bedroom to do that."
+                message=f"You need to be in the {recipe.room} to do that."
             )
 
-        hammer = hero.GetFirstItemByName("hammer")
-        if not hammer:
-            return CommandResult(
-                success=False,
-                message="You need a hammer to disassemble the frame."
-            )
+        if bound["missing"]:
+            return CommandResult(success=False, message=self.NEEDS_TOOL)
 
-        if not game_state.device_state.is_component_built("device-frame"):
-            return CommandResult(
-                success=False,
-                message="There is no device frame here to disassemble."
-            )
+        if not recipe.components_ready(game_state.device_state):
+            return CommandResult(success=False, message=self.NOTHING_HERE)
 
         # Store undo data
         self.store_undo_data({
@@ -1096,33 +1183,36 @@ class DisassembleFrameCommand(BaseCommand):
             "previous_time": game_state.watch.curr_time,
         })
 
-        # Remove the device-frame Object from bedroom
-        frame_obj = bedroom.GetFirstItemByName("device-frame")
-        if frame_obj:
-            bedroom.contents.remove(frame_obj)
-
-        # Update device state
-        game_state.device_state.remove_component("device-frame")
-
-        # Apply costs
-        game_state.watch.curr_time += timedelta(hours=1)
-        hero.feel -= 15
+        _tear_down(game_state, recipe)
 
         self.mark_executed()
-        return CommandResult(
-            success=True,
-            message=(
-                "You take the hammer to the device frame, smashing it apart. "
-                "Splinters of wood and bent metal scatter across the floor."
-            ),
-            time_advanced=True,
-        )
+        return CommandResult(success=True, message=self.SUCCESS, time_advanced=True)
 
     def can_undo(self) -> bool:
         return False
 
 
-class CutWiresCommand(BaseCommand):
+class DisassembleFrameCommand(TearDownCommand):
+    """Command to disassemble the device frame in the bedroom.
+    
+    Requires: hero in bedroom + hammer in inventory + device-frame is BUILT.
+    Effect: sets device-frame to MISSING, removes device-frame Object from bedroom.
+    Cost: +1 hour time, -15 feel.
+    """
+
+    RECIPE = "disassemble-frame"
+    NEEDS_TOOL = "You need a hammer to disassemble the frame."
+    NOTHING_HERE = "There is no device frame here to disassemble."
+    SUCCESS = (
+        "You take the hammer to the device frame, smashing it apart. "
+        "Splinters of wood and bent metal scatter across the floor."
+    )
+
+    def __init__(self):
+        super().__init__("Disassemble device frame")
+
+
+class CutWiresCommand(TearDownCommand):
     """Command to cut the wiring harness in the bedroom.
     
     Requires: hero in bedroom + wire-cutters in inventory + wiring-harness is BUILT.
@@ -1130,69 +1220,19 @@ class CutWiresCommand(BaseCommand):
     Cost: +30 min time, -10 feel.
     """
 
+    RECIPE = "cut-wires"
+    NEEDS_TOOL = "You need wire-cutters to cut the wires."
+    NOTHING_HERE = "There is no wiring harness here to cut."
+    SUCCESS = (
+        "You carefully sever the wiring harness, snipping each wire "
+        "methodically. Sparks fly as the last connection is cut."
+    )
+
     def __init__(self):
         super().__init__("Cut device wires")
 
-    def can_execute(self, game_state: "GameState") -> bool:
-        hero = game_state.hero
-        if hero.GetRoom() != game_state.apartment.bedroom:
-            return False
-        if not hero.GetFirstItemByName("wire-cutters"):
-            return False
-        return game_state.device_state.is_component_built("wiring-harness")
-
-    def execute(self, game_state: "GameState") -> CommandResult:
-        hero = game_state.hero
-        bedroom = game_state.apartment.bedroom
 
-        if hero.GetRoom() != bedroom:
-            return CommandResult(
-                success=False,
-                message="You need to be in the bedroom to do that."
-            )
-
-        cutters = hero.GetFirstItemByName("wire-cutters")
-        if not cutters:
-            return CommandResult(
-                success=False,
-                message="You need wire-cutters to cut the wires."
-            )
-
-        if not game_state.device_state.is_component_built("wiring-harness"):
-            return CommandResult(
-                success=False,
-                message="There is no wiring harness here to cut."
-            )
-
-        self.store_undo_data({
-            "previous_feel": hero.feel,
-            "previous_time": game_state.watch.curr_time,
-        })
-
-        harness_obj = bedroom.GetFirstItemByName("wiring-harness")
-        if harness_obj:
-            bedroom.contents.remove(harness_obj)
-
-        game_state.device_state.remove_component("wiring-harness")
-
-        game_state.watch.curr_time += timedelta(minutes=30)
-        hero.feel -= 10
-
-        self.mark_executed()
-        return CommandResult(
-            success=True,
-            message=(
-                "You carefully sever the wiring harness, snipping each wire "
-                "methodically. Sparks fly as the last connection is cut."
-            ),
-            time_advanced=True,
-        )
-
-    def can_undo(self) -> bool:
-        return False
-
-
-class RemoveBatteryCommand(BaseCommand):
+class RemoveBatteryCommand(TearDownCommand):
     """Command to remove the power core from the device.
     
     Requires: hero in bedroom + power-core is BUILT.
@@ -1200,60 +1240,18 @@ class RemoveBatteryCommand(BaseCommand):
     Cost: +20 min time, -5 feel.
     """
 
+    RECIPE = "remove-battery"
+    NOTHING_HERE = "There is no power core here to remove."
+    SUCCESS = (
+        "You pry the battery pack free from its mounting. "
+        "The device goes dark and silent."
+    )
+
     def __init__(self):
         super().__init__("Remove power core battery")
 
-    def can_execute(self, game_state: "GameState") -> bool:
-        hero = game_state.hero
-        if hero.GetRoom() != game_state.apartment.bedroom:
-            return False
-        return game_state.device_state.is_component_built("power-core")
-
-    def execute(self, game_state: "GameState") -> CommandResult:
-        hero = game_state.hero
-        bedroom = game_state.apartment.bedroom
-
-        if hero.GetRoom() != bedroom:
-            return CommandResult(
-                success=False,
-                message="You need to be in the bedroom to do that."
-            )
-
-        if not game_state.device_state.is_component_built("power-core"):
-            return CommandResult(
-                success=False,
-                message="There is no power core here to remove."
-            )
-
-        self.store_undo_data({
-            "previous_feel": hero.feel,
-            "previous_time": game_state.watch.curr_time,
-        })
-
-        core_obj = bedroom.GetFirstItemByName("power-core")
-        if core_obj:
-            bedroom.contents.remove(core_obj)
-
-        game_state.device_state.remove_component("power-core")
-
-        game_state.watch.curr_time += timedelta(minutes=20)
-        hero.feel -= 5
-
-        self.mark_executed()
-        return CommandResult(
-            success=True,
-            message=(
-                "You pry the battery pack free from its mounting. "
-                "The device goes dark and silent."
-            ),
-            time_advanced=True,
-        )
 
-    def can_undo(self) -> bool:
-        return False
-
-
-class RemoveCrystalCommand(BaseCommand):
+class RemoveCrystalCommand(TearDownCommand):
     """Command to remove the focusing array crystal from the device.
     
     Requires: hero in bedroom + focusing-array is BUILT.
@@ -1261,58 +1259,16 @@ class RemoveCrystalCommand(BaseCommand):
     Cost: +20 min time, -5 feel.
     """
 
+    RECIPE = "remove-crystal"
+    NOTHING_HERE = "There is no focusing array here to remove."
+    SUCCESS = (
+        "You carefully extract the crystal oscillator from the focusing array. "
+        "It hums faintly in your hand before falling silent."
+    )
+
     def __init__(self):
         super().__init__("Remove focusing crystal")
 
-    def can_execute(self, game_state: "GameState") -> bool:
-        hero = game_state.hero
-        if hero.GetRoom() != game_state.apartment.bedroom:
-            return False
-        return game_state.device_state.is_component_built("focusing-array")
-
-    def execute(self, game_state: "GameState") -> CommandResult:
-        hero = game_state.hero
-        bedroom = game_state.apartment.bedroom
-
-        if hero.GetRoom() != bedroom:
-            return CommandResult(
-                success=False,
-                message="You need to be in the bedroom to do that."
-            )
-
-        if not game_state.device_state.is_component_built("focusing-array"):
-            return CommandResult(
-                success=False,
-                message="There is no focusing array here to remove."
-            )
-
-        self.store_undo_data({
-            "previous_feel": hero.feel,
-            "previous_time": game_state.watch.curr_time,
-        })
-
-        array_obj = bedroom.GetFirstItemByName("focusing-array")
-        if array_obj:
-            bedroom.contents.remove(array_obj)
-
-        game_state.device_state.remove_component("focusing-array")
-
-        game_state.watch.curr_time += timedelta(minutes=20)
-        hero.feel -= 5
-
-        self.mark_executed()
-        return CommandResult(
-            success=True,
-            message=(
-                "You carefully extract the crystal oscillator from the focusing array. "
-                "It hums faintly in your hand before falling silent."
-            ),
-            time_advanced=True,
-        )
-
-    def can_undo(self) -> bool:
-        return False
-
 
 class BarricadeBedroomCommand(BaseCommand):
     """Command to barricade the bedroom from outside.
@@ -1322,46 +1278,38 @@ class BarricadeBedroomCommand(BaseCommand):
     Cost: +1 hour time, -15 feel.
     """
 
+    # Complaint for each missing item, in the order checked
+    MISSING_MESSAGES = {
+        "hammer": "You need a hammer to barricade the door.",
+        "box-of-nails": "You need nails to barricade the door.",
+        "plywood-sheet": "You need plywood to barricade the door.",
+    }
+
     def __init__(self):
         super().__init__("Barricade bedroom door")
 
-    def can_execute(self, game_state: "GameState") -> bool:
-        hero = game_state.hero
-        if hero.GetRoom() == game_state.apartment.bedroom:
-            return False
-        hammer = hero.GetFirstItemByName("hammer")
-        nails = hero.GetFirstItemByName("box-of-nails")
-        plywood = hero.GetFirstItemByName("plywood-sheet")
-        return bool(hammer and nails and plywood)
+    def resolve(self, game_state: "GameState", context: TurnContext) -> dict:
+        return _resolve_recipe(RECIPES["barricade-bedroom"], context)
+
+    def can_execute(self, game_state: "GameState",
+                    context: Optional[TurnContext] = None) -> bool:
+        bound = self.bindings(game_state, context)
+        return RECIPES["barricade-bedroom"].in_place(bound["room"].name) and not bound["missing"]
 
     def execute(self, game_state: "GameState") -> CommandResult:
         hero = game_state.hero
+        bound = self.bindings(game_state)
 
-        if hero.GetRoom() == game_state.apartment.bedroom:
+        if bound["room"] == game_state.apartment.bedroom:
             return CommandResult(
                 success=False,
                 message="You can't barricade the door from inside the bedroom!"
             )
 
-        hammer = hero.GetFirstItemByName("hammer")
-        nails = hero.GetFirstItemByName("box-of-nails")
-        plywood = hero.GetFirstItemByName("plywood-sheet")
-
-        if not hammer:
-            return CommandResult(
-                success=False,
-                message="You need a hammer to barricade the door."
-            )
-        if not nails:
-            return CommandResult(
-                success=False,
-                message="You need nails to barricade the door."
-            )
-        if not plywood:
-            return CommandResult(
-                success=False,
-                message="You need plywood to barricade the door."
-            )
+        recipe = RECIPES["barricade-bedroom"]
+        for name, need in self.MISSING_MESSAGES.items():
+            if name in bound["missing"]:
+                return CommandResult(success=False, message=need)
 
         self.store_undo_data({
             "previous_feel": hero.feel,
@@ -1369,15 +1317,14 @@ class BarricadeBedroomCommand(BaseCommand):
         })
 
         # Consume plywood and nails (keep hammer)
-        hero.Destroy([plywood, nails])
+        hero.Destroy(bound["consumed"])
 
         # Set barricaded flag on both gamestate and bedroom
         game_state.bedroom_barricaded = True
         game_state.apartment.bedroom.barricaded = True
 
         # Apply costs
-        game_state.watch.curr_time += timedelta(hours=1)
-        hero.feel -= 15
+        recipe.charge(game_state)
 
         self.mark_executed()
         return CommandResult(
@@ -1404,40 +1351,18 @@ class ReadJournalCommand(BaseCommand):
     def __init__(self):
         super().__init__("Read journal")
 
-    def can_execute(self, game_state: "GameState") -> bool:
-        hero = game_state.hero
-        # Check hero inventory
-        journal = hero.GetFirstItemByName("journal")
-        if journal:
-            return True
-        # Check same room
-        room = hero.GetRoom()
-        journal = room.GetFirstItemByName("journal")
-        if journal:
-            return True
-        # Check containers in the room (e.g. bookshelf)
-        for item in room.contents:
-            if hasattr(item, 'contents'):
-                journal = item.GetFirstItemByName("journal")
-                if journal:
-                    return True
-        return False
+    def resolve(self, game_state: "GameState", context: TurnContext) -> dict:
+        # Inventory, same room, or containers in the room (e.g. bookshelf)
+        return {"journal": context.find_nearby("journal")}
+
+    def can_execute(self, game_state: "GameState",
+                    context: Optional[TurnContext] = None) -> bool:
+        return self.bindings(game_state, context)["journal"] is not None
 
     def execute(self, game_state: "GameState") -> CommandResult:
         hero = game_state.hero
 
-        # Find the journal (inventory, room, or containers in room)
-        journal = hero.GetFirstItemByName("journal")
-        if not journal:
-            room = hero.GetRoom()
-            journal = room.GetFirstItemByName("journal")
-            if not journal:
-                for item in room.contents:
-                    if hasattr(item, 'contents'):
-                        journal = item.GetFirstItemByName("journal")
-                        if journal:
-                            break
-
+        journal = self.bindings(game_state)["journal"]
         if not journal:
             return CommandResult(
                 success=False,
@@ -1489,7 +1414,6 @@ class LetGoCommand(BaseCommand):
                 success=False,
                 message="That doesn't make sense right now."
             )
-        from ..endings import GameEndings
         GameEndings.display_secret_ending(game_state.io)
         game_state.in_dream_confrontation = False
         game_state.game_over = True
@@ -1523,4 +1447,26 @@ class HoldOnCommand(BaseCommand):
         return CommandResult(success=True, message="")
 
     def can_undo(self) -> bool:
-        return False
\ No newline at end of file
+        return False
+
+
+# History Commands
+
+class DeferredUndoCommand(BaseCommand):
+    """Command to undo the last command in the game's own history."""
+
+    def __init__(self):
+        super().__init__("Undo last command")
+
+    def execute(self, game_state: "GameState") -> CommandResult:
+        return game_state.command_history.undo(game_state)
+
+
+class DeferredRedoCommand(BaseCommand):
+    """Command to redo the last undone command in the game's own history."""
+
+    def __init__(self):
+        super().__init__("Redo last undone command")
+
+    def execute(self, game_state: "GameState") -> CommandResult:
+        return game_state.command_history.redo(game_state)
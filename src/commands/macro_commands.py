@@ -11,7 +11,10 @@ from typing import TYPE_CHECKING, List
 from .base_command import BaseCommand, MacroCommand
 from .game_commands import (
     EnterRoomCommand, OpenThingCommand, GetObjectCommand, 
-    ExamineThingCommand, CloseThingCommand, InventoryCommand
+    ExamineThingCommand, CloseThingCommand, InventoryCommand,
+    InspectRoomCommand, NailSelfInCommand, DebugItemsCommand,
+    CallPhoneCommand, CheckBalanceCommand, LookAtWatchCommand,
+    CheckFeelCommand
 )
 
 if TYPE_CHECKING:
@@ -36,8 +39,6 @@ class ExploreRoomMacro(MacroCommand):
             room_name: Name of the room to explore
             objects_to_examine: Optional list of specific objects to examine
         """
-        from .game_commands import InspectRoomCommand
-        
         commands = [
             EnterRoomCommand(room_name),
             InspectRoomCommand()
@@ -134,8 +135,6 @@ class PrepareClosetNailingMacro(MacroCommand):
     
     def __init__(self):
         """Initialize the prepare closet nailing macro."""
-        from .game_commands import NailSelfInCommand, DebugItemsCommand
-        
         commands = [
             # Give debug items to ensure we have everything
             DebugItemsCommand(),
@@ -192,8 +191,6 @@ class PhoneOrderMacro(MacroCommand):
     
     def __init__(self):
         """Initialize the phone order macro."""
-        from .game_commands import CallPhoneCommand, CheckBalanceCommand
-        
         commands = [
             EnterRoomCommand("main"),
             CallPhoneCommand(),
@@ -220,11 +217,6 @@ class StatusCheckMacro(MacroCommand):
     
     def __init__(self):
         """Initialize the status check macro."""
-        from .game_commands import (
-            LookAtWatchCommand, CheckBalanceCommand, 
-            CheckFeelCommand, InventoryCommand
-        )
-        
         commands = [
             LookAtWatchCommand(),
             CheckBalanceCommand(),
@@ -287,10 +279,6 @@ class MacroBuilder:
     
     def check_status(self) -> "MacroBuilder":
         """Add all status check commands."""
-        from .game_commands import (
-            LookAtWatchCommand, CheckBalanceCommand, CheckFeelCommand
-        )
-        
         self.commands.extend([
             LookAtWatchCommand(),
             CheckBalanceCommand(),
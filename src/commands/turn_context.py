@@ -0,0 +1,189 @@
+"""
+Turn Context module - Shared lookups for checking many commands at once.
+
+Agents ask which of dozens of candidate commands can run this turn. Each
+can_execute() on its own walks up to the hero's room and scans containers
+by name; a TurnContext does those lookups once per turn and lets every
+check share them. executable_commands() enumerates the whole action space
+from a single context.
+"""
+
+from __future__ import annotations
+from collections import Counter
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, List
+
+from .base_command import BaseCommand
+from ..core.game_objects import Container, Object, Openable
+from ..core.items import Food
+from ..core.rooms import Room
+from ..lazy import lazy_module
+
+# game_commands imports this module for TurnContext
+game_commands = lazy_module(".game_commands", __package__)
+
+if TYPE_CHECKING:
+    from ..core.characters import Hero
+    from ..core.game_world import GameState
+
+
+def _first_by_name(objects: List[Object]) -> Dict[str, Object]:
+    """Map each name to the first object with it, as GetFirstItemByName would."""
+    by_name: Dict[str, Object] = {}
+    for obj in objects:
+        by_name.setdefault(obj.name, obj)
+    return by_name
+
+
+class TurnContext:
+    """
+    Read-only lookups over the game state for one turn.
+
+    Every lookup is computed on first use and then reused, so a context must
+    not outlive the turn: build a new one after any command executes.
+    """
+
+    def __init__(self, game_state: "GameState"):
+        """
+        Initialize the context.
+
+        Args:
+            game_state: Game state to look things up in
+        """
+        self.game_state = game_state
+        self.hero: "Hero" = game_state.hero
+        self._container_items: Dict[int, Dict[str, Object]] = {}
+
+    @cached_property
+    def room(self) -> Room:
+        """The room the hero is in."""
+        return self.hero.GetRoom()
+
+    @cached_property
+    def inventory(self) -> Dict[str, Object]:
+        """Items the hero carries, by name."""
+        return _first_by_name(self.hero.contents)
+
+    @cached_property
+    def inventory_counts(self) -> Counter[str]:
+        """How many items of each name the hero carries."""
+        return Counter(obj.name for obj in self.hero.contents)
+
+    @cached_property
+    def room_items(self) -> Dict[str, Object]:
+        """Objects directly in the hero's room, by name."""
+        return _first_by_name(self.room.contents)
+
+    @cached_property
+    def rooms(self) -> Dict[str, Object]:
+        """Objects directly in the apartment (its rooms), by name."""
+        return _first_by_name(self.game_state.apartment.contents)
+
+    @cached_property
+    def open_containers(self) -> Dict[str, Container]:
+        """Containers in the room whose contents can be taken, by name."""
+        return {
+            name: obj for name, obj in self.room_items.items()
+            if isinstance(obj, Container) and not isinstance(obj, Room)
+            and (not isinstance(obj, Openable) or obj.state == Openable.State.OPEN)
+        }
+
+    def items_in(self, container: Container) -> Dict[str, Object]:
+        """Objects directly in a container, by name."""
+        items = self._container_items.get(id(container))
+        if items is None:
+            items = _first_by_name(container.contents)
+            self._container_items[id(container)] = items
+        return items
+
+    def holding(self, *names: str) -> bool:
+        """Whether the hero carries an item of every given name."""
+        return all(name in self.inventory for name in names)
+
+    def in_room(self, room: Room) -> bool:
+        """Whether the hero is in a particular room."""
+        return self.room is room
+
+    def find_nearby(self, name: str) -> Object | None:
+        """
+        First item of a name carried, in the room, or in a container in the
+        room (open or not), in that order.
+        """
+        item = self.inventory.get(name) or self.room_items.get(name)
+        if item:
+            return item
+        for obj in self.room.contents:
+            if isinstance(obj, Container):
+                item = self.items_in(obj).get(name)
+                if item:
+                    return item
+        return None
+
+
+def candidate_commands(context: TurnContext) -> List[BaseCommand]:
+    """
+    Every command worth checking this turn, one instance each.
+
+    Object names come from the context, so the candidates cover the other
+    rooms, the objects in the current room (opening only what is closed
+    and closing only what is open), the contents of its open containers,
+    the food in the open fridge and the hero's own pending orders. Commands that
+    could only do nothing (entering the current room, examining or taking
+    from the hero) are left out. This is the one enumeration of the action
+    space; action_space builds its input lines from it.
+    """
+    # Commands without arguments (ponder needs hours; dream choices and
+    # undo/redo are not part of the regular action space)
+    candidates: List[BaseCommand] = [command() for command in (
+        game_commands.InventoryCommand, game_commands.CheckBalanceCommand,
+        game_commands.CheckFeelCommand, game_commands.LookAtWatchCommand,
+        game_commands.InspectRoomCommand, game_commands.DebugItemsCommand,
+        game_commands.CallPhoneCommand, game_commands.RolodexCommand,
+        game_commands.MailCheckCommand, game_commands.CheckOrdersCommand,
+        game_commands.NailSelfInCommand, game_commands.TakeIceBathCommand,
+        game_commands.DisassembleFrameCommand, game_commands.CutWiresCommand,
+        game_commands.RemoveBatteryCommand, game_commands.RemoveCrystalCommand,
+        game_commands.BarricadeBedroomCommand, game_commands.ReadJournalCommand,
+    )]
+    candidates += [game_commands.EnterRoomCommand(name) for name, obj in context.rooms.items()
+                   if isinstance(obj, Room) and obj is not context.room]
+    for name, obj in context.room_items.items():
+        if obj is context.hero:
+            continue
+        candidates.append(game_commands.ExamineThingCommand(name))
+        if isinstance(obj, Openable):
+            if obj.state == Openable.State.CLOSED:
+                candidates.append(game_commands.OpenThingCommand(name))
+            else:
+                candidates.append(game_commands.CloseThingCommand(name))
+    if "tv" in context.room_items:
+        candidates.append(game_commands.WatchObjectCommand("tv"))
+    for container_name, container in context.open_containers.items():
+        if container is context.hero:
+            continue
+        candidates += [game_commands.GetObjectCommand(name, container_name)
+                       for name in context.items_in(container)]
+    fridge = context.game_state.apartment.main.fridge
+    if fridge.parent is context.room and fridge.state == Openable.State.OPEN:
+        candidates += [game_commands.EatThingCommand(name)
+                       for name, obj in context.items_in(fridge).items() if isinstance(obj, Food)]
+    queue = context.game_state.event_queue
+    if queue is not None:
+        ordered = dict.fromkeys(order.name for order in queue.orders.expected(placed_by="hero"))
+        candidates += [game_commands.CancelOrderCommand(name) for name in ordered]
+    return candidates
+
+
+def executable_commands(game_state: "GameState") -> List[BaseCommand]:
+    """
+    All commands that can execute right now, from one shared TurnContext.
+
+    Args:
+        game_state: Current game state
+
+    Returns:
+        A fresh command instance for every executable action
+    """
+    context = TurnContext(game_state)
+    return [command for command in candidate_commands(context)
+            if command.can_execute(game_state, context)]
@@ -4,10 +4,15 @@ device_state.py
 Tracks the state of the Convergence Amplifier device and its 5 components.
 Each component can be BUILT or MISSING. The device is complete when all
 components are BUILT.
+
+The components are held as an integer bitmask (bit i is COMPONENTS[i]), so
+counts are table lookups and the mask itself is a compact fingerprint of
+the device, the same encoding the balance simulation uses.
 """
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from enum import IntEnum
 
 
@@ -17,6 +22,14 @@ class ComponentStatus(IntEnum):
     BUILT = 1
 
 
+def _names_by_mask(components: list[str], built: bool) -> tuple[tuple[str, ...], ...]:
+    """For every mask value, the components whose bit is set (or clear), in order."""
+    return tuple(
+        tuple(name for i, name in enumerate(components) if bool(mask >> i & 1) == built)
+        for mask in range(1 << len(components))
+    )
+
+
 class DeviceState:
     """
     Tracks the Convergence Amplifier's 5 components and the AE's build phase.
@@ -36,13 +49,43 @@ class DeviceState:
         "focusing-array",
         "convergence-device",
     ]
+    # Bit of each component in the mask, and the mask with all of them built
+    COMPONENT_BITS: dict[str, int] = {name: 1 << i for i, name in enumerate(COMPONENTS)}
+    ALL_BUILT: int = (1 << len(COMPONENTS)) - 1
+    # Per mask value: number built, and the built / missing names in order
+    _BUILT_COUNT: tuple[int, ...] = tuple(mask.bit_count() for mask in range(ALL_BUILT + 1))
+    _BUILT_NAMES: tuple[tuple[str, ...], ...] = _names_by_mask(COMPONENTS, built=True)
+    _MISSING_NAMES: tuple[tuple[str, ...], ...] = _names_by_mask(COMPONENTS, built=False)
 
     def __init__(self) -> None:
         """Initialize all components as MISSING and AE phase to 0."""
-        self._components: dict[str, ComponentStatus] = {
-            name: ComponentStatus.MISSING for name in self.COMPONENTS
-        }
+        self._built: int = 0
         self.ae_phase: int = 0  # 0 = not started, 1-5 = current phase
+        self._listeners: list[Callable[[], None]] = []
+
+    @property
+    def mask(self) -> int:
+        """Bitmask of the BUILT components (bit i is COMPONENTS[i])."""
+        return self._built
+
+    def _bit(self, name: str) -> int:
+        bit = self.COMPONENT_BITS.get(name)
+        if bit is None:
+            raise ValueError(f"Unknown component: {name}")
+        return bit
+
+    def subscribe(self, listener: Callable[[], None]) -> None:
+        """
+        Call listener after every component build or removal.
+
+        Args:
+            listener: Function taking no arguments
+        """
+        self._listeners.append(listener)
+
+    def _changed(self) -> None:
+        for listener in self._listeners:
+            listener()
 
     def build_component(self, name: str) -> None:
         """
@@ -54,9 +97,8 @@ class DeviceState:
         Raises:
             ValueError: If the component name is not valid
         """
-        if name not in self._components:
-            raise ValueError(f"Unknown component: {name}")
-        self._components[name] = ComponentStatus.BUILT
+        self._built |= self._bit(name)
+        self._changed()
 
     def remove_component(self, name: str) -> None:
         """
@@ -68,9 +110,8 @@ class DeviceState:
         Raises:
             ValueError: If the component name is not valid
         """
-        if name not in self._components:
-            raise ValueError(f"Unknown component: {name}")
-        self._components[name] = ComponentStatus.MISSING
+        self._built &= ~self._bit(name)
+        self._changed()
 
     def is_component_built(self, name: str) -> bool:
         """
@@ -85,41 +126,24 @@ class DeviceState:
         Raises:
             ValueError: If the component name is not valid
         """
-        if name not in self._components:
-            raise ValueError(f"Unknown component: {name}")
-        return self._components[name] == ComponentStatus.BUILT
+        return bool(self._built & self._bit(name))
 
     def count_built_components(self) -> int:
         """Return the number of BUILT components."""
-        return sum(
-            1 for status in self._components.values()
-            if status == ComponentStatus.BUILT
-        )
+        return self._BUILT_COUNT[self._built]
 
     def count_missing_components(self) -> int:
         """Return the number of MISSING components."""
-        return sum(
-            1 for status in self._components.values()
-            if status == ComponentStatus.MISSING
-        )
+        return len(self.COMPONENTS) - self._BUILT_COUNT[self._built]
 
     def is_device_complete(self) -> bool:
         """Return True if all 5 components are BUILT."""
-        return all(
-            status == ComponentStatus.BUILT
-            for status in self._components.values()
-        )
+        return self._built == self.ALL_BUILT
 
     def get_built_components(self) -> list[str]:
         """Return a list of component names that are BUILT."""
-        return [
-            name for name, status in self._components.items()
-            if status == ComponentStatus.BUILT
-        ]
+        return list(self._BUILT_NAMES[self._built])
 
     def get_missing_components(self) -> list[str]:
         """Return a list of component names that are MISSING."""
-        return [
-            name for name, status in self._components.items()
-            if status == ComponentStatus.MISSING
-        ]
+        return list(self._MISSING_NAMES[self._built])
@@ -15,6 +15,119 @@ if TYPE_CHECKING:
     from ..io_interface import IOInterface
 
 
+# Bumped by every change to the object tree: contents added, removed or
+# reordered, an object given a new parent, or a container opened or closed.
+# Caches derived from the tree (such as the action space) compare it to know
+# when to rebuild.
+_world_version = 0
+
+
+def world_version() -> int:
+    """
+    Return the current world version.
+    """
+    return _world_version
+
+
+def touch_world() -> None:
+    """
+    Record a change to the object tree made behind ContentsList's back.
+    """
+    global _world_version
+    _world_version += 1
+
+
+class ContentsList(list):
+    """
+    The contents of a container: a list that bumps the world version on
+    every mutation and keeps its owner's weight totals up to date.
+
+    Every object records the containers whose contents hold it, so a change
+    is passed up through those holders in O(depth).
+    """
+
+    def __init__(self, owner: Container) -> None:
+        super().__init__()
+        self.owner = owner
+
+    def _added(self, items) -> None:
+        owner = self.owner
+        for item in items:
+            item._holders.append(owner)
+            owner._direct_weight += item.weight
+            owner._add_contents_weight(item.total_weight)
+        touch_world()
+
+    def _removed(self, items) -> None:
+        owner = self.owner
+        for item in items:
+            item._holders.remove(owner)
+            owner._direct_weight -= item.weight
+            owner._add_contents_weight(-item.total_weight)
+        touch_world()
+
+    def append(self, item: Object) -> None:
+        super().append(item)
+        self._added((item,))
+
+    def extend(self, items) -> None:
+        items = list(items)
+        super().extend(items)
+        self._added(items)
+
+    def insert(self, index, item: Object) -> None:
+        super().insert(index, item)
+        self._added((item,))
+
+    def remove(self, item: Object) -> None:
+        removed = self[self.index(item)]
+        super().remove(item)
+        self._removed((removed,))
+
+    def pop(self, index=-1) -> Object:
+        item = super().pop(index)
+        self._removed((item,))
+        return item
+
+    def clear(self) -> None:
+        items = list(self)
+        super().clear()
+        self._removed(items)
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        touch_world()
+
+    def reverse(self) -> None:
+        super().reverse()
+        touch_world()
+
+    def __setitem__(self, index, value) -> None:
+        old = self[index] if isinstance(index, slice) else [self[index]]
+        new = list(value) if isinstance(index, slice) else [value]
+        super().__setitem__(index, new if isinstance(index, slice) else value)
+        self._removed(old)
+        self._added(new)
+
+    def __delitem__(self, index) -> None:
+        old = self[index] if isinstance(index, slice) else [self[index]]
+        super().__delitem__(index)
+        self._removed(old)
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def __imul__(self, count):
+        items = list(self)
+        super().__imul__(count)
+        if count <= 0:
+            self._removed(items)
+        else:
+            self._added(items * (count - 1))
+        return self
+
+
 def sameroom(func: Callable[..., None]) -> Callable[..., None]:
     """
     Decorator to ensure that the hero and the object are in the same room before
@@ -35,16 +148,18 @@ class Object:
     Base class for all objects in the game. Tracks name, weight, and parent container.
     """
     name: str
-    weight: int
-    parent: Container | None
+    # Overridden by Room; lets GetRoom walk parents without importing rooms
+    is_room: bool = False
 
     def __init__(self, name: str, parent: Container | None) -> None:
         """
         Initialize an object with a name and parent container.
         """
         self.name = name
+        # Containers whose contents hold this object (kept by ContentsList)
+        self._holders: list[Container] = []
         # set if this is important for a particular object
-        self.weight = 0
+        self._weight = 0
         self.parent = parent
 
         if parent is not None:
@@ -70,15 +185,46 @@ class Object:
         """
         return f"{self.name}"
 
+    @property
+    def weight(self) -> int:
+        """
+        The object's own weight.
+        """
+        return self._weight
+
+    @weight.setter
+    def weight(self, value: int) -> None:
+        delta = value - self._weight
+        self._weight = value
+        for holder in self._holders:
+            holder._direct_weight += delta
+            holder._add_contents_weight(delta)
+
+    @property
+    def total_weight(self) -> int:
+        """
+        The object's weight including anything inside it.
+        """
+        return self._weight
+
+    @property
+    def parent(self) -> Container | None:
+        """
+        The container this object is in.
+        """
+        return self._parent
+
+    @parent.setter
+    def parent(self, value: Container | None) -> None:
+        self._parent = value
+        touch_world()
+
     def GetRoom(self) -> 'Room':
         """
         Traverse up the parent chain to find the containing Room.
         """
-        # Import here to avoid circular imports
-        from .rooms import Room
-        
         curr_parent = self.parent
-        while curr_parent is not None and not isinstance(curr_parent, Room):
+        while curr_parent is not None and not curr_parent.is_room:
             curr_parent = curr_parent.parent
 
         if curr_parent is None:
@@ -96,10 +242,40 @@ class Container(Object):
         """
         Initialize a container with an empty contents list.
         """
+        # Weight totals of the contents, kept up to date by ContentsList
+        self._direct_weight = 0
+        self._contents_weight = 0
         super().__init__(name, parent)
-        self.contents: list[Object] = []
+        self.contents: list[Object] = ContentsList(self)
         self.weight = 1000  # containers are just too much
 
+    @property
+    def direct_weight(self) -> int:
+        """
+        Total weight of the objects directly inside this container.
+        """
+        return self._direct_weight
+
+    @property
+    def contents_weight(self) -> int:
+        """
+        Total weight of everything inside this container, however deep.
+        """
+        return self._contents_weight
+
+    @property
+    def total_weight(self) -> int:
+        """
+        The container's weight including everything inside it.
+        """
+        return self._weight + self._contents_weight
+
+    def _add_contents_weight(self, delta: int) -> None:
+        """Add to the nested contents weight here and in every holder above."""
+        self._contents_weight += delta
+        for holder in self._holders:
+            holder._add_contents_weight(delta)
+
     def GetItemsByName(self, name: str) -> list[Object]:
         """
         Return all items in the container with the given name.
@@ -140,7 +316,6 @@ class Openable(Container):
     """
     Represents a container that can be opened or closed.
     """
-    state: int
 
     class State(IntEnum):
         """
@@ -156,6 +331,18 @@ class Openable(Container):
         super().__init__(name, parent)
         self.state = Openable.State.CLOSED
 
+    @property
+    def state(self) -> Openable.State:
+        """
+        Whether the container is open or closed.
+        """
+        return self._state
+
+    @state.setter
+    def state(self, value: Openable.State) -> None:
+        self._state = value
+        touch_world()
+
     def Interact(self) -> None:
         """
         Openable containers are opened/closed rather than directly interacted with.
@@ -15,6 +15,7 @@ from .. import alterego
 from ..io_interface import IOInterface, ConsoleIO
 from ..commands.command_invoker import CommandInvoker
 from ..commands.command_history import CommandHistory
+from ..endings import EndingEvaluator, GameEndings
 from .characters import Hero
 from .rooms import Apartment
 from .items import Watch
@@ -24,6 +25,25 @@ if TYPE_CHECKING:
     from ..delivery import EventQueue
 
 
+class _EndingInput:
+    """
+    A GameState flag the endings depend on: setting it invalidates the
+    state's EndingEvaluator.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.attr = f"_{name}"
+
+    def __get__(self, state: GameState | None, owner: type | None = None):
+        if state is None:
+            return self
+        return state.__dict__[self.attr]
+
+    def __set__(self, state: GameState, value: bool) -> None:
+        state.__dict__[self.attr] = value
+        state.endings.invalidate()
+
+
 class GameState:
     """
     Tracks the overall state of the game, including the apartment, hero, and time.
@@ -44,6 +64,11 @@ class GameState:
     event_queue: 'EventQueue' | None
     command_invoker: CommandInvoker
     command_history: CommandHistory
+    endings: EndingEvaluator
+
+    journal_read = _EndingInput()
+    mirror_seen = _EndingInput()
+    device_activated = _EndingInput()
 
     def __init__(self, io: IOInterface | None = None) -> None:
         """
@@ -59,12 +84,13 @@ class GameState:
 
         # Device system (Phase 3)
         self.device_state = DeviceState()
-        self.journal_read: bool = False
-        self.mirror_seen: bool = False
+        self.endings = EndingEvaluator(self)
+        self.journal_read = False
+        self.mirror_seen = False
         self.bedroom_barricaded: bool = False
 
         # Phase 4: Alter Ego AI
-        self.device_activated: bool = False
+        self.device_activated = False
 
         # Phase 5: Endings
         self.game_over: bool = False
@@ -131,8 +157,6 @@ class GameState:
         Check the hero's feel and handle passing out if necessary.
         Checks secret ending conditions before AE runs, and defeat after.
         """
-        from ..endings import GameEndings
-
         if self.hero.feel <= 0:
             self.hero.feel = 0
             self.emit("I'm feeling very tired.  I'm going to pass out.....")
@@ -140,26 +164,42 @@ class GameState:
                 self.emit(".")
                 self.io.sleep(1)
 
-            # Check secret ending BEFORE AE runs
-            if GameEndings.check_secret_ending(self):
+            outcome = self.sleep_cycle()
+            if outcome == "dream":
                 GameEndings.display_dream_confrontation(self.io)
-                self.in_dream_confrontation = True
-                self.hero.feel = self.hero.INITIAL_FEEL
-                return  # Don't run AE, wait for let go / hold on
-
-            # Now run the alterego during his sleep
-            self.alter_ego.run(self)
-
-            # Check defeat after AE runs
-            if self.device_activated:
+            elif outcome == "defeat":
                 GameEndings.display_defeat(self.io)
-                self.game_over = True
-                self.ending_type = "defeat"
-                return
+            else:
+                self.IntroPrompt()
+
+    def sleep_cycle(self) -> str | None:
+        """
+        Run one sleep cycle for a hero who has passed out, without the
+        pass-out and wake-up text.
 
-            # Now that he is finished, reset
+        Returns:
+            "dream" if the secret ending's dream confrontation begins (the AE
+            does not run), "defeat" if the AE activated the device, or None
+            when the hero simply wakes up again.
+        """
+        # Check secret ending BEFORE AE runs
+        if self.endings.secret_ending():
+            self.in_dream_confrontation = True
             self.hero.feel = self.hero.INITIAL_FEEL
-            self.IntroPrompt()
+            return "dream"  # Don't run AE, wait for let go / hold on
+
+        # Now run the alterego during his sleep
+        self.alter_ego.run(self)
+
+        # Check defeat after AE runs
+        if self.device_activated:
+            self.game_over = True
+            self.ending_type = "defeat"
+            return "defeat"
+
+        # Now that he is finished, reset
+        self.hero.feel = self.hero.INITIAL_FEEL
+        return None
 
     def prompt(self) -> str:
         """
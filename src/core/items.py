@@ -12,6 +12,7 @@ from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
 
 from .game_objects import Object, Container, sameroom
+from ..io_interface import Dialogue, run_dialogue
 
 if TYPE_CHECKING:
     from .characters import Hero
@@ -70,6 +71,14 @@ class PhoneNumber:
         """
         return other == self.number
 
+    def Dialogue(self) -> Dialogue:
+        """
+        The call as a dialogue. Numbers that never prompt just Interact().
+        """
+        self.Interact()
+        return
+        yield
+
 
 class StoreNumber(PhoneNumber):
     """
@@ -80,6 +89,12 @@ class StoreNumber(PhoneNumber):
         """
         Handle the interaction when calling the store, including ordering items.
         """
+        run_dialogue(self.Dialogue(), self.gamestate.io)
+
+    def Dialogue(self) -> Dialogue:
+        """
+        The store call as a dialogue: yields each prompt, receives the answer.
+        """
         emit = self.gamestate.emit
         items = self.GetStoreItems()
         self.Greeting()
@@ -87,7 +102,7 @@ class StoreNumber(PhoneNumber):
         for (item, cost) in items.items():
             self.gamestate.io.output(f"{item+'.'*(maxlen-len(item))+'.........'}${cost}.00")
         while True:
-            choice = self.gamestate.io.get_input("> ")
+            choice = yield "> "
             if not choice in (x for (x, _) in items.items()):
                 emit("We don't have that.")
                 continue
@@ -197,12 +212,11 @@ class GroceryNumber(StoreNumber):
         emit("Thanks! We'll get that out to you tomorrow.")
         tomorrow = self.gamestate.watch.curr_time + timedelta(days=1)
 
-        def purchase(_curr_time: datetime, _event_time: datetime) -> None:
-            Food(choice, self.gamestate.apartment.main.fridge,
-                 self.FoodFeel()[choice])
-            self.gamestate.io.output("Food truck order has arrived!")
         if self.gamestate.event_queue is not None:
-            self.gamestate.event_queue.AddEvent(purchase, tomorrow)
+            self.gamestate.event_queue.AddDelivery(
+                self.gamestate.apartment.main.fridge, choice, tomorrow,
+                lambda: Food(choice, None, self.FoodFeel()[choice]),
+                "Food truck order has arrived!", self.GetStoreItems()[choice])
 
 
 class HardwareNumber(StoreNumber):
@@ -253,15 +267,14 @@ class HardwareNumber(StoreNumber):
         emit("Thanks! We'll get that out to you in a couple days.")
         two_days = self.gamestate.watch.curr_time + timedelta(days=2)
 
-        def purchase(_curr_time: datetime, _event_time: datetime) -> None:
-            if choice == 'plywood-sheet':
-                location = self.gamestate.apartment.main.table
-            else:
-                location = self.gamestate.apartment.main.toolbox
+        if choice == 'plywood-sheet':
+            location = self.gamestate.apartment.main.table
+        else:
+            location = self.gamestate.apartment.main.toolbox
 
-            Object(choice, location)
         if self.gamestate.event_queue is not None:
-            self.gamestate.event_queue.AddEvent(purchase, two_days)
+            self.gamestate.event_queue.AddDelivery(location, choice, two_days,
+                                                   cost=self.GetStoreItems()[choice])
 
 
 class ElectronicsNumber(StoreNumber):
@@ -309,10 +322,10 @@ class ElectronicsNumber(StoreNumber):
         emit("We'll ship that out. Should arrive in about 3 days.")
         three_days = self.gamestate.watch.curr_time + timedelta(days=3)
 
-        def purchase(_curr_time: datetime, _event_time: datetime) -> None:
-            Object(choice, self.gamestate.apartment.main.toolbox)
         if self.gamestate.event_queue is not None:
-            self.gamestate.event_queue.AddEvent(purchase, three_days)
+            self.gamestate.event_queue.AddDelivery(self.gamestate.apartment.main.toolbox,
+                                                   choice, three_days,
+                                                   cost=self.GetStoreItems()[choice])
 
 
 # Day-specific responses when the building super answers (Day 4+)
@@ -467,12 +480,6 @@ class Phone(Object):
             SuperNumber("The Super", "198-2888", gamestate)
         ]
 
-    def prompt(self, s: str) -> str:
-        """
-        Prompt the user for input.
-        """
-        return self.gamestate.io.get_input(s)
-
     @sameroom
     def Rolodex(self, hero: 'Hero') -> None:
         """
@@ -483,14 +490,24 @@ class Phone(Object):
         hero.io.output("")
 
     @sameroom
-    def Interact(self, _hero: 'Hero') -> None:
+    def Interact(self, hero: 'Hero') -> None:
         """
         Prompt the user to enter a phone number and handle the call.
         """
-        number = self.prompt("What number?: ")
+        run_dialogue(self.Dialogue(hero), self.gamestate.io)
+
+    def Dialogue(self, hero: 'Hero') -> Dialogue:
+        """
+        The phone call as a dialogue: yields each prompt, receives the answer.
+        """
+        if hero.GetRoom() != self.GetRoom():
+            hero.io.output(f"Must be in the same room as the {self.name}")
+            return
+
+        number = yield "What number?: "
         for phone_number in self.phone_numbers:
             if number == phone_number.number:
-                phone_number.Interact()
+                yield from phone_number.Dialogue()
                 return
 
         self.gamestate.io.output("Who's number is that?")
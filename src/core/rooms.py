@@ -10,11 +10,11 @@ from __future__ import annotations
 from enum import IntEnum
 from typing import TYPE_CHECKING
 
-from .game_objects import Container, Openable
+from .game_objects import Container, Object, Openable
+from .items import Journal, Mirror, Phone, TV
 
 if TYPE_CHECKING:
     from .characters import Hero
-    from .items import Journal, Mirror, Phone, TV
     from .game_world import GameState
 
 
@@ -22,6 +22,7 @@ class Room(Container):
     """
     Represents a room in the apartment.
     """
+    is_room = True
 
     def __init__(self, name: str, parent: Container | None) -> None:
         """
@@ -66,10 +67,6 @@ class MainRoom(Room):
         Initialize the main room with its objects.
         """
         super().__init__(name, parent)
-
-        # Import here to avoid circular imports
-        from .items import Phone, TV
-        
         self.phone = Phone(gamestate, self)
         self.toolbox = Openable("toolbox", self)
         self.fridge = Openable("fridge", self)
@@ -100,9 +97,6 @@ class Bedroom(Room):
         super().__init__(name, parent)
         self.gamestate = gamestate
         self.barricaded: bool = False
-
-        from .items import Journal
-
         self.bookshelf = Container("bookshelf", self)
         self.journal = Journal(self.bookshelf)
 
@@ -127,10 +121,6 @@ class Bathroom(Room):
         """
         super().__init__(name, parent)
         self.gamestate = gamestate
-
-        from .items import Mirror
-        from .game_objects import Object
-
         self.medicine_cabinet = Openable("medicine-cabinet", self)
         self.mirror = Mirror(self, gamestate)
         Object("aspirin", self.medicine_cabinet)
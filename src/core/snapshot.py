@@ -0,0 +1,112 @@
+"""
+snapshot.py
+
+In-place world snapshots for reusing a GameState across many runs.
+
+A WorldSnapshot records the attribute dictionaries of every game object
+reachable from a GameState, plus the contents of the lists, dicts, deques
+and queues they hold. Restoring writes those values back into the very same
+objects, so a pooled world can be reset to its pristine state far more
+cheaply than building a new Apartment, Phone, Hero and command machinery.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from enum import Enum
+from queue import Queue
+from typing import TYPE_CHECKING, Any
+
+from .game_objects import touch_world
+
+if TYPE_CHECKING:
+    from ..io_interface import IOInterface
+    from .game_world import GameState
+
+
+def _is_game_object(value: Any) -> bool:
+    """Whether a value is a stateful object owned by the game package."""
+    return (
+        hasattr(value, "__dict__")
+        and not isinstance(value, (type, Enum))
+        and type(value).__module__.startswith("src.")
+    )
+
+
+class WorldSnapshot:
+    """
+    Snapshot of a GameState that can be restored in place.
+
+    The IO object is never captured: the attribute slots that refer to it
+    are remembered and rebound to the IO passed to restore().
+    """
+
+    def __init__(self, state: GameState) -> None:
+        """
+        Capture the current state of every object reachable from state.
+        """
+        self.state = state
+        self._objects: list[tuple[Any, dict[str, Any]]] = []
+        self._sequences: list[tuple[Any, list[Any]]] = []
+        self._io_slots: list[tuple[Any, str]] = []
+        self._capture(state, state.io, set())
+
+    def _capture(self, root: Any, io: IOInterface, seen: set[int]) -> None:
+        """Walk the object graph from root, recording state as we go."""
+        pending = [root]
+        while pending:
+            value = pending.pop()
+            if id(value) in seen:
+                continue
+            seen.add(id(value))
+
+            if isinstance(value, (list, deque)):
+                self._sequences.append((value, list(value)))
+                pending.extend(value)
+            elif isinstance(value, (dict, set)):
+                self._sequences.append((value, list(value.items()) if isinstance(value, dict)
+                                        else list(value)))
+                pending.extend(value.values() if isinstance(value, dict) else value)
+            elif isinstance(value, tuple):
+                pending.extend(value)
+            elif isinstance(value, Queue):
+                self._sequences.append((value.queue, list(value.queue)))
+                pending.extend(value.queue)
+            elif _is_game_object(value):
+                attributes = dict(value.__dict__)
+                self._objects.append((value, attributes))
+                for name, attribute in attributes.items():
+                    if attribute is io:
+                        self._io_slots.append((value, name))
+                    else:
+                        pending.append(attribute)
+
+    def restore(self, io: IOInterface) -> GameState:
+        """
+        Reset the captured world to the snapshot and bind it to a new IO.
+
+        Returns the (same) GameState object the snapshot was taken from.
+        """
+        for obj, attributes in self._objects:
+            obj.__dict__.clear()
+            obj.__dict__.update(attributes)
+        for container, items in self._sequences:
+            if isinstance(container, list):
+                # Plain list methods: the weight totals in the restored
+                # attribute dicts already account for these contents
+                list.clear(container)
+                list.extend(container, items)
+                continue
+            container.clear()
+            if isinstance(container, dict):
+                container.update(items)
+            elif isinstance(container, set):
+                container.update(items)
+            else:
+                container.extend(items)
+        for obj, name in self._io_slots:
+            setattr(obj, name, io)
+        # Attribute dicts and contents were written directly, bypassing the
+        # property setters and ContentsList
+        touch_world()
+        return self.state
@@ -1,29 +1,384 @@
 from __future__ import annotations
 
+import heapq
 from collections.abc import Callable
-from datetime import datetime
+from functools import partial
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
 
+from .core.game_objects import Object
+
 if TYPE_CHECKING:
+    from .core.game_objects import Container
     from .gamestate import GameState
 
 
+class Order:
+    """
+    An item on its way to a container.
+
+    Attributes:
+        name: Item name
+        container: Where the item will arrive
+        due: When it arrives
+        cost: What was paid for it, for refunds
+        placed_by: Who ordered it: "hero" or "alter-ego"
+        message: Printed when the item arrives, if any
+        sequence: Order in which orders were placed
+        pending: False once delivered or cancelled
+    """
+
+    def __init__(self, queue: EventQueue, name: str, container: Container, due: datetime,
+                 make_item: Callable[[], Object], message: str | None, cost: int,
+                 placed_by: str, sequence: int) -> None:
+        self.queue = queue
+        self.name = name
+        self.container = container
+        self.due = due
+        self.make_item = make_item
+        self.message = message
+        self.cost = cost
+        self.placed_by = placed_by
+        self.sequence = sequence
+        self.pending = True
+        self.batch: DeliveryBatch | None = None
+
+    def cancel(self) -> None:
+        """Cancel the delivery. Safe to call more than once."""
+        self.queue.CancelOrder(self)
+
+    def __repr__(self) -> str:
+        return f"Order({self.name!r}, due={self.due}, placed_by={self.placed_by!r})"
+
+
+class PendingOrders:
+    """
+    Index of undelivered orders by item name, destination and due time.
+
+    Adding and removing an order are O(1); queries only touch the orders
+    under one key of one index.
+    """
+
+    def __init__(self) -> None:
+        # Dicts with None values keep each index in placement order
+        self._by_name: dict[str, dict[Order, None]] = {}
+        self._by_container: dict[Container, dict[Order, None]] = {}
+        self._by_due: dict[datetime, dict[Order, None]] = {}
+        self._count = 0
+        # Total orders ever placed; the next order's sequence number
+        self.placed = 0
+
+    def add(self, order: Order) -> None:
+        self._by_name.setdefault(order.name, {})[order] = None
+        self._by_container.setdefault(order.container, {})[order] = None
+        self._by_due.setdefault(order.due, {})[order] = None
+        self._count += 1
+
+    def remove(self, order: Order) -> None:
+        for index, key in ((self._by_name, order.name), (self._by_container, order.container),
+                           (self._by_due, order.due)):
+            orders = index[key]
+            del orders[order]
+            if not orders:
+                del index[key]
+        self._count -= 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def count(self, name: str) -> int:
+        """Number of pending orders of an item."""
+        return len(self._by_name.get(name, ()))
+
+    def expected(self, name: str | None = None, container: Container | None = None,
+                 placed_by: str | None = None) -> list[Order]:
+        """
+        Pending orders, soonest first, optionally filtered.
+
+        Args:
+            name: Only orders of this item
+            container: Only orders arriving in this container
+            placed_by: Only orders placed by "hero" or "alter-ego"
+        """
+        if name is not None:
+            orders = self._by_name.get(name, {})
+        elif container is not None:
+            orders = self._by_container.get(container, {})
+        else:
+            orders = {order: None for due in sorted(self._by_due) for order in self._by_due[due]}
+        return sorted((order for order in orders
+                       if (container is None or order.container is container)
+                       and (placed_by is None or order.placed_by == placed_by)),
+                      key=lambda order: (order.due, order.sequence))
+
+    def due_at(self, time: datetime) -> list[Order]:
+        """Pending orders arriving at exactly this time."""
+        return list(self._by_due.get(time, ()))
+
+
+class DeliveryBatch:
+    """
+    Items arriving in the same container at the same time.
+
+    Queued like any other event action. When it fires, every item is
+    built, the whole batch is added to the container in one go, and then
+    each item's arrival message (if any) is printed in the order the items
+    were ordered.
+    """
+
+    def __init__(self, queue: EventQueue, container: Container) -> None:
+        self.queue = queue
+        self.container = container
+        self.orders: dict[Order, None] = {}
+        self.event: ScheduledEvent | None = None
+
+    def add(self, order: Order) -> None:
+        order.batch = self
+        self.orders[order] = None
+
+    def __call__(self, _curr_time: datetime, _event_time: datetime) -> None:
+        orders = list(self.orders)
+        arrived = [order.make_item() for order in orders]
+        for item in arrived:
+            item.parent = self.container
+        self.container.contents.extend(arrived)
+        for order in orders:
+            order.pending = False
+            self.queue.orders.remove(order)
+
+        for order in orders:
+            if order.message:
+                self.queue.state.io.output(order.message)
+
+
+class ScheduledEvent:
+    """
+    Handle for an event in an EventQueue.
+
+    Attributes:
+        action: Called as action(current time, fire time) when it fires
+        next_fire: When it fires next, or None once it has finished or
+            been cancelled
+        interval: Time between firings for a recurring event, else None
+        cancelled: Whether cancel() has been called
+    """
+
+    def __init__(self, queue: EventQueue, action: Callable[[datetime, datetime], None],
+                 interval: timedelta | None) -> None:
+        self.queue = queue
+        self.action = action
+        self.next_fire: datetime | None = None
+        self.interval = interval
+        self.cancelled = False
+        # Scheduling order; events due together fire in this order
+        self.order = 0
+
+    def cancel(self) -> None:
+        """Stop the event from firing (again). Safe to call more than once."""
+        self.queue.Cancel(self)
+
+
 class EventQueue:
+    """
+    Calendar of scheduled events keyed on hour-long buckets of game time.
+
+    Examine() compares the clock against the earliest fire time, so turns
+    on which nothing is due cost a single comparison. Events that come due
+    together fire in the order they were scheduled.
+    """
+
     def __init__(self, state: GameState) -> None:
-        self.queue: list[tuple[Callable[[datetime, datetime], None], datetime]] = []
         self.state = state
+        self._buckets: dict[int, list[ScheduledEvent]] = {}
+        # Min-heap of bucket keys; keys of emptied buckets are skipped lazily
+        self._bucket_keys: list[int] = []
+        self._next_time: datetime | None = None
+        self._last: ScheduledEvent | None = None
+        self._scheduled = 0
+        self.orders = PendingOrders()
+
+    @property
+    def queue(self) -> list[tuple[Callable[[datetime, datetime], None], datetime]]:
+        """Pending (action, fire time) pairs in scheduling order."""
+        pending = sorted((event for bucket in self._buckets.values() for event in bucket),
+                         key=lambda event: event.order)
+        return [(event.action, event.next_fire) for event in pending]
+
+    def AddEvent(self, action: Callable[[datetime, datetime], None],
+                 timeToFire: datetime) -> ScheduledEvent:
+        return self._schedule(action, timeToFire, None)
+
+    def AddRecurringEvent(self, action: Callable[[datetime, datetime], None],
+                          firstFire: datetime, interval: timedelta) -> ScheduledEvent:
+        """
+        Schedule an event that fires at firstFire and then every interval.
+
+        Returns a handle whose cancel() stops further firings.
+        """
+        if interval <= timedelta(0):
+            raise ValueError("Recurring events need a positive interval")
+        return self._schedule(action, firstFire, interval)
+
+    def AddDelivery(self, container: Container, name: str, timeToFire: datetime,
+                    make_item: Callable[[], Object] | None = None,
+                    message: str | None = None, cost: int = 0,
+                    placed_by: str = "hero") -> Order:
+        """
+        Schedule an item to arrive in container at timeToFire.
+
+        Deliveries to the same container at the same time are merged into
+        one DeliveryBatch, as long as nothing else was scheduled in between,
+        so firing order (and output order) is unchanged.
+
+        Args:
+            container: Where the item arrives
+            name: Item name
+            timeToFire: When the item arrives
+            make_item: Builds the item with no parent (default: a plain Object)
+            message: Printed when the item arrives
+            cost: What was paid, so a cancellation can refund it
+            placed_by: "hero" or "alter-ego"
+
+        Returns:
+            The pending Order, which is also indexed in self.orders
+        """
+        if make_item is None:
+            make_item = partial(Object, name, None)
+        order = Order(self, name, container, timeToFire, make_item, message, cost, placed_by,
+                      self.orders.placed)
+        self.orders.placed += 1
+        self.orders.add(order)
+
+        last = self._last
+        if (last is not None and last.next_fire == timeToFire
+                and isinstance(last.action, DeliveryBatch)
+                and last.action.container is container):
+            last.action.add(order)
+            return order
+        batch = DeliveryBatch(self, container)
+        batch.add(order)
+        batch.event = self.AddEvent(batch, timeToFire)
+        return order
+
+    def CancelOrder(self, order: Order) -> None:
+        """Cancel a pending delivery; does nothing once it has arrived or been cancelled."""
+        if not order.pending:
+            return
+        order.pending = False
+        self.orders.remove(order)
+        batch = order.batch
+        if batch is not None:
+            del batch.orders[order]
+            if not batch.orders and batch.event is not None:
+                batch.event.cancel()
+
+    def Cancel(self, event: ScheduledEvent) -> None:
+        """
+        Stop a scheduled event, including a recurring one that is firing
+        right now or one due in the batch Examine() is firing.
+        """
+        event.cancelled = True
+        if event.next_fire is None:
+            return
+        key = _bucket_key(event.next_fire)
+        bucket = self._buckets[key]
+        bucket.remove(event)
+        if not bucket:
+            del self._buckets[key]
+        if event is self._last:
+            self._last = None
+        if event.next_fire == self._next_time:
+            self._refresh_next_time()
+        event.next_fire = None
+
+    def NextEventTime(self) -> datetime | None:
+        """Return the earliest scheduled fire time, or None if nothing is queued."""
+        return self._next_time
+
+    def Examine(self) -> int:
+        """
+        Fire every event that is due by the current game time.
+
+        Recurring events are rescheduled after they fire. Events scheduled
+        while firing wait for the next Examine(), even if already due.
+
+        Returns the number of events fired.
+        """
+        now = self.state.watch.curr_time
+        if self._next_time is None or now < self._next_time:
+            return 0
+
+        due: list[ScheduledEvent] = []
+        now_key = _bucket_key(now)
+        while self._bucket_keys and self._bucket_keys[0] <= now_key:
+            key = heapq.heappop(self._bucket_keys)
+            bucket = self._buckets.pop(key, None)
+            if bucket is None:
+                continue
+            later = [event for event in bucket if event.next_fire > now]
+            due.extend(event for event in bucket if event.next_fire <= now)
+            if later:
+                # Only the current hour can still hold events that are not due
+                self._buckets[key] = later
+                heapq.heappush(self._bucket_keys, key)
+                break
+        due.sort(key=lambda event: event.order)
+        # Taken out of the calendar before any fires, so an action that
+        # cancels another due event finds it unscheduled (see Cancel)
+        fire_times = []
+        for event in due:
+            fire_times.append(event.next_fire)
+            event.next_fire = None
+            if event is self._last:
+                self._last = None
+        self._refresh_next_time()
+
+        fired = 0
+        for event, fire_time in zip(due, fire_times):
+            if event.cancelled:
+                continue
+            event.action(now, fire_time)
+            fired += 1
+            if event.interval is not None and not event.cancelled:
+                self._add(event, fire_time + event.interval)
+        return fired
+
+    def _schedule(self, action: Callable[[datetime, datetime], None], timeToFire: datetime,
+                  interval: timedelta | None) -> ScheduledEvent:
+        event = ScheduledEvent(self, action, interval)
+        self._add(event, timeToFire)
+        return event
+
+    def _add(self, event: ScheduledEvent, timeToFire: datetime) -> None:
+        event.next_fire = timeToFire
+        event.order = self._scheduled
+        self._scheduled += 1
+        key = _bucket_key(timeToFire)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            self._buckets[key] = [event]
+            heapq.heappush(self._bucket_keys, key)
+        else:
+            bucket.append(event)
+        if self._next_time is None or timeToFire < self._next_time:
+            self._next_time = timeToFire
+        self._last = event
 
-    def AddEvent(self, action: Callable[[datetime, datetime], None], timeToFire: datetime) -> None:
-        self.queue.append((action, timeToFire))
+    def _refresh_next_time(self) -> None:
+        """Recompute the earliest fire time from the first non-empty bucket."""
+        while self._bucket_keys and self._bucket_keys[0] not in self._buckets:
+            heapq.heappop(self._bucket_keys)
+        if self._bucket_keys:
+            bucket = self._buckets[self._bucket_keys[0]]
+            self._next_time = min(event.next_fire for event in bucket)
+        else:
+            self._next_time = None
 
-    def Examine(self) -> None:
-        toFire = [(action, time) for (action, time) in self.queue if
-                  self.state.watch.curr_time >= time]
 
-        rem = [(action, time) for (action, time) in self.queue if
-               self.state.watch.curr_time < time]
+_EPOCH = datetime(1970, 1, 1)
+_BUCKET = timedelta(hours=1)
 
-        self.queue = rem
 
-        for action, time in toFire:
-            action(self.state.watch.curr_time, time)
+def _bucket_key(time: datetime) -> int:
+    """Calendar bucket (hours since the epoch) holding a fire time."""
+    return (time - _EPOCH) // _BUCKET
@@ -9,6 +9,7 @@ Also handles the dream confrontation sequence that gates the secret ending.
 
 from __future__ import annotations
 
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -158,6 +159,24 @@ class GameEndings:
 
         return None
 
+    @staticmethod
+    def conclude(gamestate: GameState, ending: str) -> None:
+        """
+        Display an ending returned by check_ending and end the game.
+
+        Args:
+            gamestate: The game to end
+            ending: "victory", "partial_victory" or "defeat"
+        """
+        if ending == "victory":
+            GameEndings.display_victory(gamestate.io)
+        elif ending == "partial_victory":
+            GameEndings.display_partial_victory(gamestate.io)
+        elif ending == "defeat":
+            GameEndings.display_defeat(gamestate.io)
+        gamestate.game_over = True
+        gamestate.ending_type = ending
+
     @staticmethod
     def check_secret_ending(gamestate: GameState) -> bool:
         """
@@ -210,3 +229,61 @@ class GameEndings:
         io.output("")
         io.output(SECRET_ENDING_TEXT)
         io.output("")
+
+
+# ------------------------------------------------------------------ #
+#                         Ending evaluator                            #
+# ------------------------------------------------------------------ #
+
+class EndingEvaluator:
+    """
+    Cached check_ending / check_secret_ending results for one game.
+
+    The endings depend only on the day, the device components, journal_read,
+    mirror_seen and device_activated. The GameState and its DeviceState call
+    invalidate() when one of those changes, and the day is covered by
+    remembering when the current day started and ends, so asking for the
+    ending between changes is a flag check and a time comparison.
+    """
+
+    def __init__(self, gamestate: GameState) -> None:
+        """
+        Initialize the evaluator and subscribe to the device state.
+
+        Args:
+            gamestate: The game to evaluate (its device_state must exist)
+        """
+        self.gamestate = gamestate
+        self.evaluations = 0
+        self._stale = True
+        self._day_start = datetime.min
+        self._day_end = datetime.min
+        self._ending: str | None = None
+        self._secret = False
+        gamestate.device_state.subscribe(self.invalidate)
+
+    def invalidate(self) -> None:
+        """Note that an ending input changed; the next query re-evaluates."""
+        self._stale = True
+
+    def _refresh(self) -> None:
+        """Re-evaluate if an input changed or the day rolled over."""
+        now = self.gamestate.watch.curr_time
+        if not self._stale and self._day_start <= now < self._day_end:
+            return
+        self._day_start = datetime.combine(now.date(), datetime.min.time())
+        self._day_end = self._day_start + timedelta(days=1)
+        self._ending = GameEndings.check_ending(self.gamestate)
+        self._secret = GameEndings.check_secret_ending(self.gamestate)
+        self._stale = False
+        self.evaluations += 1
+
+    def ending(self) -> str | None:
+        """The ending GameEndings.check_ending would return right now."""
+        self._refresh()
+        return self._ending
+
+    def secret_ending(self) -> bool:
+        """What GameEndings.check_secret_ending would return right now."""
+        self._refresh()
+        return self._secret
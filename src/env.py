@@ -0,0 +1,363 @@
+"""
+env.py
+
+Gym-style environments for training policies against the game.
+
+A GameEnv wraps one game: reset() starts a new episode and step() plays one
+line of input through the same turn functions as the game loop, returning
+(observation, reward, done, info). A VectorEnv steps N of them together and
+returns batched observations, optionally spread over worker processes.
+
+Observations are fixed-size numeric vectors (see OBSERVATION_FIELDS): the
+hero's room, a bitmask of the items carried, feel, balance, day, the built
+device components and whether the dream confrontation is on. Rewards come
+from the ending GameEndings concluded with, paid on the final step.
+
+Each environment builds its world once and resets by restoring a snapshot
+of it, so episodes do not rebuild the Apartment. Nothing outside the
+standard library is needed; with NumPy installed VectorEnv returns arrays.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+from . import gameloop
+from .action_space import legal_actions
+from .core.device_state import DeviceState
+from .core.items import ElectronicsNumber, GroceryNumber, HardwareNumber
+from .core.snapshot import WorldSnapshot
+from .io_interface import IOInterface
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batches are then lists of lists
+    np = None
+
+if TYPE_CHECKING:
+    from .core.game_world import GameState
+
+ROOMS: tuple[str, ...] = ("main", "bedroom", "bathroom", "closet")
+
+# Everything the hero can end up carrying: store stock, the items found in
+# the apartment and the debug/AE-built items
+INVENTORY_ITEMS: tuple[str, ...] = tuple(sorted(
+    {item for store in (GroceryNumber, HardwareNumber, ElectronicsNumber)
+     for item in store("", "", None).GetStoreItems()}
+    | {"watch", "journal", "aspirin", "check", "hammer", "box-of-nails",
+       "plywood-sheet", "ice-cubes", "wire-cutters"}
+    | set(DeviceState.COMPONENTS)
+))
+
+# Observation layout, in order
+OBSERVATION_FIELDS: tuple[str, ...] = (
+    tuple(f"room:{room}" for room in ROOMS)
+    + tuple(f"carrying:{item}" for item in INVENTORY_ITEMS)
+    + ("feel", "balance", "day")
+    + tuple(f"built:{component}" for component in DeviceState.COMPONENTS)
+    + ("dream",)
+)
+OBSERVATION_SIZE = len(OBSERVATION_FIELDS)
+
+# Reward paid on the step an episode ends with each ending
+ENDING_REWARDS: dict[str | None, float] = {
+    "victory": 1.0,
+    "secret": 1.0,
+    "partial_victory": 0.5,
+    "defeat": -1.0,
+}
+
+# Answers given to prompts the action did not answer itself
+DEFAULT_ANSWERS: dict[str, str] = {
+    "How many hours?: ": "1",
+}
+
+# An action: an index into legal_actions(state), an input line, or an input
+# line followed by the answers to the prompts it raises
+Action = int | str | Sequence[str]
+
+_ROOM_INDEX = {room: i for i, room in enumerate(ROOMS)}
+_ITEM_INDEX = {item: len(ROOMS) + i for i, item in enumerate(INVENTORY_ITEMS)}
+_FEEL = len(ROOMS) + len(INVENTORY_ITEMS)
+
+
+def observe(state: GameState) -> list[float]:
+    """
+    Encode a game as a fixed-size vector laid out as OBSERVATION_FIELDS.
+    """
+    obs = [0.0] * OBSERVATION_SIZE
+    room = _ROOM_INDEX.get(state.hero.GetRoom().name)
+    if room is not None:
+        obs[room] = 1.0
+    for item in state.hero.contents:
+        index = _ITEM_INDEX.get(item.name)
+        if index is not None:
+            obs[index] = 1.0
+    obs[_FEEL] = float(state.hero.feel)
+    obs[_FEEL + 1] = float(state.hero.curr_balance)
+    obs[_FEEL + 2] = float(state.get_current_day())
+    for i, component in enumerate(DeviceState.COMPONENTS):
+        obs[_FEEL + 3 + i] = float(state.device_state.is_component_built(component))
+    obs[-1] = float(state.in_dream_confrontation)
+    return obs
+
+
+class _EnvIO(IOInterface):
+    """
+    Collects a step's output and answers its prompts from the action.
+
+    A prompt with no answer left falls back to DEFAULT_ANSWERS; otherwise
+    EOFError is raised, which fails the command like a hang-up.
+    """
+
+    def __init__(self) -> None:
+        self.messages: list[str] = []
+        self.answers: list[str] = []
+
+    def output(self, message: str) -> None:
+        if message:
+            self.messages.append(message)
+
+    def get_input(self, prompt: str) -> str:
+        if self.answers:
+            return self.answers.pop(0)
+        if prompt in DEFAULT_ANSWERS:
+            return DEFAULT_ANSWERS[prompt]
+        raise EOFError(f"No answer for prompt {prompt!r}")
+
+    def sleep(self, seconds: float) -> None:
+        pass
+
+
+class GameEnv:
+    """
+    One game as a reset/step environment.
+
+    step() also accepts actions after the episode is over, but they do
+    nothing; call reset() to start the next episode.
+    """
+
+    def __init__(self) -> None:
+        self.io = _EnvIO()
+        self.state = gameloop.new_world(self.io)
+        gameloop.schedule_checks(self.state)
+        self._snapshot = WorldSnapshot(self.state)
+        self.done = False
+
+    def legal_actions(self) -> tuple[str, ...]:
+        """The input lines an agent can choose from (see action_space)."""
+        return legal_actions(self.state).actions
+
+    def reset(self) -> tuple[list[float], dict[str, Any]]:
+        """
+        Restore the pristine world and play up to the first prompt.
+
+        Returns:
+            (observation, info) with the intro text in info["messages"]
+        """
+        self.io.messages = []
+        self.io.answers = []
+        self._snapshot.restore(self.io)
+        self.state.IntroPrompt()
+        self.done = not gameloop.begin_turn(self.state)
+        return observe(self.state), {"messages": self._take_messages()}
+
+    def step(self, action: Action) -> tuple[list[float], float, bool, dict[str, Any]]:
+        """
+        Play one line of input and run the game up to the next prompt.
+
+        Returns:
+            (observation, reward, done, info); info holds the step's
+            "messages", the "input" played and, once done, the "ending"
+        """
+        line = self._resolve(action)
+        reward = 0.0
+        if not self.done:
+            gameloop.play_turn(self.state, line)
+            self.io.answers = []
+            self.done = not gameloop.begin_turn(self.state)
+            if self.done:
+                reward = ENDING_REWARDS.get(self.state.ending_type, 0.0)
+        info: dict[str, Any] = {"messages": self._take_messages(), "input": line}
+        if self.done:
+            info["ending"] = self.state.ending_type
+        return observe(self.state), reward, self.done, info
+
+    def _resolve(self, action: Action) -> str:
+        """Turn an action into its input line, queueing any prompt answers."""
+        if isinstance(action, str):
+            return action
+        if isinstance(action, Sequence):
+            line, *answers = action
+            self.io.answers = list(answers)
+            return line
+        # Any integer, including NumPy's
+        return legal_actions(self.state)[int(action)]
+
+    def _take_messages(self) -> list[str]:
+        messages, self.io.messages = self.io.messages, []
+        return messages
+
+
+def _batch(rows: list[list[float]]) -> Any:
+    """Stack observations: an (N, OBSERVATION_SIZE) array with NumPy, else rows."""
+    if np is not None:
+        return np.asarray(rows, dtype=np.float32).reshape(len(rows), OBSERVATION_SIZE)
+    return rows
+
+
+class _Shard:
+    """A run of environments stepped together, in this or a worker process."""
+
+    def __init__(self, count: int) -> None:
+        self.envs = [GameEnv() for _ in range(count)]
+
+    def reset(self) -> list[tuple[list[float], dict[str, Any]]]:
+        return [env.reset() for env in self.envs]
+
+    def step(self, actions: list[Action]) -> list[tuple[Any, ...]]:
+        """Step every environment, starting a new episode for those that end."""
+        results = []
+        for env, action in zip(self.envs, actions):
+            obs, reward, done, info = env.step(action)
+            if done:
+                info["final_observation"] = obs
+                obs, reset_info = env.reset()
+                info["reset_messages"] = reset_info["messages"]
+            results.append((obs, reward, done, info))
+        return results
+
+    def legal_actions(self) -> list[tuple[str, ...]]:
+        return [env.legal_actions() for env in self.envs]
+
+
+def _worker(connection: Any, count: int) -> None:
+    """Serve (method, args) requests for one shard until told to close."""
+    shard = _Shard(count)
+    try:
+        while True:
+            method, args = connection.recv()
+            if method == "close":
+                break
+            connection.send(getattr(shard, method)(*args))
+    finally:
+        connection.close()
+
+
+class VectorEnv:
+    """
+    N games stepped in lockstep with batched observations.
+
+    Episodes that end are reset automatically: their step result carries
+    the ending's reward and done=True, the next episode's first observation,
+    and the final observation in info["final_observation"].
+
+    With workers > 0 the games are split into that many shards, each run
+    in its own process, and every shard steps in parallel.
+    """
+
+    def __init__(self, num_envs: int, workers: int = 0) -> None:
+        """
+        Initialize the environments.
+
+        Args:
+            num_envs: Number of games
+            workers: Worker processes to shard the games over (0 steps them
+                all in this process)
+
+        Raises:
+            ValueError: If num_envs is not positive or workers is negative
+        """
+        if num_envs <= 0:
+            raise ValueError("VectorEnv needs at least one environment")
+        if workers < 0:
+            raise ValueError("workers must not be negative")
+        self.num_envs = num_envs
+        self._shard: _Shard | None = None
+        self._connections: list[Any] = []
+        self._processes: list[Any] = []
+        self._sizes: list[int] = []
+        if workers == 0:
+            self._shard = _Shard(num_envs)
+            self._sizes = [num_envs]
+            return
+
+        workers = min(workers, num_envs)
+        context = multiprocessing.get_context()
+        for i in range(workers):
+            size = num_envs // workers + (i < num_envs % workers)
+            parent, child = context.Pipe()
+            process = context.Process(target=_worker, args=(child, size), daemon=True)
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._processes.append(process)
+            self._sizes.append(size)
+
+    def _call(self, method: str, args_per_shard: list[tuple[Any, ...]]) -> list[Any]:
+        """Run a shard method on every shard and concatenate the results."""
+        if self._shard is not None:
+            return getattr(self._shard, method)(*args_per_shard[0])
+        for connection, args in zip(self._connections, args_per_shard):
+            connection.send((method, args))
+        results: list[Any] = []
+        for connection in self._connections:
+            results.extend(connection.recv())
+        return results
+
+    def _split(self, actions: Sequence[Action]) -> list[tuple[Any, ...]]:
+        chunks, start = [], 0
+        for size in self._sizes:
+            chunks.append((list(actions[start:start + size]),))
+            start += size
+        return chunks
+
+    def reset(self) -> tuple[Any, list[dict[str, Any]]]:
+        """
+        Start a new episode in every game.
+
+        Returns:
+            (observations, infos)
+        """
+        results = self._call("reset", [()] * len(self._sizes))
+        return _batch([obs for obs, _ in results]), [info for _, info in results]
+
+    def step(self, actions: Sequence[Action]) -> tuple[Any, list[float], list[bool],
+                                                       list[dict[str, Any]]]:
+        """
+        Play one action in every game.
+
+        Returns:
+            (observations, rewards, dones, infos)
+
+        Raises:
+            ValueError: If the number of actions is not num_envs
+        """
+        if len(actions) != self.num_envs:
+            raise ValueError(f"Expected {self.num_envs} actions, got {len(actions)}")
+        results = self._call("step", self._split(actions))
+        return (_batch([obs for obs, _, _, _ in results]),
+                [reward for _, reward, _, _ in results],
+                [done for _, _, done, _ in results],
+                [info for _, _, _, info in results])
+
+    def legal_actions(self) -> list[tuple[str, ...]]:
+        """Each game's legal input lines; int actions index into these."""
+        return self._call("legal_actions", [()] * len(self._sizes))
+
+    def close(self) -> None:
+        """Stop the worker processes, if any."""
+        for connection in self._connections:
+            connection.send(("close", ()))
+            connection.close()
+        for process in self._processes:
+            process.join()
+        self._connections, self._processes = [], []
+
+    def __enter__(self) -> VectorEnv:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,227 @@
+"""
+fast_forward.py
+
+Batched sleep-cycle fast-forward for idle heroes.
+
+fast_forward() advances a game exactly as if the hero kept pondering one
+hour at a time (the cheapest way to burn feel), but without going through
+the parser, the command invoker or an hourly loop: it jumps straight to the
+hours at which scheduled events become due, the day-7 ending check and each
+pass-out, and runs the sleep cycle (secret-ending check, AlterEgo phase,
+defeat check) without the pass-out and wake-up text. Anything the events
+or the AlterEgo print is collected into the returned summary instead.
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from .endings import GameEndings
+from .io_interface import IOInterface
+
+if TYPE_CHECKING:
+    from .core.game_world import GameState
+
+# Feel lost per hour of pondering (PonderCommand)
+FEEL_PER_HOUR = 10
+_HOUR = timedelta(hours=1)
+
+
+class FastForwardSummary:
+    """
+    What happened during a fast-forward.
+
+    Attributes:
+        start_time: Game time when the fast-forward began
+        end_time: Game time when it stopped
+        cycles: Number of sleep cycles (pass-outs) completed
+        phases: AlterEgo phase after each completed cycle
+        events_fired: Number of scheduled events that fired
+        orders_placed: Items the AlterEgo ordered, in order
+        components_built: Device components built, in order
+        balance_change: Change in the hero's balance
+        stopped_by: "cycles", "until", "ending" or "dream"
+        ending: The ending reached, if any
+        messages: Non-blank output from events and the AlterEgo
+    """
+
+    def __init__(self, start_time: datetime) -> None:
+        self.start_time = start_time
+        self.end_time = start_time
+        self.cycles = 0
+        self.phases: list[int] = []
+        self.events_fired = 0
+        self.orders_placed: list[str] = []
+        self.components_built: list[str] = []
+        self.balance_change = 0
+        self.stopped_by = ""
+        self.ending: str | None = None
+        self.messages: list[str] = []
+
+    def __repr__(self) -> str:
+        return (f"FastForwardSummary(cycles={self.cycles}, end_time={self.end_time}, "
+                f"stopped_by={self.stopped_by!r}, ending={self.ending!r})")
+
+
+class _CaptureIO(IOInterface):
+    """Collects output during a fast-forward; input is not available."""
+
+    def __init__(self) -> None:
+        self.messages: list[str] = []
+
+    def output(self, message: str) -> None:
+        if message:
+            self.messages.append(message)
+
+    def get_input(self, prompt: str) -> str:
+        raise RuntimeError("Fast-forward cannot answer prompts")
+
+    def sleep(self, seconds: float) -> None:
+        pass
+
+
+def _fire_due(state: GameState, summary: FastForwardSummary) -> None:
+    """Top of a game loop: fire every event that is due by now."""
+    queue = state.event_queue
+    if queue is None:
+        return
+    summary.events_fired += queue.Examine()
+
+
+def _advance_awake(state: GameState, hours: int, summary: FastForwardSummary) -> None:
+    """
+    Ponder for hours, one hour at a time, without a pass-out.
+
+    Only the hourly loop tops at which some event is due are visited.
+    """
+    start_time = state.watch.curr_time
+    start_feel = state.hero.feel
+    end_time = start_time + hours * _HOUR
+    queue = state.event_queue
+    while queue is not None:
+        next_time = queue.NextEventTime()
+        if next_time is None or next_time > end_time:
+            break
+        hour = max(1, math.ceil((next_time - start_time) / _HOUR))
+        state.watch.curr_time = start_time + hour * _HOUR
+        state.hero.feel = start_feel - FEEL_PER_HOUR * hour
+        _fire_due(state, summary)
+    state.watch.curr_time = end_time
+    state.hero.feel = start_feel - FEEL_PER_HOUR * hours
+
+
+def _hours_until_day(state: GameState, day: int) -> float:
+    """Hours from now until the clock first reaches the start of a game day."""
+    start = state.watch.curr_time
+    days_ahead = day - state.get_current_day()
+    target = datetime.combine(start.date() + timedelta(days=days_ahead), datetime.min.time())
+    return (target - start) / _HOUR
+
+
+def fast_forward(state: GameState, cycles: int | None = None,
+                 until: datetime | None = None) -> FastForwardSummary:
+    """
+    Advance an idle hero through sleep cycles in one call.
+
+    The result matches entering "ponder" / "1" repeatedly: events fire at
+    the hourly loop tops they become due at, the day-7 ending is checked at
+    each loop top, and whenever feel runs out the sleep cycle runs and the
+    loop top after waking fires events and checks the ending again.
+
+    Args:
+        state: The game to advance (with its event queue set)
+        cycles: Stop after this many sleep cycles
+        until: Stop at the last hourly loop top at or before this time (a
+            sleep cycle that starts before it always runs to completion)
+
+    Returns:
+        A FastForwardSummary. Stops early at an ending or when the dream
+        confrontation begins, since both need the player.
+
+    Raises:
+        ValueError: If neither cycles nor until is given
+    """
+    if cycles is None and until is None:
+        raise ValueError("fast_forward needs cycles or until")
+
+    summary = FastForwardSummary(state.watch.curr_time)
+    start_balance = state.hero.curr_balance
+    start_built = set(state.device_state.get_built_components())
+
+    capture = _CaptureIO()
+    io, hero_io = state.io, state.hero.io
+    state.io = state.hero.io = capture
+    try:
+        summary.stopped_by = _run_cycles(state, cycles, until, summary)
+    finally:
+        state.io, state.hero.io = io, hero_io
+
+    summary.end_time = state.watch.curr_time
+    summary.balance_change = state.hero.curr_balance - start_balance
+    summary.components_built = [name for name in state.device_state.get_built_components()
+                                if name not in start_built]
+    summary.ending = state.ending_type
+    summary.messages = capture.messages
+    return summary
+
+
+def _run_cycles(state: GameState, cycles: int | None, until: datetime | None,
+                summary: FastForwardSummary) -> str:
+    """The fast-forward loop; returns why it stopped."""
+    while True:
+        if state.game_over:
+            return "ending"
+        if state.in_dream_confrontation:
+            return "dream"
+        if cycles is not None and summary.cycles >= cycles:
+            return "cycles"
+        if until is not None and state.watch.curr_time >= until:
+            return "until"
+
+        # Ponders needed to run out of feel; the last one causes the pass-out
+        ponders = max(1, math.ceil(state.hero.feel / FEEL_PER_HOUR))
+        awake_hours = ponders - 1
+        stop = None
+        if until is not None and state.watch.curr_time + ponders * _HOUR > until:
+            awake_hours = min(awake_hours,
+                              int((until - state.watch.curr_time) // _HOUR))
+            stop = "until"
+        week_hours = max(1, math.ceil(_hours_until_day(state, 7)))
+        if week_hours <= awake_hours:
+            awake_hours = week_hours
+            stop = "ending"
+
+        _advance_awake(state, awake_hours, summary)
+        if stop == "ending":
+            GameEndings.conclude(state, state.endings.ending())
+            return stop
+        if stop == "until":
+            return stop
+
+        # The final ponder: pass out and sleep
+        state.watch.curr_time += _HOUR
+        state.hero.feel -= FEEL_PER_HOUR
+        placed = state.event_queue.orders.placed if state.event_queue is not None else 0
+        outcome = state.sleep_cycle()
+        if state.event_queue is not None:
+            # AE orders take a day to arrive, so they are all still pending
+            summary.orders_placed.extend(
+                order.name for order in state.event_queue.orders.expected(placed_by="alter-ego")
+                if order.sequence >= placed)
+        summary.cycles += 1
+        summary.phases.append(state.alter_ego.current_phase)
+        if outcome == "dream":
+            GameEndings.display_dream_confrontation(state.io)
+            return "dream"
+        if outcome == "defeat":
+            GameEndings.display_defeat(state.io)
+            return "ending"
+
+        # Top of the loop after waking up
+        _fire_due(state, summary)
+        ending = state.endings.ending()
+        if ending:
+            GameEndings.conclude(state, ending)
+            return "ending"
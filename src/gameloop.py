@@ -1,84 +1,312 @@
 from __future__ import annotations
 
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
 
 from . import inputparser
-from . import delivery
+from .commands.command_invoker import AsyncCommandInvoker
 from .gamestate import GameState, Object
-from .io_interface import IOInterface, ConsoleIO
+from .io_interface import AsyncIOInterface, IOInterface, ConsoleIO
 from .endings import GameEndings
-from .commands.game_commands import LetGoCommand, HoldOnCommand
+from .lazy import lazy_module
 
 from .delivery import EventQueue
 
+game_commands = lazy_module(".commands.game_commands", __package__)
 
-def run(io: IOInterface | None = None) -> None:
-    if io is None:
-        io = ConsoleIO()
+if TYPE_CHECKING:
+    from .commands.base_command import BaseCommand, CommandResult
 
+
+def new_world(io: IOInterface) -> GameState:
+    """
+    Build a pristine world: the game state and its (empty) event queue.
+    """
     state = GameState(io)
-    queue = EventQueue(state)
-    state.SetEventQueue(queue)
+    state.SetEventQueue(EventQueue(state))
+    return state
+
 
+def schedule_checks(state: GameState) -> None:
+    """
+    Schedule the fortnightly government check for a new game.
+    """
     def DeliverCheck(currTime: datetime, eventTime: datetime) -> None:
-        io.output("Government check in the mail!")
+        state.io.output("Government check in the mail!")
         Object("check", state.apartment.main.cabinet)
-        queue.AddEvent(DeliverCheck, eventTime + timedelta(weeks=2))
 
-    queue.AddEvent(DeliverCheck, state.watch.curr_time + timedelta(weeks=2))
+    state.event_queue.AddRecurringEvent(DeliverCheck,
+                                        state.watch.curr_time + timedelta(weeks=2),
+                                        timedelta(weeks=2))
+
+
+def begin_turn(state: GameState) -> bool:
+    """
+    Top of the game loop: fire due events and check the day 7+ ending.
+
+    Returns:
+        True if the game goes on and wants the player's next input
+    """
+    if state.game_over:
+        return False
+    state.event_queue.Examine()
+
+    # Day 7+ ending check (before prompt, not during dream)
+    if not state.in_dream_confrontation:
+        ending = state.endings.ending()
+        if ending and not state.game_over:
+            GameEndings.conclude(state, ending)
+            return False
+    return True
+
+
+def input_prompt(state: GameState) -> str:
+    """
+    Ask the player for the turn's input.
+    """
+    if state.in_dream_confrontation:
+        return state.io.get_input("What do you do?: ")
+    return state.prompt()
+
+
+async def input_prompt_async(state: GameState) -> str:
+    """
+    input_prompt() for a session bound to an AsyncIOInterface.
+    """
+    io = state.io
+    if state.in_dream_confrontation:
+        return await io.get_input_async("What do you do?: ")
+    return await io.get_input_async("What do we do next?: ")
+
+
+# Separates the commands of a pipelined input line
+COMMAND_SEPARATOR = ";"
+
+
+def split_commands(userInput: str) -> list[str]:
+    """
+    The commands on an input line, in order, without blank ones.
+    """
+    return [line.strip() for line in userInput.split(COMMAND_SEPARATOR) if line.strip()]
+
+
+class _ChainedIO(IOInterface):
+    """
+    A session's io while a ';' line plays: prompts are answered with the
+    line's next segments, and only once those run out by the player.
+    """
+
+    def __init__(self, inner: IOInterface, segments: deque[str]) -> None:
+        self.inner = inner
+        self.segments = segments
+
+    def output(self, message: str) -> None:
+        self.inner.output(message)
+
+    def get_input(self, prompt: str) -> str:
+        if self.segments:
+            return self.segments.popleft()
+        return self.inner.get_input(prompt)
+
+    async def get_input_async(self, prompt: str) -> str:
+        if self.segments:
+            return self.segments.popleft()
+        return await self.inner.get_input_async(prompt)
+
+    def sleep(self, seconds: float) -> None:
+        self.inner.sleep(seconds)
+
+    def flush(self) -> None:
+        self.inner.flush()
+
+
+@contextmanager
+def _chained(state: GameState, userInput: str) -> Iterator[deque[str]]:
+    """
+    The segments of a ';' line, with the state's io answering prompts from
+    them until the block ends.
+    """
+    # A line of separators alone is as meaningless as an empty one
+    segments = deque(split_commands(userInput) or [""])
+    io, hero_io = state.io, state.hero.io
+    state.io = state.hero.io = _ChainedIO(io, segments)
+    try:
+        yield segments
+    finally:
+        state.io, state.hero.io = io, hero_io
+
+
+def play_command(state: GameState, userInput: str) -> bool:
+    """
+    Parse and execute one command, then handle passing out.
+
+    Returns:
+        True if the command parsed and succeeded
+    """
+    dream = state.in_dream_confrontation
+    command = accept_command(state, inputparser.parse(userInput, state.io, state.apartment))
+    if command is None:
+        return False
+    # Execute command through the command invoker
+    result = state.command_invoker.execute_command(command, state)
+    return report_command(state, command, result, dream)
+
+
+async def play_command_async(state: GameState, userInput: str,
+                             invoker: AsyncCommandInvoker) -> bool:
+    """
+    play_command() for a session bound to an AsyncIOInterface: prompts,
+    from parsing (ponder) or from the command (a phone call), are awaited.
+    """
+    dream = state.in_dream_confrontation
+    parsed = await inputparser.parse_async(userInput, state.io, state.apartment)
+    command = accept_command(state, parsed)
+    if command is None:
+        return False
+    result = await invoker.execute_command_async(command, state)
+    return report_command(state, command, result, dream)
+
+
+def accept_command(state: GameState,
+                   parsed: tuple[bool, BaseCommand | str]) -> BaseCommand | None:
+    """
+    The command to execute for a parsed line, or None once the player has
+    been told why there is none.
+    """
+    ok, command_or_error = parsed
+    io = state.io
+
+    # Dream confrontation: restrict input to let go / hold on
+    if state.in_dream_confrontation:
+        if ok and isinstance(command_or_error, (game_commands.LetGoCommand,
+                                             game_commands.HoldOnCommand)):
+            return command_or_error
+        io.output("The voice echoes in the darkness. What do you do?")
+        io.output("")
+        return None
+
+    if not ok:
+        errMsg = command_or_error
+        io.output(errMsg)
+        io.output("")
+        return None
+    return command_or_error
+
+
+def report_command(state: GameState, command: BaseCommand, result: CommandResult,
+                   dream: bool) -> bool:
+    """
+    Show an executed command's result and handle passing out (not during
+    the dream confrontation, when the command was a dream choice).
+
+    Returns:
+        Whether the command succeeded
+    """
+    io = state.io
+    if dream:
+        if result.message:
+            io.output(result.message)
+        io.output("")
+        return result.success
+
+    # Add successful commands to history for undo/redo
+    if result.success:
+        state.command_history.add_command(command)
+
+    # Display command result message if provided
+    if result.message:
+        io.output(result.message)
+
+    io.output("")
+    state.Examine()
+    return result.success
+
+
+def play_turn(state: GameState, userInput: str) -> None:
+    """
+    Play one line of player input and flush its output once.
+
+    A line may hold several commands separated by ';' ("open toolbox;
+    get hammer from toolbox"). They are played in order as if entered one
+    at a time, with events and ending checks (begin_turn) between them,
+    and the rest are dropped after the first that fails, ends the game or
+    starts the dream confrontation.
+
+    As when typed one at a time, a command that prompts takes its answers
+    from the segments that follow it ("ponder; 3; feel", "call phone;
+    592-2874; duct-tape"), and from the player once the line runs out.
+    """
+    try:
+        if COMMAND_SEPARATOR not in userInput:
+            play_command(state, userInput)
+            return
+        with _chained(state, userInput) as segments:
+            while play_command(state, segments.popleft()) and segments:
+                if state.in_dream_confrontation or not begin_turn(state):
+                    break
+    finally:
+        state.io.flush()
+
+
+def run(io: IOInterface | None = None, state: GameState | None = None) -> None:
+    """
+    Run the game loop until the game ends or input is exhausted.
+
+    A pre-built pristine world (see new_world) may be passed in as state;
+    it must already be bound to io.
+    """
+    if io is None:
+        io = ConsoleIO()
+
+    if state is None:
+        state = new_world(io)
+
+    schedule_checks(state)
+    state.IntroPrompt()
+    try:
+        while begin_turn(state):
+            play_turn(state, input_prompt(state))
+    finally:
+        io.flush()
+
+
+async def play_turn_async(state: GameState, userInput: str,
+                          invoker: AsyncCommandInvoker) -> None:
+    """
+    play_turn() for a session bound to an AsyncIOInterface.
+    """
+    try:
+        if COMMAND_SEPARATOR not in userInput:
+            await play_command_async(state, userInput, invoker)
+            return
+        with _chained(state, userInput) as segments:
+            while await play_command_async(state, segments.popleft(), invoker) and segments:
+                if state.in_dream_confrontation or not begin_turn(state):
+                    break
+    finally:
+        state.io.flush()
+
+
+async def run_async(io: AsyncIOInterface, state: GameState | None = None) -> None:
+    """
+    Run the game loop for a session driven by an asyncio event loop.
+
+    Every prompt (the turn's input, ponder's hours, a phone call's
+    questions) is awaited from io, so one event loop can play many
+    sessions side by side. As with run(), a pristine state bound to io
+    may be passed in.
+    """
+    if state is None:
+        state = new_world(io)
+    invoker = AsyncCommandInvoker()
+
+    schedule_checks(state)
     state.IntroPrompt()
-    while not state.game_over:
-        queue.Examine()
-
-        # Day 7+ ending check (before prompt, not during dream)
-        if not state.in_dream_confrontation:
-            ending = GameEndings.check_ending(state)
-            if ending and not state.game_over:
-                if ending == "victory":
-                    GameEndings.display_victory(io)
-                elif ending == "partial_victory":
-                    GameEndings.display_partial_victory(io)
-                elif ending == "defeat":
-                    GameEndings.display_defeat(io)
-                state.game_over = True
-                state.ending_type = ending
-                break
-
-        # Dream confrontation: restrict input to let go / hold on
-        if state.in_dream_confrontation:
-            userInput = state.io.get_input("What do you do?: ")
-            ok, command_or_error = inputparser.parse(userInput, io)
-            if ok and isinstance(command_or_error, (LetGoCommand, HoldOnCommand)):
-                result = state.command_invoker.execute_command(
-                    command_or_error, state
-                )
-                if result.message:
-                    io.output(result.message)
-                io.output("")
-            else:
-                io.output("The voice echoes in the darkness. What do you do?")
-                io.output("")
-            continue
-
-        # Normal game loop
-        userInput = state.prompt()
-        ok, command_or_error = inputparser.parse(userInput, io)
-        if ok:
-            command = command_or_error
-            # Execute command through the command invoker and add to history
-            result = state.command_invoker.execute_command(command, state)
-
-            # Add successful commands to history for undo/redo
-            if result.success:
-                state.command_history.add_command(command)
-
-            # Display command result message if provided
-            if result.message:
-                io.output(result.message)
-
-            io.output("")
-            state.Examine()
-        else:
-            errMsg = command_or_error
-            io.output(errMsg)
-            io.output("")
+    try:
+        while begin_turn(state):
+            await play_turn_async(state, await input_prompt_async(state), invoker)
+    finally:
+        io.flush()
@@ -1,151 +1,145 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from functools import lru_cache
 from typing import Any, TYPE_CHECKING
-from . import actions
-from .gamestate import GameState
 from .commands.base_command import BaseCommand
-from .commands.game_commands import *
+from .io_interface import Dialogue, run_dialogue, run_dialogue_async
+from .lazy import lazy_module
 
 if TYPE_CHECKING:
-    from .io_interface import IOInterface
+    from functools import _CacheInfo
+    from .core.game_objects import Container
+    from .gamestate import GameState
+    from .io_interface import AsyncIOInterface, IOInterface
+    from .spellcheck import Corrector
+
+# The command implementations are only needed once the first command is
+# parsed, so they are loaded on first use rather than at start-up.
+game_commands = lazy_module(".commands.game_commands", __package__)
+spellcheck = lazy_module(".spellcheck", __package__)
+items = lazy_module(".core.items", __package__)
+device_state = lazy_module(".core.device_state", __package__)
+
+
+def __getattr__(name: str) -> Any:
+    """Keep re-exporting the command classes (e.g. inputparser.PonderCommand)."""
+    if not name.startswith("_"):
+        try:
+            return getattr(game_commands, name)
+        except AttributeError:
+            pass
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-# Command factory functions that return Command objects
+# Command factory functions that return Command objects. Commands that take
+# no arguments and cannot be undone are shared rather than built per parse.
 def create_debug_items_command() -> BaseCommand:
-    return DebugItemsCommand()
+    return game_commands.shared_command(game_commands.DebugItemsCommand)
 
 def create_call_phone_command() -> BaseCommand:
-    return CallPhoneCommand()
+    return game_commands.shared_command(game_commands.CallPhoneCommand)
 
 def create_rolodex_command() -> BaseCommand:
-    return RolodexCommand()
+    return game_commands.shared_command(game_commands.RolodexCommand)
 
 def create_look_at_watch_command() -> BaseCommand:
-    return LookAtWatchCommand()
+    return game_commands.shared_command(game_commands.LookAtWatchCommand)
 
-def create_ponder_command(io: 'IOInterface') -> BaseCommand:
+def ponder_hours(io: 'IOInterface') -> Dialogue:
     # Ponder needs to ask for hours, keep asking until valid input
     while True:
-        hours_str = io.get_input("How many hours?: ")
+        hours_str = yield "How many hours?: "
         try:
             hours = int(hours_str)
             if hours <= 0:
                 raise ValueError()
-            return PonderCommand(hours)
+            return game_commands.PonderCommand(hours)
         except (ValueError, TypeError):
             io.output("What? Give me a number.")
             # Continue the loop to ask again
 
+def create_ponder_command(io: 'IOInterface') -> BaseCommand:
+    return run_dialogue(ponder_hours(io), io)
+
 def create_balance_command() -> BaseCommand:
-    return CheckBalanceCommand()
+    return game_commands.shared_command(game_commands.CheckBalanceCommand)
+
+def create_orders_command() -> BaseCommand:
+    return game_commands.shared_command(game_commands.CheckOrdersCommand)
+
+def create_cancel_order_command(item_name: str) -> BaseCommand:
+    return game_commands.CancelOrderCommand(item_name)
 
 def create_feel_command() -> BaseCommand:
-    return CheckFeelCommand()
+    return game_commands.shared_command(game_commands.CheckFeelCommand)
 
 def create_eat_command(food_name: str) -> BaseCommand:
-    return EatThingCommand(food_name)
+    return game_commands.EatThingCommand(food_name)
 
 def create_examine_command(object_name: str) -> BaseCommand:
-    return ExamineThingCommand(object_name)
+    return game_commands.ExamineThingCommand(object_name)
 
 def create_watch_tv_command(object_name: str) -> BaseCommand:
-    # The original command expects a specific object name but mainly works with "tv"
-    # We'll create a command that checks if the object is "tv"
-    class WatchObjectCommand(BaseCommand):
-        def __init__(self, obj_name: str):
-            super().__init__(f"Watch {obj_name}")
-            self.obj_name = obj_name
-        
-        def execute(self, game_state: 'GameState') -> 'CommandResult':
-            from .commands.base_command import CommandResult
-            if self.obj_name.lower() != 'tv':
-                return CommandResult(
-                    success=False,
-                    message="I don't know how to watch that!  Not for very long, at least."
-                )
-            # Use the WatchTvCommand for TV
-            from .commands.game_commands import WatchTvCommand
-            tv_cmd = WatchTvCommand()
-            return tv_cmd.execute(game_state)
-    
-    return WatchObjectCommand(object_name)
+    return game_commands.WatchObjectCommand(object_name)
 
 def create_open_command(object_name: str) -> BaseCommand:
-    return OpenThingCommand(object_name)
+    return game_commands.OpenThingCommand(object_name)
 
 def create_close_command(object_name: str) -> BaseCommand:
-    return CloseThingCommand(object_name)
+    return game_commands.CloseThingCommand(object_name)
 
 def create_get_object_command(obj_name: str, container_name: str) -> BaseCommand:
-    return GetObjectCommand(obj_name, container_name)
+    return game_commands.GetObjectCommand(obj_name, container_name)
 
 def create_inventory_command() -> BaseCommand:
-    return InventoryCommand()
+    return game_commands.shared_command(game_commands.InventoryCommand)
 
 def create_enter_room_command(room_name: str) -> BaseCommand:
-    return EnterRoomCommand(room_name)
+    return game_commands.EnterRoomCommand(room_name)
 
 def create_nail_self_in_command() -> BaseCommand:
-    return NailSelfInCommand()
+    return game_commands.shared_command(game_commands.NailSelfInCommand)
 
 def create_inspect_room_command() -> BaseCommand:
-    return InspectRoomCommand()
+    return game_commands.shared_command(game_commands.InspectRoomCommand)
 
 def create_mail_check_command() -> BaseCommand:
-    return MailCheckCommand()
+    return game_commands.MailCheckCommand()
 
 def create_undo_command() -> BaseCommand:
-    from .commands.command_history import UndoCommand
-    # Return a command that will get the history from the game state during execution
-    class DeferredUndoCommand(BaseCommand):
-        def __init__(self):
-            super().__init__("Undo last command")
-        
-        def execute(self, game_state: 'GameState') -> 'CommandResult':
-            from .commands.base_command import CommandResult
-            return game_state.command_history.undo(game_state)
-    
-    return DeferredUndoCommand()
+    # Uses the history of whichever game it is executed against
+    return game_commands.shared_command(game_commands.DeferredUndoCommand)
 
 def create_redo_command() -> BaseCommand:
-    from .commands.command_history import RedoCommand
-    # Return a command that will get the history from the game state during execution
-    class DeferredRedoCommand(BaseCommand):
-        def __init__(self):
-            super().__init__("Redo last undone command")
-        
-        def execute(self, game_state: 'GameState') -> 'CommandResult':
-            from .commands.base_command import CommandResult
-            return game_state.command_history.redo(game_state)
-    
-    return DeferredRedoCommand()
+    return game_commands.shared_command(game_commands.DeferredRedoCommand)
 
 def create_ice_bath_command() -> BaseCommand:
-    return TakeIceBathCommand()
+    return game_commands.TakeIceBathCommand()
 
 def create_disassemble_frame_command() -> BaseCommand:
-    return DisassembleFrameCommand()
+    return game_commands.shared_command(game_commands.DisassembleFrameCommand)
 
 def create_cut_wires_command() -> BaseCommand:
-    return CutWiresCommand()
+    return game_commands.shared_command(game_commands.CutWiresCommand)
 
 def create_remove_battery_command() -> BaseCommand:
-    return RemoveBatteryCommand()
+    return game_commands.shared_command(game_commands.RemoveBatteryCommand)
 
 def create_remove_crystal_command() -> BaseCommand:
-    return RemoveCrystalCommand()
+    return game_commands.shared_command(game_commands.RemoveCrystalCommand)
 
 def create_barricade_bedroom_command() -> BaseCommand:
-    return BarricadeBedroomCommand()
+    return game_commands.shared_command(game_commands.BarricadeBedroomCommand)
 
 def create_read_journal_command() -> BaseCommand:
-    return ReadJournalCommand()
+    return game_commands.shared_command(game_commands.ReadJournalCommand)
 
 def create_let_go_command() -> BaseCommand:
-    return LetGoCommand()
+    return game_commands.shared_command(game_commands.LetGoCommand)
 
 def create_hold_on_command() -> BaseCommand:
-    return HoldOnCommand()
+    return game_commands.shared_command(game_commands.HoldOnCommand)
 
 # Map commands to their factory functions
 COMMANDS: dict[str, Callable[..., BaseCommand]] = {
@@ -156,6 +150,8 @@ COMMANDS: dict[str, Callable[..., BaseCommand]] = {
     "ponder": create_ponder_command,
     "balance": create_balance_command,
     "feel": create_feel_command,
+    "orders": create_orders_command,
+    "cancel order {a}": create_cancel_order_command,
     "eat {a}": create_eat_command,
     "examine {a}": create_examine_command,
     "watch {a}": create_watch_tv_command,
@@ -221,6 +217,105 @@ def expand(command: str, userInput: str) -> tuple[bool, list[str]]:
 
     return unify(commandTokens, inputTokens)
 
+# Distinct input lines whose template match is remembered
+PARSE_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _match(normalizedInput: str) -> tuple[str, Callable[..., BaseCommand], tuple[str, ...]] | None:
+    """The first template matching an input line, as (template, factory, args), or None."""
+    for command, factory in COMMANDS.items():
+        ok, args = expand(command, normalizedInput)
+        if ok:
+            return (command, factory, tuple(args))
+    return None
+
+
+def parse_cache_info() -> _CacheInfo:
+    """Hits, misses, maxsize and current size of the parse cache."""
+    return _match.cache_info()
+
+
+def clear_parse_cache() -> None:
+    """Forget every cached match and the spelling index; needed after COMMANDS is changed."""
+    global _corrector
+    _match.cache_clear()
+    _corrector = None
+
+
+_corrector: Corrector | None = None
+
+
+def corrector() -> Corrector:
+    """
+    The spelling corrector for player input, built on first use: the literal
+    words of COMMANDS, and as names the store catalogue and device parts
+    (so orders for things not yet delivered are left alone).
+    """
+    global _corrector
+    if _corrector is None:
+        keywords = {token for command in COMMANDS for token in command.split()
+                    if not PatVar(token)}
+        names = {name for store in (items.GroceryNumber, items.HardwareNumber,
+                                    items.ElectronicsNumber)
+                 for name in store("", "", None).GetStoreItems()}
+        names.update(device_state.DeviceState.COMPONENTS)
+        _corrector = spellcheck.Corrector(keywords, names)
+    return _corrector
+
+
+def _fill(command: str, args: tuple[str, ...]) -> str:
+    """A template with its placeholders replaced by args, in order."""
+    values = iter(args)
+    return " ".join(next(values) if PatVar(token) else token for token in command.split())
+
+
+def correct_spelling(line: str, world: Container) -> tuple[str, bool] | None:
+    """
+    Correct typos in an input line against the command words and the names
+    in a world.
+
+    A line that matches a template keeps its command; only arguments that
+    are not known names and are close to exactly one are corrected
+    ("go to bedrom"). A line that matches nothing has every unknown word
+    replaced by its nearest command word or name ("opne fridge").
+
+    Returns:
+        (corrected line, whether every correction was unambiguous), or
+        None when there is nothing to correct or the correction still
+        matches no template
+    """
+    match = _match(line)
+    if match is not None and not match[2]:
+        return None
+    # Most lines hold only known words; the world is walked for new names
+    # only when some word is unknown (and then only if it has changed)
+    spelling = corrector()
+    if all(map(spelling.known, match[2] if match is not None else line.split())):
+        return None
+    spelling.update(world)
+    if match is not None:
+        command, _, args = match
+        fixed = tuple(arg if spelling.known(arg) else spelling.name_for(arg) or arg
+                      for arg in args)
+        return (_fill(command, fixed), True) if fixed != args else None
+
+    words, sure = [], True
+    for word in line.split():
+        if spelling.known(word):
+            words.append(word)
+            continue
+        candidates = spelling.words_for(word)
+        if not candidates:
+            return None
+        sure = sure and len(candidates) == 1
+        words.append(candidates[0])
+    corrected = " ".join(words)
+    if corrected == line or _match(corrected) is None:
+        return None
+    return (corrected, sure)
+
+
 # returns a two tuple
 # (ok, errorMessage)
 # or
@@ -229,28 +324,69 @@ def expand(command: str, userInput: str) -> tuple[bool, list[str]]:
 # errorMessage on fail or action on success
 
 
-def parse(userInput: str, io: 'IOInterface' = None) -> tuple[bool, BaseCommand | str]:
+def parse(userInput: str, io: 'IOInterface' = None,
+          world: Container | None = None) -> tuple[bool, BaseCommand | str]:
     """
     Parse user input and return a Command object or error message.
     
+    Which template an input matches is cached (see parse_cache_info), but
+    the command is always built by calling its factory, so factories that
+    prompt, such as ponder's, still prompt on every parse.
+    
+    Given the world, typos are corrected (see correct_spelling): a sure
+    correction is played, with a note to io saying what it was taken as;
+    an ambiguous one is only suggested.
+    
     Returns:
         - (True, Command) if parsing succeeded
         - (False, error_message) if parsing failed
     """
-    for command, factory in COMMANDS.items():
-        ok, args = expand(command, userInput)
-        if ok:
-            try:
-                # Handle special case for ponder command that needs IO
-                if factory == create_ponder_command and io:
-                    cmd = factory(io)
-                else:
-                    cmd = factory(*args)
-                return (True, cmd)
-            except Exception as e:
-                return (False, f"Error creating command: {str(e)}")
-
-    return (False, "Don't understand command.")
+    return run_dialogue(parse_dialogue(userInput, io, world), io)
+
+
+async def parse_async(userInput: str, io: 'AsyncIOInterface',
+                      world: Container | None = None) -> tuple[bool, BaseCommand | str]:
+    """
+    Parse user input like parse(), awaiting the answers to any prompts
+    (ponder's hours) from an async session's io.
+    """
+    return await run_dialogue_async(parse_dialogue(userInput, io, world), io)
+
+
+def parse_dialogue(userInput: str, io: 'IOInterface' = None,
+                   world: Container | None = None) -> Dialogue:
+    """
+    parse() as a dialogue: yields the prompts of a factory that asks for
+    more (ponder's hours) and returns parse()'s result.
+    """
+    # Matching splits on whitespace, so lines differing only in spacing match alike
+    line = " ".join(userInput.split())
+    if world is not None:
+        correction = correct_spelling(line, world)
+        if correction is not None:
+            corrected, sure = correction
+            if not sure:
+                return (False, f'Don\'t understand command. Did you mean "{corrected}"?')
+            if io:
+                # Spaced like GameState.emit, whatever the command prints next
+                io.output(f'(Taking that as "{corrected}".)')
+                io.output("")
+            line = corrected
+
+    match = _match(line)
+    if match is None:
+        return (False, "Don't understand command.")
+
+    _, factory, args = match
+    try:
+        # Handle special case for ponder command that needs IO
+        if factory == create_ponder_command and io:
+            cmd = yield from ponder_hours(io)
+        else:
+            cmd = factory(*args)
+        return (True, cmd)
+    except Exception as e:
+        return (False, f"Error creating command: {str(e)}")
 
 
 # Legacy compatibility function for tests that expect the old interface
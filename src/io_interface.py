@@ -2,14 +2,31 @@
 io_interface.py
 
 Interface abstraction for input/output operations to make the game testable.
-Provides both console and mock implementations.
+Provides both console and mock implementations, plus an asyncio variant
+whose prompts are awaited.
+
+Interactions that prompt more than once (a phone call) are written as
+dialogues: generators that yield each prompt and receive the answer.
+run_dialogue() drives one with a blocking IOInterface and
+run_dialogue_async() with an AsyncIOInterface, so the same game logic can
+block a thread or park a coroutine.
 """
 
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Generator
+import sys
 import time
 
+from .lazy import lazy_module
+
+# Only needed by async sessions; kept off the start-up path
+asyncio = lazy_module("asyncio")
+
+# A generator that yields prompts, receives answers and returns a value
+Dialogue = Generator[str, str, object]
+
 
 class IOInterface(ABC):
     """Abstract interface for input/output operations."""
@@ -28,21 +45,47 @@ class IOInterface(ABC):
     def sleep(self, seconds: float) -> None:
         """Sleep for the specified number of seconds."""
         pass
+    
+    def flush(self) -> None:
+        """
+        Deliver any buffered output. The game loop calls this once per
+        line of input; implementations that write immediately need not
+        override it.
+        """
+        pass
 
 
 class ConsoleIO(IOInterface):
-    """Console implementation of the I/O interface."""
+    """
+    Console implementation of the I/O interface.
+    
+    Output is buffered and written in one go when flushed: at the end of
+    every line of input, and before prompting or sleeping so that nothing
+    is held back from the player.
+    """
+    
+    def __init__(self):
+        self._pending: list[str] = []
     
     def output(self, message: str) -> None:
-        """Print message to console."""
-        print(message)
+        """Queue a message for the console."""
+        self._pending.append(message)
+    
+    def flush(self) -> None:
+        """Write every queued message to the console at once."""
+        if self._pending:
+            sys.stdout.write("\n".join(self._pending) + "\n")
+            sys.stdout.flush()
+            self._pending.clear()
     
     def get_input(self, prompt: str) -> str:
         """Get input from console."""
+        self.flush()
         return input(prompt)
     
     def sleep(self, seconds: float) -> None:
         """Sleep using time.sleep."""
+        self.flush()
         time.sleep(seconds)
 
 
@@ -86,4 +129,69 @@ class MockIO(IOInterface):
         self.outputs.clear()
         self.inputs.clear()
         self.input_index = 0
-        self.sleep_calls.clear()
\ No newline at end of file
+        self.sleep_calls.clear()
+
+
+class AsyncIOInterface(IOInterface):
+    """
+    I/O for sessions driven by an asyncio event loop.
+
+    Output stays synchronous; input must be awaited through
+    get_input_async(), so blocking get_input() is not available.
+    """
+
+    def get_input(self, prompt: str) -> str:
+        """Blocking input is not available; use get_input_async()."""
+        raise RuntimeError("Async sessions must await get_input_async()")
+
+    @abstractmethod
+    async def get_input_async(self, prompt: str) -> str:
+        """Await input from the user with a prompt."""
+        pass
+
+
+class AsyncQueueIO(AsyncIOInterface):
+    """Async I/O fed from an asyncio.Queue of input lines; records output."""
+
+    def __init__(self):
+        self.outputs: list[str] = []
+        self.inputs: asyncio.Queue[str] = asyncio.Queue()
+        self.sleep_calls: list[float] = []
+
+    def output(self, message: str) -> None:
+        """Store output message."""
+        self.outputs.append(message)
+
+    async def get_input_async(self, prompt: str) -> str:
+        """Record the prompt and wait for the next fed line."""
+        self.outputs.append(prompt)
+        return await self.inputs.get()
+
+    def sleep(self, seconds: float) -> None:
+        """Record sleep calls; never blocks the event loop."""
+        self.sleep_calls.append(seconds)
+
+    def feed(self, *lines: str) -> None:
+        """Queue input lines for upcoming prompts."""
+        for line in lines:
+            self.inputs.put_nowait(line)
+
+
+def run_dialogue(dialogue: Dialogue, io: IOInterface) -> object:
+    """Drive a dialogue, answering each prompt with io.get_input()."""
+    try:
+        prompt = next(dialogue)
+        while True:
+            prompt = dialogue.send(io.get_input(prompt))
+    except StopIteration as stop:
+        return stop.value
+
+
+async def run_dialogue_async(dialogue: Dialogue, io: AsyncIOInterface) -> object:
+    """Drive a dialogue, awaiting each answer from io.get_input_async()."""
+    try:
+        prompt = next(dialogue)
+        while True:
+            prompt = dialogue.send(await io.get_input_async(prompt))
+    except StopIteration as stop:
+        return stop.value
@@ -0,0 +1,47 @@
+"""
+lazy.py
+
+Deferred module imports for keeping interpreter start-up cheap.
+
+lazy_module() returns a module object whose code only runs the first time
+one of its attributes is read. The game loop uses it for the command
+implementations, which are not needed until the player's first command is
+parsed.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_module(name: str, package: str | None = None) -> ModuleType:
+    """
+    Import a module lazily.
+
+    Args:
+        name: Absolute or relative (leading dot) module name
+        package: Anchor package for relative names, usually __package__
+
+    Returns the already-imported module when there is one; otherwise a
+    placeholder registered in sys.modules that executes the module on
+    first attribute access.
+    """
+    fullname = importlib.util.resolve_name(name, package)
+    if fullname in sys.modules:
+        return sys.modules[fullname]
+
+    spec = importlib.util.find_spec(fullname)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {fullname!r}", name=fullname)
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[fullname] = module
+    spec.loader.exec_module(module)
+
+    # Bind the submodule on its parent package, as a regular import would
+    parent, _, child = fullname.rpartition(".")
+    if parent:
+        setattr(sys.modules[parent], child, module)
+    return module
@@ -9,8 +9,10 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from ..core.game_objects import Openable
+
 if TYPE_CHECKING:
-    from ..core.game_objects import Object, Container, Openable
+    from ..core.game_objects import Object, Container
     from ..core.characters import Hero
 
 
@@ -33,9 +35,6 @@ class InteractionRules:
         """
         Check if a container can be examined. Returns (can_examine, reason).
         """
-        # Import here to avoid circular imports
-        from ..core.game_objects import Openable
-        
         if isinstance(container, Openable):
             if container.state != Openable.State.OPEN:
                 return False, f"The {container.name} must be opened first."
@@ -91,9 +90,6 @@ class InteractionRules:
         """
         Check if a container is accessible for item retrieval.
         """
-        # Import here to avoid circular imports
-        from ..core.game_objects import Openable
-        
         if isinstance(container, Openable):
             return container.state == Openable.State.OPEN
         return True
\ No newline at end of file
@@ -9,8 +9,10 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from ..core.game_objects import Openable
+
 if TYPE_CHECKING:
-    from ..core.game_objects import Object, Container, Openable
+    from ..core.game_objects import Object, Container
     from ..core.characters import Hero
 
 
@@ -51,9 +53,6 @@ class InventoryRules:
         if hero.parent == item.parent:
             return True
 
-        # Import here to avoid circular imports
-        from ..core.game_objects import Openable
-        
         if isinstance(item.parent, Openable):
             if item.parent.state == Openable.State.CLOSED:
                 return False
@@ -67,18 +66,22 @@ class InventoryRules:
         """
         Calculate the total weight of all items in a container.
         """
-        total = 0
-        for item in container.contents:
-            total += item.weight
-        return total
+        return container.direct_weight
+
+    @staticmethod
+    def calculate_nested_weight(container: 'Container') -> int:
+        """
+        Calculate the total weight of everything in a container, including
+        the contents of containers inside it.
+        """
+        return container.contents_weight
 
     @staticmethod
     def can_carry_weight(hero: 'Hero', additional_weight: int) -> bool:
         """
         Check if hero can carry additional weight (100 unit limit).
         """
-        current_weight = InventoryRules.calculate_total_weight(hero)
-        return current_weight + additional_weight <= 100
+        return hero.direct_weight + additional_weight <= 100
 
     @staticmethod
     def find_items_by_name(container: 'Container', name: str) -> list['Object']:
@@ -9,9 +9,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from ..core.rooms import Closet
+
 if TYPE_CHECKING:
     from ..core.characters import Hero
-    from ..core.rooms import Room, Closet
+    from ..core.rooms import Room
 
 
 class MovementRules:
@@ -24,9 +26,6 @@ class MovementRules:
         """
         Check if hero can leave the given room. Returns (can_leave, reason).
         """
-        # Import here to avoid circular imports
-        from ..core.rooms import Closet
-        
         if isinstance(room, Closet):
             if room.state == Closet.State.NAILED:
                 return False, "Perhaps you should ponder exactly how you'll do that?"
@@ -0,0 +1,165 @@
+"""
+recipes.py
+
+The construction and teardown rules of the Convergence Amplifier, as data.
+
+Each Recipe names the items it consumes, the tools it needs but keeps, the
+component it builds or removes, the components that must already be built,
+where the hero has to be, and what it costs in time and feel. Requirements
+are compiled once into an item-name multiset and a component bitmask, so
+"can this be done?" is a Counter inclusion test plus a mask test against
+the names available, whoever is doing the work:
+
+    - the AlterEgo builds from items anywhere in the apartment (apartment_items)
+    - the hero sabotages or barricades with what they carry (TurnContext)
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from .core.device_state import DeviceState
+from .core.game_objects import Container
+
+if TYPE_CHECKING:
+    from .commands.turn_context import TurnContext
+    from .core.game_objects import Object
+    from .core.game_world import GameState
+
+
+class Recipe:
+    """
+    One rule for building, removing or barricading.
+
+    Attributes:
+        name: Recipe name (the component, for builds)
+        consumes: Items used up, in order
+        tools: Items needed but kept, in order
+        builds: Component built, if any
+        removes: Component torn out, if any (it must be built)
+        requires: Components that must already be built
+        room: Room the hero must be in (or must not be in, if outside)
+        outside: Whether room is the room to stay out of
+        minutes: Time the work takes
+        feel: Feel the work costs
+        items: Multiset of every item name needed
+        requires_mask: DeviceState mask of the components needed
+    """
+
+    def __init__(self, name: str, consumes: tuple[str, ...] = (),
+                 tools: tuple[str, ...] = (), builds: str | None = None,
+                 removes: str | None = None, requires: tuple[str, ...] = (),
+                 room: str | None = None, outside: bool = False,
+                 minutes: int = 0, feel: int = 0) -> None:
+        self.name = name
+        self.consumes = consumes
+        self.tools = tools
+        self.builds = builds
+        self.removes = removes
+        self.requires = requires
+        self.room = room
+        self.outside = outside
+        self.minutes = minutes
+        self.feel = feel
+        self.items: Counter[str] = Counter(consumes) + Counter(tools)
+        self.requires_mask = 0
+        for component in requires + ((removes,) if removes else ()):
+            self.requires_mask |= DeviceState.COMPONENT_BITS[component]
+
+    def __repr__(self) -> str:
+        return f"Recipe({self.name!r})"
+
+    def has_items(self, available: Counter[str]) -> bool:
+        """Whether the available item names cover everything needed."""
+        return self.items <= available
+
+    def missing_items(self, available: Counter[str]) -> list[str]:
+        """Item names needed but not available, consumed items first."""
+        return list((self.items - available).elements())
+
+    def components_ready(self, device_state: DeviceState) -> bool:
+        """Whether every component this recipe depends on is built."""
+        return device_state.mask & self.requires_mask == self.requires_mask
+
+    def in_place(self, room_name: str) -> bool:
+        """Whether the hero's room is right for this recipe."""
+        if self.room is None:
+            return True
+        return (room_name == self.room) != self.outside
+
+    def allows(self, gamestate: GameState, context: TurnContext) -> bool:
+        """Whether the hero can carry this recipe out right now."""
+        return (self.in_place(context.room.name)
+                and self.components_ready(gamestate.device_state)
+                and self.has_items(context.inventory_counts))
+
+    def charge(self, gamestate: GameState) -> None:
+        """Spend the recipe's time and feel."""
+        gamestate.watch.curr_time += timedelta(minutes=self.minutes)
+        gamestate.hero.feel -= self.feel
+
+
+RECIPES: dict[str, Recipe] = {recipe.name: recipe for recipe in (
+    # AlterEgo construction (built in the bedroom, kept tools moved there)
+    Recipe("device-frame", consumes=("plywood-sheet", "metal-brackets", "box-of-nails"),
+           tools=("hammer",), builds="device-frame"),
+    Recipe("wiring-harness", consumes=("copper-wire", "insulated-cable"),
+           tools=("soldering-iron",), builds="wiring-harness", requires=("device-frame",)),
+    Recipe("power-core", consumes=("battery-pack", "copper-coil"), builds="power-core"),
+    Recipe("focusing-array", consumes=("crystal-oscillator", "ice-cubes"),
+           builds="focusing-array"),
+    Recipe("convergence-device", consumes=("signal-amplifier",), builds="convergence-device"),
+
+    # Player sabotage
+    Recipe("disassemble-frame", tools=("hammer",), removes="device-frame",
+           room="bedroom", minutes=60, feel=15),
+    Recipe("cut-wires", tools=("wire-cutters",), removes="wiring-harness",
+           room="bedroom", minutes=30, feel=10),
+    Recipe("remove-battery", removes="power-core", room="bedroom", minutes=20, feel=5),
+    Recipe("remove-crystal", removes="focusing-array", room="bedroom", minutes=20, feel=5),
+
+    # Player defences
+    Recipe("nail-self-in", consumes=("plywood-sheet", "box-of-nails"), tools=("hammer",),
+           room="closet", minutes=120, feel=20),
+    Recipe("barricade-bedroom", consumes=("plywood-sheet", "box-of-nails"), tools=("hammer",),
+           room="bedroom", outside=True, minutes=60, feel=15),
+)}
+
+# Components the AlterEgo tries to build in each phase, in order
+AE_PHASE_BUILDS: dict[int, list[Recipe]] = {
+    2: [RECIPES["device-frame"]],
+    3: [RECIPES["wiring-harness"]],
+    4: [RECIPES["power-core"], RECIPES["focusing-array"]],
+    5: [RECIPES["convergence-device"]],
+}
+
+
+def apartment_items(gamestate: GameState) -> tuple[Counter[str], dict[str, list[Object]]]:
+    """
+    Every item the AlterEgo can reach: the hero's inventory first, then the
+    whole apartment depth-first.
+
+    Returns:
+        (name counts, objects by name in search order)
+    """
+    counts: Counter[str] = Counter()
+    found: dict[str, list[Object]] = {}
+    seen: set[int] = set()
+
+    def add(item: Object) -> None:
+        if id(item) not in seen:
+            seen.add(id(item))
+            counts[item.name] += 1
+            found.setdefault(item.name, []).append(item)
+
+    for item in gamestate.hero.contents:
+        add(item)
+    pending: list[Object] = list(reversed(gamestate.apartment.contents))
+    while pending:
+        item = pending.pop()
+        add(item)
+        if isinstance(item, Container):
+            pending.extend(reversed(item.contents))
+    return counts, found
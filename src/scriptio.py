@@ -0,0 +1,107 @@
+"""
+scriptio.py
+
+Non-interactive I/O for playing a script of input lines to completion.
+
+ScriptIO answers every prompt with the next line of a script (a file or a
+pipe), never sleeps and never echoes prompts, so a game runs at full speed
+and its output is only what the game itself says. When the script runs out
+get_input() raises EOFError, which ends the game loop.
+
+Output is written either as plain text, one message per line, or as JSON
+lines: one {"input": ..., "output": [...]} record per line of input, the
+first (with a null input) holding the introduction, so a reader can tell
+which input produced which messages.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Iterator
+from typing import TextIO
+
+from .io_interface import IOInterface
+
+FORMATS = ("text", "jsonl")
+
+# Script lines starting with this are skipped
+COMMENT_PREFIX = "#"
+
+
+def script_lines(lines: Iterable[str]) -> Iterator[str]:
+    """The input lines of a script, without line endings or comments."""
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if not line.lstrip().startswith(COMMENT_PREFIX):
+            yield line
+
+
+class ScriptIO(IOInterface):
+    """
+    I/O that reads input from a script and writes output to a stream.
+
+    Attributes:
+        format: "text" or "jsonl"
+        inputs_read: How many script lines have been played
+    """
+
+    def __init__(self, lines: Iterable[str], stream: TextIO, format: str = "text") -> None:
+        if format not in FORMATS:
+            raise ValueError(f"Unknown output format: {format}")
+        self.format = format
+        self.inputs_read = 0
+        self._lines = script_lines(lines)
+        self._stream = stream
+        self._pending: list[str] = []
+        self._input: str | None = None
+
+    def output(self, message: str) -> None:
+        """Queue a message for the stream."""
+        self._pending.append(message)
+
+    def flush(self) -> None:
+        """Write queued text output; JSON records are written per input."""
+        if self.format == "text" and self._pending:
+            self._stream.write("\n".join(self._pending) + "\n")
+            self._pending.clear()
+
+    def get_input(self, prompt: str) -> str:
+        """
+        The next script line; the prompt is not shown.
+
+        Raises:
+            EOFError: When the script has no lines left
+        """
+        self._write_record()
+        line = next(self._lines, None)
+        if line is None:
+            raise EOFError("End of script")
+        self.inputs_read += 1
+        self._input = line
+        return line
+
+    def sleep(self, seconds: float) -> None:
+        """Scripts run at full speed."""
+        pass
+
+    def close(self, ending: str | None) -> None:
+        """
+        Write what is left of the output, and in jsonl format a last
+        {"ending": ...} record (null if no ending was reached).
+        """
+        self.flush()
+        self._write_record()
+        if self.format == "jsonl":
+            self._stream.write(json.dumps({"ending": ending}) + "\n")
+        self._stream.flush()
+
+    def _write_record(self) -> None:
+        """In jsonl format, write the output of the last input as one record."""
+        if self.format != "jsonl":
+            self.flush()
+            return
+        if self._pending or self._input is not None:
+            record = {"input": self._input, "output": self._pending}
+            self._stream.write(json.dumps(record) + "\n")
+            self._pending = []
+            self._input = None
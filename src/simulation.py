@@ -0,0 +1,575 @@
+"""
+simulation.py
+
+Batched Monte Carlo simulation of the Alter Ego economy.
+
+The balance question is how often the AlterEgo completes the Convergence
+Amplifier within the week for a given player spending policy. That only
+depends on the hero's balance and feel, the clock, the items in the
+apartment, the deliveries in flight, the built components and the AE phase,
+so each playthrough is reduced to that abstract state and thousands of them
+are advanced together.
+
+With NumPy installed the state lives in arrays and every playthrough takes
+one game-loop step per iteration, in lockstep. Without NumPy a pure-Python
+backend plays the same rules one playthrough at a time.
+
+The rules mirror the game loop exactly: deliveries land and the week-end
+ending is checked at the top of each loop, a store order costs time and
+feel before the funds check, and when feel reaches zero after a command the
+AlterEgo runs one phase and six hours pass. validate_against_engine() replays
+sampled playthroughs through the real engine to confirm that.
+"""
+
+from __future__ import annotations
+
+import random
+from collections import Counter
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from .core.characters import Hero
+from .core.device_state import DeviceState
+from .core.items import ElectronicsNumber, GroceryNumber, HardwareNumber
+from .io_interface import MockIO
+from .recipes import AE_PHASE_BUILDS
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to the pure-Python backend
+    np = None
+
+
+_DAY = 24 * 60
+_START = datetime(1982, 3, 15, 3, 14)  # Watch start time
+# Minutes from the start until the clock reaches day 7 (the ending check)
+_WEEK_END = int((datetime.combine(_START.date() + timedelta(days=6), datetime.min.time())
+                 - _START).total_seconds() // 60)
+_START_BALANCE = 100
+_SLEEP_MINUTES = 6 * 60
+_AE_DELIVERY_MINUTES = _DAY
+
+# Ordering terms of each store, mirroring the StoreNumber subclasses:
+# (phone number, minutes on the phone, feel cost, delivery delay in minutes)
+_STORE_TERMS = {
+    GroceryNumber: ("288-7955", 30, 2, _DAY),
+    HardwareNumber: ("592-2874", 2, 10, 2 * _DAY),
+    ElectronicsNumber: ("743-8291", 5, 5, 3 * _DAY),
+}
+
+# item -> (phone number, price, minutes on the phone, feel cost, delivery delay)
+CATALOG: dict[str, tuple[str, int, int, int, int]] = {
+    item: (number, price, minutes, feel, delay)
+    for store, (number, minutes, feel, delay) in _STORE_TERMS.items()
+    for item, price in store("", number, None).GetStoreItems().items()
+}
+
+# What the AlterEgo orders in each phase, as (item, cost), in order
+AE_ORDERS: dict[int, list[tuple[str, int]]] = {
+    1: [("copper-wire", 15), ("metal-brackets", 10), ("vacuum-tubes", 20), ("battery-pack", 12)],
+    2: [("soldering-iron", 25), ("insulated-cable", 8), ("copper-coil", 18)],
+    3: [("crystal-oscillator", 35), ("signal-amplifier", 40), ("ice-cubes", 6)],
+}
+
+# What the AlterEgo builds in each phase, before ordering (from its recipes):
+# (component, consumed items, kept items, prerequisite component)
+AE_BUILDS: dict[int, list[tuple[str, tuple[str, ...], tuple[str, ...], str | None]]] = {
+    phase: [(recipe.builds, recipe.consumes, recipe.tools,
+             recipe.requires[0] if recipe.requires else None) for recipe in recipes]
+    for phase, recipes in AE_PHASE_BUILDS.items()
+}
+
+# Grocery deliveries are Food in the fridge; the hero can eat them for feel
+FOOD_FEEL: dict[str, int] = GroceryNumber("", "", None).FoodFeel()
+
+ITEMS: list[str] = sorted(set(CATALOG) | {item for orders in AE_ORDERS.values()
+                                          for item, _ in orders})
+_ITEM_INDEX = {item: index for index, item in enumerate(ITEMS)}
+_COMPONENT_BIT = DeviceState.COMPONENT_BITS
+_ALL_COMPONENTS = DeviceState.ALL_BUILT
+
+ENDINGS: list[str] = ["victory", "partial_victory", "defeat"]
+
+
+def _week_ending(built: int) -> str:
+    """The ending GameEndings.check_ending gives on day 7 for a component mask."""
+    missing = len(DeviceState.COMPONENTS) - built.bit_count()
+    if missing >= 2:
+        return "victory"
+    if missing == 1:
+        return "partial_victory"
+    return "defeat"
+
+
+class SpendingPolicy:
+    """
+    A randomized player spending policy.
+
+    Every time the hero wakes up, each item in purchases is ordered with its
+    probability (in the order given). After that, whenever one of the foods
+    in eats is in the fridge the hero eats it (earlier foods first), and
+    otherwise ponders in chunks of ponder_hours until passing out.
+    """
+
+    def __init__(self, purchases: dict[str, float] | None = None,
+                 ponder_hours: int = 1, eats: list[str] | None = None) -> None:
+        """
+        Args:
+            purchases: Store item -> probability of ordering it per waking cycle
+            ponder_hours: Hours per ponder command between orders and sleep
+            eats: Grocery foods the hero eats from the fridge, by preference
+
+        Raises:
+            ValueError: For unknown items or foods, probabilities outside
+                [0, 1] or a non-positive ponder length
+        """
+        self.purchases = dict(purchases or {})
+        self.ponder_hours = ponder_hours
+        self.eats = list(eats or [])
+        for item, probability in self.purchases.items():
+            if item not in CATALOG:
+                raise ValueError(f"Unknown store item: {item}")
+            if not 0.0 <= probability <= 1.0:
+                raise ValueError(f"Probability for {item} must be in [0, 1]")
+        for food in self.eats:
+            if food not in FOOD_FEEL:
+                raise ValueError(f"Unknown food: {food}")
+        if ponder_hours <= 0:
+            raise ValueError("ponder_hours must be positive")
+
+    @property
+    def items(self) -> list[str]:
+        """The policy's items, in ordering order."""
+        return list(self.purchases)
+
+    def __repr__(self) -> str:
+        return (f"SpendingPolicy({self.purchases!r}, ponder_hours={self.ponder_hours}, "
+                f"eats={self.eats!r})")
+
+
+class SimulationResult:
+    """
+    Outcome of a batch of simulated playthroughs.
+
+    Per-run values are indexable sequences (lists, or arrays with NumPy):
+    endings, balances (final dollars), components (bitmask of built
+    components, bit i = DeviceState.COMPONENTS[i]), phases (final AE phase),
+    cycles (pass-outs) and minutes (game minutes elapsed).
+    """
+
+    def __init__(self, policy: SpendingPolicy, backend: str, starting_balance: int,
+                 endings: list[str], balances, components, phases, cycles, minutes,
+                 plans: list) -> None:
+        self.policy = policy
+        self.backend = backend
+        self.starting_balance = starting_balance
+        self.endings = endings
+        self.balances = balances
+        self.components = components
+        self.phases = phases
+        self.cycles = cycles
+        self.minutes = minutes
+        self._plans = plans
+
+    @property
+    def runs(self) -> int:
+        """Number of simulated playthroughs."""
+        return len(self.endings)
+
+    def ending_counts(self) -> dict[str, int]:
+        """How many playthroughs reached each ending."""
+        counts = Counter(self.endings)
+        return {ending: counts.get(ending, 0) for ending in ENDINGS}
+
+    @property
+    def completion_rate(self) -> float:
+        """Fraction of playthroughs in which the AE completed the device."""
+        return self.ending_counts()["defeat"] / self.runs if self.runs else 0.0
+
+    def plan(self, run: int) -> list[list[str]]:
+        """The items the policy chose to order in each waking cycle of a run."""
+        items = self.policy.items
+        return [[item for item, chosen in zip(items, cycle_plan[run]) if chosen]
+                for cycle_plan in self._plans]
+
+    def summary(self) -> str:
+        """One-line summary of the batch."""
+        counts = ", ".join(f"{ending} {count}" for ending, count in self.ending_counts().items())
+        return (f"{self.runs} runs ({self.backend}): {counts}; "
+                f"AE completion rate {self.completion_rate:.1%}")
+
+
+class _Playthrough:
+    """
+    One abstract playthrough, stepped exactly like the game loop.
+
+    Used by the pure-Python backend and to replay a single run (recording
+    the player inputs that drive the real engine through the same path).
+    """
+
+    def __init__(self, policy: SpendingPolicy, cycle_orders: Callable[[int], list[str]],
+                 starting_balance: int = _START_BALANCE, record: bool = False) -> None:
+        """
+        Args:
+            policy: The spending policy being played
+            cycle_orders: Waking cycle number -> items to order in that cycle
+            starting_balance: The hero's dollars at the start
+            record: Whether to record the equivalent player inputs
+        """
+        self.policy = policy
+        self.cycle_orders = cycle_orders
+        self.minutes = 0
+        self.feel = Hero.INITIAL_FEEL
+        self.balance = starting_balance
+        self.phase = 0
+        self.built = 0
+        self.cycles = 0
+        # Items in the toolbox/table and Food in the fridge, by name
+        self.stock: Counter[str] = Counter()
+        self.fridge: Counter[str] = Counter()
+        # (delivery minute, item, delivered to the fridge) in order placed
+        self.pending: list[tuple[int, str, bool]] = []
+        self.fridge_open = False
+        self.inputs: list[str] | None = [] if record else None
+        self.ending: str | None = None
+
+    def play(self) -> _Playthrough:
+        """Play until an ending is reached."""
+        orders = list(self.cycle_orders(0))
+        while True:
+            # Top of the game loop: deliveries, then the day-7 ending check
+            if any(when <= self.minutes for when, _, _ in self.pending):
+                for when, item, to_fridge in self.pending:
+                    if when <= self.minutes:
+                        (self.fridge if to_fridge else self.stock)[item] += 1
+                self.pending = [order for order in self.pending if order[0] > self.minutes]
+            if self.minutes >= _WEEK_END:
+                self.ending = _week_ending(self.built)
+                return self
+
+            food = next((food for food in self.policy.eats if self.fridge[food] > 0), None)
+            if orders:
+                self._order(orders.pop(0))
+            elif food is not None:
+                self._eat(food)
+            else:
+                self._ponder()
+
+            # GameState.Examine: pass out and let the AE work
+            if self.feel <= 0:
+                self._run_alter_ego()
+                if self.ending is not None:
+                    return self
+                self.feel = Hero.INITIAL_FEEL
+                self.cycles += 1
+                orders = list(self.cycle_orders(self.cycles))
+
+    def _order(self, item: str) -> None:
+        number, price, minutes, feel, delay = CATALOG[item]
+        if self.inputs is not None:
+            self.inputs += ["call phone", number, item]
+        self.minutes += minutes
+        self.feel -= feel
+        if self.balance >= price:
+            self.balance -= price
+            self.pending.append((self.minutes + delay, item, item in FOOD_FEEL))
+
+    def _eat(self, food: str) -> None:
+        if self.inputs is not None:
+            if not self.fridge_open:
+                self.inputs.append("open fridge")
+            self.inputs.append(f"eat {food}")
+        self.fridge_open = True
+        self.fridge[food] -= 1
+        self.minutes += 20
+        self.feel += FOOD_FEEL[food]
+
+    def _ponder(self) -> None:
+        hours = self.policy.ponder_hours
+        if self.inputs is not None:
+            self.inputs += ["ponder", str(hours)]
+        self.minutes += 60 * hours
+        self.feel -= 10 * hours
+
+    def _run_alter_ego(self) -> None:
+        self.phase = min(self.phase + 1, 5)
+        for component, consumed, kept, prerequisite in AE_BUILDS.get(self.phase, []):
+            if prerequisite is not None and not self.built & _COMPONENT_BIT[prerequisite]:
+                continue
+            if all(self.stock[item] + self.fridge[item] > 0 for item in consumed + kept):
+                for item in consumed:
+                    # The AE searches the toolbox before the fridge
+                    (self.stock if self.stock[item] > 0 else self.fridge)[item] -= 1
+                self.built |= _COMPONENT_BIT[component]
+        for item, cost in AE_ORDERS.get(self.phase, []):
+            if self.balance >= cost:
+                self.balance -= cost
+                self.pending.append((self.minutes + _AE_DELIVERY_MINUTES, item, False))
+        self.minutes += _SLEEP_MINUTES
+        if self.phase == 5 and self.built == _ALL_COMPONENTS:
+            self.ending = "defeat"
+
+
+def _simulate_python(policy: SpendingPolicy, runs: int, seed: int | None,
+                     starting_balance: int) -> SimulationResult:
+    """Pure-Python backend: play each run in turn."""
+    rng = random.Random(seed)
+    probabilities = list(policy.purchases.values())
+    plans: list[list[list[bool]]] = []
+
+    def cycle_plan(cycle: int) -> list[list[bool]]:
+        while len(plans) <= cycle:
+            plans.append([[rng.random() < p for p in probabilities] for _ in range(runs)])
+        return plans[cycle]
+
+    items = policy.items
+    played = []
+    for run in range(runs):
+        def cycle_orders(cycle: int, run: int = run) -> list[str]:
+            return [item for item, chosen in zip(items, cycle_plan(cycle)[run]) if chosen]
+        played.append(_Playthrough(policy, cycle_orders, starting_balance).play())
+    return SimulationResult(
+        policy, "python", starting_balance,
+        endings=[p.ending for p in played],
+        balances=[p.balance for p in played],
+        components=[p.built for p in played],
+        phases=[p.phase for p in played],
+        cycles=[p.cycles for p in played],
+        minutes=[p.minutes for p in played],
+        plans=plans,
+    )
+
+
+def _simulate_numpy(policy: SpendingPolicy, runs: int, seed: int | None,
+                    starting_balance: int) -> SimulationResult:
+    """NumPy backend: every run takes one game-loop step per iteration."""
+    rng = np.random.default_rng(seed)
+    items = policy.items
+    probabilities = np.array(list(policy.purchases.values()), dtype=float)
+    n_policy = len(items)
+    n_items = len(ITEMS)
+    # Holdings columns: items in the toolbox/table, then Food in the fridge
+    policy_item = np.array([_ITEM_INDEX[item] + (n_items if item in FOOD_FEEL else 0)
+                            for item in items], dtype=np.int64)
+    eat_columns = [n_items + _ITEM_INDEX[food] for food in policy.eats]
+    price, minutes_cost, feel_cost, delay = (
+        np.array([CATALOG[item][field] for item in items], dtype=np.int64)
+        for field in (1, 2, 3, 4))
+    positions = np.arange(n_policy)
+    popcount = np.array([bin(mask).count("1") for mask in range(_ALL_COMPONENTS + 1)])
+    never = np.iinfo(np.int64).max
+
+    minutes = np.zeros(runs, dtype=np.int64)
+    feel = np.full(runs, Hero.INITIAL_FEEL, dtype=np.int64)
+    balance = np.full(runs, starting_balance, dtype=np.int64)
+    phase = np.zeros(runs, dtype=np.int64)
+    built = np.zeros(runs, dtype=np.int64)
+    cycles = np.zeros(runs, dtype=np.int64)
+    cursor = np.zeros(runs, dtype=np.int64)
+    ending = np.full(runs, -1, dtype=np.int64)  # index into ENDINGS
+    holdings = np.zeros((runs, 2 * n_items), dtype=np.int64)
+    pending_due = np.full((runs, 16), never, dtype=np.int64)
+    pending_item = np.zeros((runs, 16), dtype=np.int64)
+    pending_count = np.zeros(runs, dtype=np.int64)
+
+    plans: list = []
+
+    def cycle_plan(cycle: int):
+        while len(plans) <= cycle:
+            plans.append(rng.random((runs, n_policy)) < probabilities)
+        return plans[cycle]
+
+    plan = cycle_plan(0).copy()
+
+    def schedule(rows, due, item) -> None:
+        nonlocal pending_due, pending_item
+        slots = pending_count[rows]
+        if len(slots) and slots.max() >= pending_due.shape[1]:
+            extra = pending_due.shape[1]
+            pending_due = np.hstack([pending_due, np.full((runs, extra), never, dtype=np.int64)])
+            pending_item = np.hstack([pending_item, np.zeros((runs, extra), dtype=np.int64)])
+        pending_due[rows, slots] = due
+        pending_item[rows, slots] = item
+        pending_count[rows] += 1
+
+    def ae_orders(rows, orders) -> None:
+        for item, cost in orders:
+            paying = rows[balance[rows] >= cost]
+            balance[paying] -= cost
+            schedule(paying, minutes[paying] + _AE_DELIVERY_MINUTES, _ITEM_INDEX[item])
+
+    while True:
+        active = ending < 0
+        if not active.any():
+            break
+
+        # Top of the game loop: deliveries, then the day-7 ending check
+        due = pending_due <= minutes[:, None]
+        if due.any():
+            rows, slots = np.nonzero(due)
+            np.add.at(holdings, (rows, pending_item[rows, slots]), 1)
+            pending_due[due] = never
+        week = active & (minutes >= _WEEK_END)
+        if week.any():
+            missing = len(DeviceState.COMPONENTS) - popcount[built[week]]
+            ending[week] = np.where(missing >= 2, 0, np.where(missing == 1, 1, 2))
+            active &= ~week
+
+        # The next planned order at or after the cursor, else the preferred
+        # food in the fridge, else ponder
+        remaining = plan & (positions[None, :] >= cursor[:, None])
+        ordering = active & remaining.any(axis=1)
+        idle = active & ~ordering
+        for column in eat_columns:
+            eating = idle & (holdings[:, column] > 0)
+            holdings[eating, column] -= 1
+            minutes[eating] += 20
+            feel[eating] += FOOD_FEEL[ITEMS[column - n_items]]
+            idle &= ~eating
+        pondering = idle
+
+        rows = np.nonzero(ordering)[0]
+        if len(rows):
+            choice = remaining[rows].argmax(axis=1)
+            minutes[rows] += minutes_cost[choice]
+            feel[rows] -= feel_cost[choice]
+            paid = balance[rows] >= price[choice]
+            balance[rows[paid]] -= price[choice[paid]]
+            schedule(rows[paid], minutes[rows[paid]] + delay[choice[paid]],
+                     policy_item[choice[paid]])
+            cursor[rows] = choice + 1
+        minutes[pondering] += 60 * policy.ponder_hours
+        feel[pondering] -= 10 * policy.ponder_hours
+
+        # GameState.Examine: pass out and let the AE work
+        asleep = np.nonzero(active & (feel <= 0))[0]
+        if not len(asleep):
+            continue
+        phase[asleep] = np.minimum(phase[asleep] + 1, 5)
+        for ae_phase in range(1, 6):
+            rows = asleep[phase[asleep] == ae_phase]
+            if not len(rows):
+                continue
+            for component, consumed, kept, prerequisite in AE_BUILDS.get(ae_phase, []):
+                ready = np.ones(len(rows), dtype=bool)
+                if prerequisite is not None:
+                    ready &= (built[rows] & _COMPONENT_BIT[prerequisite]) != 0
+                for item in consumed + kept:
+                    column = _ITEM_INDEX[item]
+                    ready &= holdings[rows, column] + holdings[rows, n_items + column] > 0
+                builders = rows[ready]
+                for item in consumed:
+                    # The AE searches the toolbox before the fridge
+                    column = _ITEM_INDEX[item]
+                    column = np.where(holdings[builders, column] > 0, column, n_items + column)
+                    holdings[builders, column] -= 1
+                built[builders] |= _COMPONENT_BIT[component]
+            ae_orders(rows, AE_ORDERS.get(ae_phase, []))
+        minutes[asleep] += _SLEEP_MINUTES
+
+        activated = (phase[asleep] == 5) & (built[asleep] == _ALL_COMPONENTS)
+        ending[asleep[activated]] = 2
+        woke = asleep[~activated]
+        feel[woke] = Hero.INITIAL_FEEL
+        cycles[woke] += 1
+        cursor[woke] = 0
+        for cycle in np.unique(cycles[woke]):
+            rows = woke[cycles[woke] == cycle]
+            plan[rows] = cycle_plan(int(cycle))[rows]
+
+    return SimulationResult(
+        policy, "numpy", starting_balance,
+        endings=[ENDINGS[code] for code in ending],
+        balances=balance, components=built, phases=phase,
+        cycles=cycles, minutes=minutes, plans=plans,
+    )
+
+
+def simulate(policy: SpendingPolicy, runs: int = 1000, seed: int | None = None,
+             backend: str | None = None,
+             starting_balance: int = _START_BALANCE) -> SimulationResult:
+    """
+    Simulate runs playthroughs of a spending policy.
+
+    Args:
+        policy: The player's spending policy
+        runs: Number of playthroughs
+        seed: Random seed, for reproducible batches
+        backend: "numpy" or "python"; defaults to NumPy when it is installed
+        starting_balance: The hero's dollars at the start (the game gives $100)
+
+    Raises:
+        ValueError: For an unknown backend, or "numpy" without NumPy installed
+    """
+    if backend is None:
+        backend = "numpy" if np is not None else "python"
+    if backend == "numpy":
+        if np is None:
+            raise ValueError("The numpy backend requires NumPy to be installed")
+        return _simulate_numpy(policy, runs, seed, starting_balance)
+    if backend == "python":
+        return _simulate_python(policy, runs, seed, starting_balance)
+    raise ValueError(f"Unknown backend: {backend}")
+
+
+class _ScriptIO(MockIO):
+    """MockIO that raises EOFError once the scripted inputs run out."""
+
+    def get_input(self, prompt: str) -> str:
+        if self.input_index >= len(self.inputs):
+            raise EOFError("Simulated playthrough diverged from the engine")
+        return super().get_input(prompt)
+
+
+def replay(result: SimulationResult, run: int):
+    """
+    Play one simulated run through the real engine.
+
+    Returns (abstract playthrough, final engine GameState).
+    """
+    from .gameloop import new_world, run as run_game
+
+    plan = result.plan(run)
+    expected = _Playthrough(result.policy,
+                            lambda cycle: plan[cycle] if cycle < len(plan) else [],
+                            result.starting_balance, record=True).play()
+    io = _ScriptIO()
+    io.set_inputs(expected.inputs)
+    state = new_world(io)
+    state.hero.curr_balance = result.starting_balance
+    try:
+        run_game(io, state)
+    except EOFError:
+        pass
+    return expected, state
+
+
+def validate_against_engine(result: SimulationResult, sample: int = 20,
+                            seed: int | None = None) -> list[str]:
+    """
+    Replay sampled runs through the real engine and compare outcomes.
+
+    Each sampled run is checked three ways: the batch result against a
+    fresh replay of the abstract rules, and that replay's ending, balance,
+    components and AE phase against the engine's final GameState.
+
+    Returns a list of human-readable mismatches (empty when all agree).
+    """
+    chosen = random.Random(seed).sample(range(result.runs), min(sample, result.runs))
+    mismatches = []
+    for run in sorted(chosen):
+        expected, state = replay(result, run)
+        engine_built = state.device_state.mask
+        checks = [
+            ("batch ending", result.endings[run], expected.ending),
+            ("batch balance", int(result.balances[run]), expected.balance),
+            ("batch components", int(result.components[run]), expected.built),
+            ("engine ending", expected.ending, state.ending_type),
+            ("engine balance", expected.balance, state.hero.curr_balance),
+            ("engine components", expected.built, engine_built),
+            ("engine phase", expected.phase, state.alter_ego.current_phase),
+        ]
+        for label, want, got in checks:
+            if want != got:
+                mismatches.append(f"run {run}: {label} {got!r} != simulated {want!r}")
+    return mismatches
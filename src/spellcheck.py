@@ -0,0 +1,200 @@
+"""
+spellcheck.py
+
+Typo-tolerant word lookup for the input parser.
+
+A BKTree indexes words by edit distance (Damerau-Levenshtein, so swapping
+two neighbouring letters is a single edit). Each node's children are keyed
+by their distance to it, and the triangle inequality rules out every child
+whose key is further than the tolerance from the query's own distance, so
+a search visits only a small part of the vocabulary.
+
+A Corrector keeps trees over the literal words of the command templates,
+over fixed names given up front (such as the store catalogue) and over the
+other names of the world's objects and rooms. The world is only
+walked when it has changed, new names are added to the index in place, and
+the index is rebuilt only when a name disappears from the world.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from .core.game_objects import Container, world_version
+
+if TYPE_CHECKING:
+    from .core.game_objects import Object
+
+
+def edit_distance(a: str, b: str) -> int:
+    """
+    Damerau-Levenshtein distance: insertions, deletions, substitutions and
+    transpositions of adjacent letters each cost one edit.
+    """
+    if a == b:
+        return 0
+    # Last row each letter was seen in, for transpositions across edits
+    last_row: dict[str, int] = {}
+    infinity = len(a) + len(b)
+    rows = [[infinity] * (len(b) + 2)]
+    rows += [[infinity] + list(range(len(b) + 1))]
+    for i in range(1, len(a) + 1):
+        row = [infinity, i] + [0] * len(b)
+        last_match_column = 0
+        for j in range(1, len(b) + 1):
+            k = last_row.get(b[j - 1], 0)
+            m = last_match_column
+            cost = 1
+            if a[i - 1] == b[j - 1]:
+                cost = 0
+                last_match_column = j
+            row[j + 1] = min(rows[i][j] + cost,       # substitution
+                             row[j] + 1,              # insertion
+                             rows[i][j + 1] + 1,      # deletion
+                             rows[k][m] + (i - k - 1) + 1 + (j - m - 1))  # transposition
+        rows.append(row)
+        last_row[a[i - 1]] = i
+    return rows[len(a) + 1][len(b) + 1]
+
+
+def tolerance(word: str) -> int:
+    """How many edits a typed word may be from the word meant."""
+    if len(word) < 3:
+        return 0
+    return 1 if len(word) <= 5 else 2
+
+
+class BKTree:
+    """
+    Burkhard-Keller tree over a set of words.
+
+    Attributes:
+        words: Every word indexed
+    """
+
+    def __init__(self, words: Iterable[str] = ()) -> None:
+        self.words: set[str] = set()
+        # Node: (word, {distance: child node})
+        self._root: tuple[str, dict[int, tuple]] | None = None
+        for word in sorted(set(words)):
+            self.add(word)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.words
+
+    def add(self, word: str) -> None:
+        """Index a word (again adding one already there does nothing)."""
+        if word in self.words:
+            return
+        self.words.add(word)
+        if self._root is None:
+            self._root = (word, {})
+            return
+        node = self._root
+        while True:
+            distance = edit_distance(word, node[0])
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = (word, {})
+                return
+            node = child
+
+    def search(self, word: str, max_distance: int) -> list[tuple[int, str]]:
+        """Every indexed word within max_distance edits, as (distance, word), nearest first."""
+        found: list[tuple[int, str]] = []
+        pending = [self._root] if self._root is not None else []
+        while pending:
+            node_word, children = pending.pop()
+            distance = edit_distance(word, node_word)
+            if distance <= max_distance:
+                found.append((distance, node_word))
+            for key, child in children.items():
+                if distance - max_distance <= key <= distance + max_distance:
+                    pending.append(child)
+        return sorted(found)
+
+
+def nearest(trees: Iterable[BKTree], word: str) -> list[str]:
+    """
+    The indexed words closest to a typed word, within its tolerance.
+
+    Returns:
+        Every word at the smallest distance found, sorted (empty if none)
+    """
+    found: list[tuple[int, str]] = []
+    for tree in trees:
+        found += tree.search(word, tolerance(word))
+    if not found:
+        return []
+    best = min(distance for distance, _ in found)
+    return sorted({candidate for distance, candidate in found if distance == best})
+
+
+def names_in(world: Container) -> frozenset[str]:
+    """The names of a container and everything inside it."""
+    names: set[str] = set()
+    pending: list[Object] = [world]
+    while pending:
+        item = pending.pop()
+        names.add(item.name)
+        if isinstance(item, Container):
+            pending.extend(item.contents)
+    return frozenset(names)
+
+
+class Corrector:
+    """
+    Spelling correction against command words and the names in a world.
+
+    Attributes:
+        keywords: Tree over the command templates' literal words
+        fixed_names: Tree over the names given up front
+        names: Tree over the other names in the world
+        rebuilds: How many times the world's names tree has been rebuilt
+    """
+
+    def __init__(self, keywords: Iterable[str], names: Iterable[str] = ()) -> None:
+        self.keywords = BKTree(keywords)
+        self.fixed_names = BKTree(names)
+        self.names = BKTree()
+        self._world_names: frozenset[str] = frozenset()
+        self._seen: tuple[int, int] | None = None
+        self.rebuilds = 0
+
+    def update(self, world: Container) -> None:
+        """
+        Follow the names in a world. The world is only walked when it has
+        changed; new names are added to the names tree, which is rebuilt
+        only when a name has gone.
+        """
+        seen = (id(world), world_version())
+        if seen == self._seen:
+            return
+        self._seen = seen
+        world_names = names_in(world) - self.fixed_names.words
+        if world_names == self._world_names:
+            return
+        if world_names >= self._world_names:
+            for name in sorted(world_names - self._world_names):
+                self.names.add(name)
+        else:
+            self.names = BKTree(world_names)
+            self.rebuilds += 1
+        self._world_names = world_names
+
+    def known(self, word: str) -> bool:
+        """Whether a word is a command word or a name."""
+        return word in self.keywords or word in self.fixed_names or word in self.names
+
+    def name_for(self, word: str) -> str | None:
+        """The one name a mistyped name is closest to, or None."""
+        candidates = nearest((self.fixed_names, self.names), word)
+        return candidates[0] if len(candidates) == 1 else None
+
+    def words_for(self, word: str) -> list[str]:
+        """The command words and names a mistyped word is closest to."""
+        return nearest((self.keywords, self.fixed_names, self.names), word)
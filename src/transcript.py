@@ -0,0 +1,140 @@
+"""
+transcript.py
+
+Streaming transcript recording for long-running games.
+
+TranscriptIO wraps another IOInterface and writes every output line and
+prompt to disk as a sequence of gzip members (one member per written chunk),
+keeping only a bounded tail in memory. Records are stored one per line as
+JSON strings so multi-line messages survive the round trip. Readers consume
+the transcript lazily through iter_lines() / iter_transcript().
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+from collections import deque
+from collections.abc import Iterator
+
+from .io_interface import IOInterface
+
+
+def iter_transcript(path: str) -> Iterator[str]:
+    """
+    Lazily yield the records of a transcript file written by TranscriptIO.
+
+    Concatenated gzip members are decompressed on the fly, so only one
+    record is held in memory at a time.
+    """
+    if not os.path.exists(path):
+        return
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            yield json.loads(line)
+
+
+class TranscriptIO(IOInterface):
+    """
+    IO decorator that streams the transcript to a compressed file.
+
+    Every output message and every prompt (mirroring MockIO, which records
+    prompts as outputs) is appended to an in-memory chunk. Once the chunk
+    reaches chunk_size records (or the transcript is closed) it is compressed
+    and appended to the file as a standalone gzip member; flush() only
+    passes through to the wrapped IO. Only the last tail_size records are kept in
+    memory for quick inspection.
+    """
+
+    def __init__(self, inner: IOInterface, path: str,
+                 chunk_size: int = 512, tail_size: int = 64) -> None:
+        """
+        Args:
+            inner: The IO implementation that performs the actual I/O
+            path: Transcript file to create (truncated if it exists)
+            chunk_size: Number of records per compressed chunk
+            tail_size: Number of most recent records kept in memory
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        self.inner = inner
+        self.path = path
+        self.chunk_size = chunk_size
+        self.tail: deque[str] = deque(maxlen=tail_size)
+        self.line_count = 0
+        self.chunks_written = 0
+        self._chunk: list[str] = []
+        self._closed = False
+        # Start from an empty file so appended members form a fresh transcript
+        with open(path, "wb"):
+            pass
+
+    def output(self, message: str) -> None:
+        """Record the message, then forward it to the wrapped IO."""
+        self._record(message)
+        self.inner.output(message)
+
+    def get_input(self, prompt: str) -> str:
+        """Record the prompt, then read input through the wrapped IO."""
+        self._record(prompt)
+        return self.inner.get_input(prompt)
+
+    def sleep(self, seconds: float) -> None:
+        """Sleeping is delegated unchanged."""
+        self.inner.sleep(seconds)
+
+    def _record(self, message: str) -> None:
+        """Append a record to the current chunk, flushing when it is full."""
+        if self._closed:
+            raise ValueError("Transcript is closed")
+        self._chunk.append(json.dumps(message))
+        self.tail.append(message)
+        self.line_count += 1
+        if len(self._chunk) >= self.chunk_size:
+            self._write_chunk()
+
+    def flush(self) -> None:
+        """
+        Deliver the wrapped IO's buffered output. The transcript itself is
+        only written a chunk at a time (see _write_chunk), so flushing once
+        per turn does not cut it into tiny gzip members.
+        """
+        self.inner.flush()
+
+    def _write_chunk(self) -> None:
+        """Compress the pending chunk and append it to the transcript file."""
+        if not self._chunk:
+            return
+        data = ("\n".join(self._chunk) + "\n").encode("utf-8")
+        with open(self.path, "ab") as f:
+            f.write(gzip.compress(data))
+        self._chunk.clear()
+        self.chunks_written += 1
+
+    def close(self) -> None:
+        """
+        Write any pending records and flush the wrapped IO. Further
+        recording raises ValueError.
+        """
+        if not self._closed:
+            self._write_chunk()
+            self.inner.flush()
+            self._closed = True
+
+    def iter_lines(self) -> Iterator[str]:
+        """
+        Lazily yield every record written so far, oldest first.
+
+        Pending records are flushed first so the file holds the full
+        transcript; the file is then streamed chunk by chunk.
+        """
+        if not self._closed:
+            self._write_chunk()
+        return iter_transcript(self.path)
+
+    def __enter__(self) -> TranscriptIO:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,116 @@
+"""
+Tests for legal-action enumeration.
+"""
+
+import pytest
+
+from src import inputparser
+from src.action_space import ActionSpace, legal_actions
+from src.commands.game_commands import DebugItemsCommand, EnterRoomCommand, OpenThingCommand
+from src.core.game_objects import Object
+from src.core.game_world import GameState
+from src.core.rooms import Closet
+from src.io_interface import MockIO
+
+
+class TestActionSpace:
+    def setup_method(self):
+        self.state = GameState(MockIO())
+
+    def test_every_action_parses(self):
+        OpenThingCommand("fridge").execute(self.state)
+        for action in legal_actions(self.state):
+            self.state.io.set_inputs(["1"])  # ponder asks for hours
+            ok, command = inputparser.parse(action, self.state.io)
+            assert ok, action
+
+    def test_aliases_deduplicated(self):
+        actions = list(legal_actions(self.state))
+        assert "go in closet" in actions
+        assert "go to closet" not in actions
+        assert "enter closet" not in actions
+        assert "look in fridge" not in actions
+        assert len(actions) == len(set(actions))
+        DebugItemsCommand().execute(self.state)
+        EnterRoomCommand("closet").execute(self.state)
+        actions = list(legal_actions(self.state))
+        assert actions.count("nail wood to exit") == 1
+        assert "nail self in" not in actions
+
+    def test_argument_free_actions_need_can_execute(self):
+        space = legal_actions(self.state)
+        assert "call phone" in space
+        assert "nail wood to exit" not in space
+        assert "take an ice bath" not in space
+        assert "disassemble frame" not in space
+        EnterRoomCommand("closet").execute(self.state)
+        assert "call phone" not in space
+        assert "inventory" in space
+        for action in space:
+            if action != "ponder":
+                ok, command = inputparser.parse(action, self.state.io)
+                assert command.can_execute(self.state), action
+
+    def test_mail_check_needs_check(self):
+        space = legal_actions(self.state)
+        assert "mail check" not in space
+        Object("check", self.state.hero)
+        assert "mail check" in space
+
+    def test_closet_nailed_refreshes(self):
+        DebugItemsCommand().execute(self.state)
+        EnterRoomCommand("closet").execute(self.state)
+        space = legal_actions(self.state)
+        assert "nail wood to exit" in space
+        self.state.apartment.closet.state = Closet.State.NAILED
+        assert "nail wood to exit" not in space
+
+    def test_current_room_excluded(self):
+        assert "go in main" not in legal_actions(self.state)
+
+    def test_open_and_close_follow_state(self):
+        space = legal_actions(self.state)
+        assert "open fridge" in space
+        assert "close fridge" not in space
+        OpenThingCommand("fridge").execute(self.state)
+        assert "open fridge" not in space
+        assert "close fridge" in space
+
+    def test_contents_need_clear_path(self):
+        DebugItemsCommand().execute(self.state)
+        EnterRoomCommand("closet").execute(self.state)
+        space = legal_actions(self.state)
+        takeable = [action for action in space if action.startswith("pick up")]
+        for action in takeable:
+            ok, command = inputparser.parse(action, self.state.io)
+            assert command.can_execute(self.state), action
+
+    def test_stable_and_indexable(self):
+        space = legal_actions(self.state)
+        assert list(space) == list(ActionSpace(self.state))
+        assert space[space.index("ponder")] == "ponder"
+        with pytest.raises(ValueError):
+            space.index("fly away")
+
+    def test_cached_until_world_changes(self):
+        space = legal_actions(self.state)
+        assert legal_actions(self.state) is space
+        actions = space.actions
+        assert space.actions is actions
+        OpenThingCommand("fridge").execute(self.state)
+        assert space.actions is not actions
+
+    def test_moving_refreshes(self):
+        space = legal_actions(self.state)
+        assert "watch tv" in space
+        EnterRoomCommand("closet").execute(self.state)
+        assert "watch tv" not in space
+        assert "go in main" in space
+
+    def test_dream_confrontation(self):
+        self.state.in_dream_confrontation = True
+        assert list(legal_actions(self.state)) == ["let go", "hold on"]
+
+    def test_undo_only_with_history(self):
+        assert "undo" not in legal_actions(self.state)
+        assert "redo" not in legal_actions(self.state)
@@ -10,7 +10,7 @@ Tests cover:
     - Phase 5 (Activation): installing convergence-device, activation flag
     - Closet trap counter-mechanic
     - Barricade counter-mechanic
-    - Item search helpers (_find_item_in_apartment)
+    - Item search (recipes.apartment_items)
     - Full 5-phase lifecycle tests
     - Evidence text in IntroPrompt
     - SuperNumber Day 6+ conditional response
@@ -25,6 +25,7 @@ from src.io_interface import MockIO
 from src.core.game_objects import Object, Container
 from src.core.rooms import Closet
 from src.delivery import EventQueue
+from src.recipes import apartment_items
 
 
 class TestAlterEgoInitialization:
@@ -134,8 +135,19 @@ class TestPhaseSurveying:
         """Phase 1 schedules delivery events."""
         self.state.hero.curr_balance = 200
         self.ae.run(self.state)
-        # Should have scheduled 4 delivery events
-        assert len(self.state.event_queue.queue) == 4
+        # All four items arrive in the toolbox together as one batch
+        assert len(self.state.event_queue.queue) == 1
+        batch, _ = self.state.event_queue.queue[0]
+        assert len(batch.orders) == 4
+
+    def test_orders_are_indexed_as_pending(self):
+        """AE orders are listed as pending deliveries placed by the AE."""
+        self.state.hero.curr_balance = 200
+        self.ae.run(self.state)
+        orders = self.state.event_queue.orders.expected(placed_by="alter-ego")
+        assert [order.name for order in orders] == [
+            "copper-wire", "metal-brackets", "vacuum-tubes", "battery-pack"]
+        assert self.state.event_queue.orders.expected(placed_by="hero") == []
 
 
 class TestPhaseFrame:
@@ -462,60 +474,54 @@ class TestBarricade:
 
 
 class TestItemSearch:
-    """Tests for _find_item_in_apartment helper."""
+    """Tests for apartment_items, the AE's view of what it can reach."""
 
     def setup_method(self):
         self.mock_io = MockIO()
         self.state = GameState(self.mock_io)
-        self.ae = AlterEgo()
+
+    def find(self, name):
+        _, found = apartment_items(self.state)
+        return found.get(name, [None])[0]
 
     def test_finds_item_in_toolbox(self):
         """AE finds items in the toolbox."""
         Object("copper-wire", self.state.apartment.main.toolbox)
-        result = self.ae._find_item_in_apartment(self.state, "copper-wire")
+        result = self.find("copper-wire")
         assert result is not None
         assert result.name == "copper-wire"
 
     def test_finds_item_in_fridge(self):
         """AE finds items in the fridge."""
         Object("ice-cubes", self.state.apartment.main.fridge)
-        result = self.ae._find_item_in_apartment(self.state, "ice-cubes")
-        assert result is not None
+        assert self.find("ice-cubes") is not None
 
     def test_finds_item_on_table(self):
         """AE finds items on the table."""
         Object("plywood-sheet", self.state.apartment.main.table)
-        result = self.ae._find_item_in_apartment(self.state, "plywood-sheet")
-        assert result is not None
+        assert self.find("plywood-sheet") is not None
 
     def test_finds_item_in_hero_inventory(self):
-        """AE finds items in hero's inventory."""
-        item = Object("hammer", None)
-        item.parent = self.state.hero
-        self.state.hero.contents.append(item)
-        result = self.ae._find_item_in_apartment(self.state, "hammer")
-        assert result is not None
+        """AE finds items in hero's inventory, before the apartment."""
+        Object("hammer", self.state.apartment.main.toolbox)
+        item = Object("hammer", self.state.hero)
+        assert self.find("hammer") is item
 
     def test_finds_items_across_multiple_containers(self):
         """AE finds items spread across different containers."""
         Object("hammer", self.state.apartment.main.toolbox)
         Object("plywood-sheet", self.state.apartment.main.table)
-        
-        hammer = self.ae._find_item_in_apartment(self.state, "hammer")
-        plywood = self.ae._find_item_in_apartment(self.state, "plywood-sheet")
-        assert hammer is not None
-        assert plywood is not None
+        assert self.find("hammer") is not None
+        assert self.find("plywood-sheet") is not None
 
     def test_returns_none_for_nonexistent_item(self):
-        """AE returns None when item doesn't exist."""
-        result = self.ae._find_item_in_apartment(self.state, "nonexistent-item")
-        assert result is None
+        """AE finds nothing when the item doesn't exist."""
+        assert self.find("nonexistent-item") is None
 
     def test_finds_item_in_bedroom(self):
         """AE finds items placed in the bedroom."""
         Object("device-frame", self.state.apartment.bedroom)
-        result = self.ae._find_item_in_apartment(self.state, "device-frame")
-        assert result is not None
+        assert self.find("device-frame") is not None
 
 
 class TestConsumeItem:
@@ -524,6 +530,7 @@ class TestConsumeItem:
     def setup_method(self):
         self.mock_io = MockIO()
         self.state = GameState(self.mock_io)
+        self.state.SetEventQueue(EventQueue(self.state))
         self.ae = AlterEgo()
 
     def test_removes_item_from_container(self):
@@ -531,14 +538,28 @@ class TestConsumeItem:
         toolbox = self.state.apartment.main.toolbox
         item = Object("copper-wire", toolbox)
         
-        self.ae._consume_item(item)
+        self.ae._consume_item(self.state, item)
         assert item not in toolbox.contents
         assert item.parent is None
 
     def test_handles_item_with_no_parent(self):
         """Consuming an item with no parent doesn't crash."""
         item = Object("test", None)
-        self.ae._consume_item(item)  # Should not raise
+        self.ae._consume_item(self.state, item)  # Should not raise
+
+    def test_consuming_prunes_orders_placed(self):
+        """Ordered items drop out of orders_placed once used."""
+        self.ae.orders_placed = ["copper-wire", "battery-pack"]
+        self.ae._consume_item(self.state, Object("copper-wire", self.state.apartment.main.toolbox))
+        assert self.ae.orders_placed == ["battery-pack"]
+
+    def test_consuming_keeps_orders_on_the_way(self):
+        """Using up an item the hero bought keeps the AE's pending order of it."""
+        self.state.hero.curr_balance = 100
+        self.ae._try_order(self.state, "copper-wire", 15)
+        self.ae._consume_item(self.state, Object("copper-wire", self.state.hero))
+        assert self.ae.orders_placed == ["copper-wire"]
+        assert len(self.state.event_queue.orders.expected("copper-wire", placed_by="alter-ego")) == 1
 
 
 class TestCannotOrderWithoutFunds:
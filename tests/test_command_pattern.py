@@ -5,20 +5,28 @@ Tests the base command interface, concrete command implementations,
 command invoker, command history, and macro commands.
 """
 
+import asyncio
+import queue
+import threading
 import unittest
 from unittest.mock import Mock, patch
 from datetime import datetime, timedelta
 
+from src.core.game_objects import Object, Openable
 from src.core.game_world import GameState
-from src.io_interface import MockIO
+from src.delivery import EventQueue
+from src.io_interface import AsyncQueueIO, MockIO
 from src.commands.base_command import BaseCommand, CommandResult, MacroCommand
 from src.commands.game_commands import (
     EnterRoomCommand, ExamineThingCommand, GetObjectCommand,
     InventoryCommand, CheckBalanceCommand, PonderCommand,
     DebugItemsCommand, OpenThingCommand, CloseThingCommand,
-    CheckFeelCommand, LookAtWatchCommand, TakeIceBathCommand
+    CheckFeelCommand, LookAtWatchCommand, TakeIceBathCommand,
+    CheckOrdersCommand, CancelOrderCommand, CallPhoneCommand
+)
+from src.commands.command_invoker import (
+    CommandInvoker, BatchCommandInvoker, SerializedCommandInvoker, AsyncCommandInvoker
 )
-from src.commands.command_invoker import CommandInvoker, BatchCommandInvoker
 from src.commands.command_history import CommandHistory, UndoCommand, RedoCommand
 from src.commands.macro_commands import (
     ExploreRoomMacro, GetFromContainerMacro, StatusCheckMacro,
@@ -681,4 +689,304 @@ class TestTakeIceBathCommand(unittest.TestCase):
 
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
+
+class TestOrderCommands(unittest.TestCase):
+    """Test listing and cancelling pending orders."""
+
+    def setUp(self):
+        self.mock_io = MockIO()
+        self.game_state = GameState(self.mock_io)
+        self.game_state.SetEventQueue(EventQueue(self.game_state))
+        self.toolbox = self.game_state.apartment.main.toolbox
+        self.tomorrow = self.game_state.watch.curr_time + timedelta(days=1)
+
+    def test_no_orders(self):
+        result = CheckOrdersCommand().execute(self.game_state)
+        self.assertTrue(result.success)
+        self.assertEqual(result.message, "Nothing on order.")
+
+    def test_lists_hero_orders_only(self):
+        queue = self.game_state.event_queue
+        queue.AddDelivery(self.toolbox, "hammer", self.tomorrow, cost=20)
+        queue.AddDelivery(self.toolbox, "copper-wire", self.tomorrow, placed_by="alter-ego")
+        CheckOrdersCommand().execute(self.game_state)
+        outputs = "\n".join(self.mock_io.outputs)
+        self.assertIn("hammer", outputs)
+        self.assertNotIn("copper-wire", outputs)
+
+    def test_cancel_refunds(self):
+        self.game_state.hero.curr_balance = 80
+        order = self.game_state.event_queue.AddDelivery(self.toolbox, "hammer",
+                                                        self.tomorrow, cost=20)
+        result = CancelOrderCommand("hammer").execute(self.game_state)
+        self.assertTrue(result.success)
+        self.assertFalse(order.pending)
+        self.assertEqual(self.game_state.hero.curr_balance, 100)
+        self.assertEqual(len(self.game_state.event_queue.orders), 0)
+
+    def test_cancel_unknown_order(self):
+        result = CancelOrderCommand("hammer").execute(self.game_state)
+        self.assertFalse(result.success)
+
+
+class TestCommandBindings(unittest.TestCase):
+    """Test that preconditions are resolved once and reused by execute."""
+
+    def setUp(self):
+        self.mock_io = MockIO()
+        self.game_state = GameState(self.mock_io)
+        self.box = Openable("box", self.game_state.apartment.main)
+        self.hammer = Object("hammer", self.box)
+
+    def test_base_command_binds_nothing(self):
+        command = BlockingCommand([], "tag")
+        self.assertEqual(command.bindings(self.game_state), {})
+
+    def test_execute_reuses_can_execute_lookups(self):
+        self.box.state = Openable.State.OPEN
+        command = GetObjectCommand("hammer", "box")
+        with patch.object(GetObjectCommand, "resolve",
+                          wraps=command.resolve) as resolve:
+            self.assertTrue(command.can_execute(self.game_state))
+            self.assertTrue(command.can_execute(self.game_state))
+            result = command.execute(self.game_state)
+        self.assertTrue(result.success)
+        self.assertEqual(resolve.call_count, 1)
+        self.assertIn(self.hammer, self.game_state.hero.contents)
+
+    def test_world_change_resolves_again(self):
+        command = GetObjectCommand("hammer", "box")
+        self.assertFalse(command.can_execute(self.game_state))
+        self.assertEqual(command.execute(self.game_state).message, "Try opening it first.")
+
+        self.box.state = Openable.State.OPEN
+        self.assertTrue(command.can_execute(self.game_state))
+        self.box.contents.remove(self.hammer)
+        self.assertFalse(command.can_execute(self.game_state))
+        self.assertEqual(command.execute(self.game_state).message,
+                         "I don't see that in the box.")
+
+    def test_bindings_follow_the_hero(self):
+        command = TakeIceBathCommand()
+        Object("ice-cubes", self.game_state.hero)
+        self.assertFalse(command.can_execute(self.game_state))
+        EnterRoomCommand("bathroom").execute(self.game_state)
+        self.assertTrue(command.can_execute(self.game_state))
+
+    def test_bindings_are_per_game(self):
+        command = EnterRoomCommand("bedroom")
+        other = GameState(MockIO())
+        self.assertTrue(command.can_execute(self.game_state))
+        self.assertIs(command.bindings(other)["room"], other.apartment.bedroom)
+
+    def test_macro_checks_share_bindings(self):
+        self.box.state = Openable.State.OPEN
+        command = GetObjectCommand("hammer", "box")
+        macro = MacroCommand([command])
+        with patch.object(GetObjectCommand, "resolve",
+                          wraps=command.resolve) as resolve:
+            self.assertTrue(macro.can_execute(self.game_state))
+            self.assertTrue(macro.execute(self.game_state).success)
+        self.assertEqual(resolve.call_count, 1)
+
+
+class BlockingCommand(BaseCommand):
+    """Command that records its tag and optionally waits for a gate."""
+
+    def __init__(self, log, tag, gate=None):
+        super().__init__(f"Blocking {tag}")
+        self.log = log
+        self.tag = tag
+        self.gate = gate
+
+    def execute(self, game_state):
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.log.append(self.tag)
+        self.mark_executed()
+        return CommandResult(success=True, message=str(self.tag))
+
+
+class TestSerializedCommandInvoker(unittest.TestCase):
+    """Test serialized execution against a shared world."""
+
+    def setUp(self):
+        self.game_state = GameState(MockIO())
+        self.invoker = SerializedCommandInvoker(self.game_state, max_pending=4)
+
+    def tearDown(self):
+        self.invoker.close()
+
+    def test_submit_returns_future_result(self):
+        future = self.invoker.submit(CheckBalanceCommand())
+        self.assertEqual(future.result(5).message, "Current Balance: $100")
+
+    def test_submissions_run_in_order(self):
+        log = []
+        futures = [self.invoker.submit(BlockingCommand(log, i)) for i in range(20)]
+        self.assertEqual([f.result(5).message for f in futures], [str(i) for i in range(20)])
+        self.assertEqual(log, list(range(20)))
+
+    def test_many_threads_are_serialized(self):
+        def ponder():
+            for _ in range(10):
+                self.invoker.submit(PonderCommand(1)).result(5)
+
+        threads = [threading.Thread(target=ponder) for _ in range(4)]
+        start_time = self.game_state.watch.curr_time
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.game_state.watch.curr_time - start_time, timedelta(hours=40))
+
+    def test_full_queue_applies_backpressure(self):
+        log = []
+        gate = threading.Event()
+        first = self.invoker.submit(BlockingCommand(log, "first", gate))
+        while self.invoker.pending():
+            pass  # Wait for the worker to pick up the blocking command
+        for i in range(4):
+            self.invoker.submit(BlockingCommand(log, i))
+        with self.assertRaises(queue.Full):
+            self.invoker.submit(BlockingCommand(log, "overflow"), timeout=0.01)
+        gate.set()
+        first.result(5)
+
+    def test_submit_async(self):
+        async def play():
+            return await asyncio.gather(
+                self.invoker.submit_async(CheckBalanceCommand()),
+                self.invoker.submit_async(CheckFeelCommand()),
+            )
+
+        balance, feel = asyncio.run(play())
+        self.assertEqual(balance.message, "Current Balance: $100")
+        self.assertEqual(feel.message, "Feeling good")
+
+    def test_closed_invoker_rejects_commands(self):
+        self.invoker.close()
+        with self.assertRaises(RuntimeError):
+            self.invoker.submit(CheckBalanceCommand())
+
+    def test_direct_execution_still_works(self):
+        result = self.invoker.execute_command(CheckBalanceCommand(), self.game_state)
+        self.assertTrue(result.success)
+
+    def fill_queue(self, log, gate):
+        """Park the worker on a gated command and fill the queue behind it."""
+        first = self.invoker.submit(BlockingCommand(log, "first", gate))
+        while self.invoker.pending():
+            pass  # Wait for the worker to pick up the blocking command
+        queued = [self.invoker.submit(BlockingCommand(log, i)) for i in range(4)]
+        return [first] + queued
+
+    def test_close_without_wait_never_blocks_on_full_queue(self):
+        log = []
+        gate = threading.Event()
+        submitted = self.fill_queue(log, gate)
+        closer = threading.Thread(target=self.invoker.close, kwargs={"wait": False})
+        closer.start()
+        closer.join(1)
+        self.assertFalse(closer.is_alive())
+        gate.set()
+        # Commands submitted before close still execute
+        self.assertEqual([f.result(5).message for f in submitted], ["first", "0", "1", "2", "3"])
+
+    def test_waiting_submitter_fails_on_close(self):
+        log = []
+        gate = threading.Event()
+        self.fill_queue(log, gate)
+        errors = []
+
+        def submit():
+            try:
+                self.invoker.submit(BlockingCommand(log, "late"))
+            except RuntimeError as error:
+                errors.append(error)
+
+        waiter = threading.Thread(target=submit)
+        waiter.start()
+        self.invoker.close(wait=False)
+        waiter.join(1)
+        gate.set()
+        self.invoker.close()
+        self.assertEqual(len(errors), 1)
+        self.assertNotIn("late", log)
+
+    def test_submissions_racing_close_all_resolve(self):
+        invoker = SerializedCommandInvoker(self.game_state, max_pending=2)
+        submitted = []
+
+        def submit():
+            for _ in range(50):
+                try:
+                    submitted.append(invoker.submit(CheckBalanceCommand()))
+                except RuntimeError:
+                    return
+
+        threads = [threading.Thread(target=submit) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        invoker.close(wait=False)
+        for thread in threads:
+            thread.join(5)
+        invoker.close()
+        for future in submitted:
+            self.assertTrue(future.done())
+
+
+class TestAsyncCommandInvoker(unittest.TestCase):
+    """Test awaiting commands whose prompts park the session."""
+
+    def new_session(self):
+        io = AsyncQueueIO()
+        game_state = GameState(io)
+        game_state.SetEventQueue(EventQueue(game_state))
+        return io, game_state
+
+    def test_plain_commands_run(self):
+        async def check():
+            _, game_state = self.new_session()
+            return await AsyncCommandInvoker().execute_command_async(
+                CheckBalanceCommand(), game_state)
+
+        self.assertEqual(asyncio.run(check()).message, "Current Balance: $100")
+
+    def test_many_sessions_parked_mid_call(self):
+        """One event loop interleaves sessions waiting inside a phone call."""
+        async def play():
+            invoker = AsyncCommandInvoker()
+            sessions = [self.new_session() for _ in range(200)]
+            tasks = [asyncio.create_task(invoker.execute_command_async(CallPhoneCommand(), state))
+                     for _, state in sessions]
+            await asyncio.sleep(0)
+            # Every session is now waiting for a number
+            self.assertTrue(all(io.outputs[-1] == "What number?: " for io, _ in sessions))
+            self.assertFalse(any(task.done() for task in tasks))
+
+            for io, _ in sessions:
+                io.feed("592-2874", "duct-tape")
+            return await asyncio.gather(*tasks), sessions
+
+        results, sessions = asyncio.run(play())
+        self.assertTrue(all(result.success for result in results))
+        for io, game_state in sessions:
+            self.assertEqual(game_state.hero.curr_balance, 97)
+            self.assertIn("Thanks! We'll get that out to you in a couple days.", io.outputs)
+
+    def test_async_and_sync_calls_match(self):
+        mock_io = MockIO()
+        mock_io.set_inputs(["288-7955", "bananas"])
+        game_state = GameState(mock_io)
+        game_state.SetEventQueue(EventQueue(game_state))
+        CallPhoneCommand().execute(game_state)
+
+        async def call():
+            io, state = self.new_session()
+            io.feed("288-7955", "bananas")
+            await AsyncCommandInvoker().execute_command_async(CallPhoneCommand(), state)
+            return io
+
+        self.assertEqual(asyncio.run(call()).outputs, mock_io.get_all_outputs())
@@ -4,6 +4,7 @@ Tests for the delivery/event queue system.
 
 import pytest
 from datetime import datetime, timedelta
+from src.core.game_objects import Container, Object
 from src.delivery import EventQueue
 from src.gamestate import GameState
 from src.io_interface import MockIO
@@ -113,4 +114,198 @@ class TestEventQueue:
         assert len(self.queue.queue) == 0
         assert len(executed) == 2
         assert "action1" in executed
-        assert "action2" in executed
\ No newline at end of file
+        assert "action2" in executed
+
+class TestDeliveryBatching:
+    def setup_method(self):
+        self.mock_io = MockIO()
+        self.state = GameState(self.mock_io)
+        self.queue = EventQueue(self.state)
+        self.toolbox = Container("toolbox", None)
+        self.fridge = Container("fridge", None)
+        self.when = self.state.watch.curr_time + timedelta(days=1)
+
+    def test_same_time_and_container_coalesce(self):
+        for name in ("hammer", "copper-wire", "duct-tape"):
+            self.queue.AddDelivery(self.toolbox, name, self.when)
+        assert len(self.queue.queue) == 1
+
+        self.state.watch.curr_time = self.when
+        self.queue.Examine()
+        assert [item.name for item in self.toolbox.contents] == \
+            ["hammer", "copper-wire", "duct-tape"]
+        assert all(item.parent is self.toolbox for item in self.toolbox.contents)
+
+    def test_different_time_or_container_stay_separate(self):
+        self.queue.AddDelivery(self.toolbox, "hammer", self.when)
+        self.queue.AddDelivery(self.fridge, "bananas", self.when)
+        self.queue.AddDelivery(self.fridge, "caffeine", self.when + timedelta(hours=1))
+        assert len(self.queue.queue) == 3
+
+    def test_no_coalescing_across_other_events(self):
+        """An event scheduled in between keeps its place in the firing order."""
+        fired = []
+        self.queue.AddDelivery(self.toolbox, "hammer", self.when, message="first")
+        self.queue.AddEvent(lambda *_: fired.append(len(self.toolbox.contents)), self.when)
+        self.queue.AddDelivery(self.toolbox, "nails", self.when, message="second")
+        assert len(self.queue.queue) == 3
+
+        self.state.watch.curr_time = self.when
+        self.queue.Examine()
+        assert fired == [1]
+        assert self.mock_io.outputs == ["first", "second"]
+
+    def test_messages_follow_order(self):
+        for name in ("bananas", "caffeine"):
+            self.queue.AddDelivery(self.fridge, name, self.when,
+                                   lambda name=name: Object(name, None), f"{name} arrived")
+        self.state.watch.curr_time = self.when
+        self.queue.Examine()
+        assert self.mock_io.outputs == ["bananas arrived", "caffeine arrived"]
+
+
+class TestRecurringEvents:
+    def setup_method(self):
+        self.state = GameState(MockIO())
+        self.queue = EventQueue(self.state)
+        self.start = self.state.watch.curr_time
+        self.fired = []
+
+    def record(self, curr_time, event_time):
+        self.fired.append(event_time)
+
+    def advance(self, delta):
+        self.state.watch.curr_time += delta
+        return self.queue.Examine()
+
+    def test_recurring_event_rearms(self):
+        handle = self.queue.AddRecurringEvent(self.record, self.start + timedelta(days=1),
+                                              timedelta(days=2))
+        assert handle.next_fire == self.start + timedelta(days=1)
+        assert self.advance(timedelta(days=1)) == 1
+        assert handle.next_fire == self.start + timedelta(days=3)
+        self.advance(timedelta(days=2))
+        assert self.fired == [self.start + timedelta(days=1), self.start + timedelta(days=3)]
+        assert len(self.queue.queue) == 1
+
+    def test_cancel_stops_recurrence(self):
+        handle = self.queue.AddRecurringEvent(self.record, self.start + timedelta(hours=1),
+                                              timedelta(hours=1))
+        self.advance(timedelta(hours=1))
+        handle.cancel()
+        handle.cancel()
+        assert handle.next_fire is None
+        self.advance(timedelta(days=1))
+        assert len(self.fired) == 1
+        assert self.queue.queue == []
+        assert self.queue.NextEventTime() is None
+
+    def test_action_can_cancel_its_own_recurrence(self):
+        handle = self.queue.AddRecurringEvent(lambda *_: handle.cancel(),
+                                              self.start + timedelta(hours=1), timedelta(hours=1))
+        self.advance(timedelta(hours=1))
+        assert handle.cancelled
+        assert self.queue.queue == []
+
+    def test_next_event_time_tracks_earliest(self):
+        late = self.queue.AddEvent(self.record, self.start + timedelta(days=3))
+        early = self.queue.AddEvent(self.record, self.start + timedelta(minutes=30))
+        assert self.queue.NextEventTime() == self.start + timedelta(minutes=30)
+        early.cancel()
+        assert self.queue.NextEventTime() == late.next_fire
+
+    def test_same_hour_events_wait_for_their_minute(self):
+        self.queue.AddEvent(self.record, self.start + timedelta(minutes=10))
+        self.queue.AddEvent(self.record, self.start + timedelta(minutes=40))
+        assert self.advance(timedelta(minutes=20)) == 1
+        assert self.queue.NextEventTime() == self.start + timedelta(minutes=40)
+        assert self.advance(timedelta(minutes=20)) == 1
+
+    def test_due_events_fire_in_scheduling_order(self):
+        order = []
+        self.queue.AddEvent(lambda *_: order.append("later"), self.start + timedelta(hours=5))
+        self.queue.AddEvent(lambda *_: order.append("sooner"), self.start + timedelta(hours=1))
+        self.advance(timedelta(days=1))
+        assert order == ["later", "sooner"]
+
+    def test_event_can_cancel_another_due_in_the_same_hour(self):
+        victim = []
+        canceller = self.queue.AddEvent(lambda *_: victim[0].cancel(),
+                                        self.start + timedelta(minutes=10))
+        victim.append(self.queue.AddEvent(self.record, self.start + timedelta(minutes=40)))
+        assert self.advance(timedelta(hours=1)) == 1
+        assert canceller.next_fire is None
+        assert victim[0].cancelled and victim[0].next_fire is None
+        assert self.fired == []
+        assert self.queue.queue == []
+        assert self.queue.NextEventTime() is None
+
+    def test_cancelled_order_in_due_batch_is_not_delivered(self):
+        toolbox = Container("toolbox", None)
+        orders = []
+        self.queue.AddEvent(lambda *_: orders[0].cancel(), self.start + timedelta(minutes=20))
+        orders.append(self.queue.AddDelivery(toolbox, "hammer", self.start + timedelta(minutes=30)))
+        assert self.advance(timedelta(hours=1)) == 1
+        assert toolbox.contents == []
+        assert len(self.queue.orders) == 0
+
+    def test_invalid_interval(self):
+        with pytest.raises(ValueError):
+            self.queue.AddRecurringEvent(self.record, self.start, timedelta(0))
+
+
+class TestPendingOrders:
+    def setup_method(self):
+        self.mock_io = MockIO()
+        self.state = GameState(self.mock_io)
+        self.queue = EventQueue(self.state)
+        self.toolbox = Container("toolbox", None)
+        self.fridge = Container("fridge", None)
+        self.start = self.state.watch.curr_time
+        self.tomorrow = self.start + timedelta(days=1)
+
+    def test_orders_are_indexed(self):
+        hammer = self.queue.AddDelivery(self.toolbox, "hammer", self.tomorrow, cost=20)
+        wire = self.queue.AddDelivery(self.toolbox, "copper-wire", self.tomorrow,
+                                      placed_by="alter-ego")
+        soup = self.queue.AddDelivery(self.fridge, "canned-soup", self.start + timedelta(hours=2))
+        orders = self.queue.orders
+        assert len(orders) == 3
+        assert orders.expected() == [soup, hammer, wire]
+        assert orders.expected("hammer") == [hammer]
+        assert orders.expected(container=self.toolbox) == [hammer, wire]
+        assert orders.expected(placed_by="alter-ego") == [wire]
+        assert orders.count("copper-wire") == 1
+        assert orders.due_at(self.tomorrow) == [hammer, wire]
+
+    def test_delivery_clears_index(self):
+        self.queue.AddDelivery(self.toolbox, "hammer", self.tomorrow)
+        self.state.watch.curr_time = self.tomorrow
+        self.queue.Examine()
+        assert len(self.queue.orders) == 0
+        assert self.queue.orders.expected("hammer") == []
+
+    def test_cancel_removes_item_from_batch(self):
+        hammer = self.queue.AddDelivery(self.toolbox, "hammer", self.tomorrow)
+        nails = self.queue.AddDelivery(self.toolbox, "box-of-nails", self.tomorrow)
+        hammer.cancel()
+        hammer.cancel()
+        assert not hammer.pending
+        assert self.queue.orders.expected() == [nails]
+
+        self.state.watch.curr_time = self.tomorrow
+        self.queue.Examine()
+        assert [item.name for item in self.toolbox.contents] == ["box-of-nails"]
+
+    def test_cancelling_whole_batch_drops_event(self):
+        order = self.queue.AddDelivery(self.toolbox, "hammer", self.tomorrow)
+        order.cancel()
+        assert self.queue.queue == []
+        assert self.queue.NextEventTime() is None
+
+    def test_cancel_after_delivery_is_ignored(self):
+        order = self.queue.AddDelivery(self.toolbox, "hammer", self.tomorrow)
+        self.state.watch.curr_time = self.tomorrow
+        self.queue.Examine()
+        order.cancel()
+        assert len(self.toolbox.contents) == 1
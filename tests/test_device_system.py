@@ -178,3 +178,45 @@ class TestGetComponents:
         ds.build_component("focusing-array")
         ds.build_component("convergence-device")
         assert len(ds.get_built_components()) + len(ds.get_missing_components()) == 5
+
+    def test_returned_lists_are_copies(self):
+        ds = DeviceState()
+        ds.get_missing_components().clear()
+        assert len(ds.get_missing_components()) == 5
+
+
+class TestMask:
+    """Tests for the bitmask fingerprint of the device."""
+
+    def test_mask_starts_empty(self):
+        assert DeviceState().mask == 0
+
+    def test_mask_bits_follow_component_order(self):
+        ds = DeviceState()
+        ds.build_component("power-core")
+        ds.build_component("device-frame")
+        assert ds.mask == 0b00101
+        assert ds.mask == DeviceState.COMPONENT_BITS["power-core"] | DeviceState.COMPONENT_BITS["device-frame"]
+
+    def test_complete_mask(self):
+        ds = DeviceState()
+        for comp in DeviceState.COMPONENTS:
+            ds.build_component(comp)
+        assert ds.mask == DeviceState.ALL_BUILT
+        ds.remove_component("wiring-harness")
+        assert ds.mask == DeviceState.ALL_BUILT & ~0b00010
+
+    def test_every_mask_matches_component_queries(self):
+        for mask in range(DeviceState.ALL_BUILT + 1):
+            ds = DeviceState()
+            for i, comp in enumerate(DeviceState.COMPONENTS):
+                if mask >> i & 1:
+                    ds.build_component(comp)
+            built = [c for c in DeviceState.COMPONENTS if ds.is_component_built(c)]
+            assert ds.mask == mask
+            assert ds.get_built_components() == built
+            assert ds.get_missing_components() == [c for c in DeviceState.COMPONENTS
+                                                   if c not in built]
+            assert ds.count_built_components() == len(built)
+            assert ds.count_missing_components() == 5 - len(built)
+            assert ds.is_device_complete() == (len(built) == 5)
@@ -9,6 +9,7 @@ from datetime import timedelta
 from src.io_interface import MockIO
 from src.gamestate import GameState
 from src.endings import (
+    EndingEvaluator,
     GameEndings,
     VICTORY_TEXT,
     PARTIAL_VICTORY_TEXT,
@@ -204,6 +205,58 @@ class TestGameStateFlags:
         assert self.state.in_dream_confrontation is False
 
 
+class TestEndingEvaluator:
+    """Tests for the cached, change-driven ending evaluation."""
+
+    def setup_method(self):
+        self.state = GameState(MockIO())
+        self.endings = self.state.endings
+
+    def assert_matches(self):
+        assert self.endings.ending() == GameEndings.check_ending(self.state)
+        assert self.endings.secret_ending() == GameEndings.check_secret_ending(self.state)
+
+    def test_game_state_has_evaluator(self):
+        assert isinstance(self.endings, EndingEvaluator)
+
+    def test_unchanged_inputs_not_reevaluated(self):
+        self.endings.ending()
+        evaluations = self.endings.evaluations
+        for _ in range(100):
+            self.state.watch.curr_time += timedelta(minutes=1)
+            self.endings.ending()
+            self.endings.secret_ending()
+        assert self.endings.evaluations == evaluations
+
+    def test_day_rollover(self):
+        self.state.watch.curr_time += timedelta(days=5, hours=20)
+        assert self.endings.ending() is None
+        self.state.watch.curr_time += timedelta(hours=4)
+        assert self.state.get_current_day() == 7
+        assert self.endings.ending() == "victory"
+        self.state.watch.curr_time -= timedelta(hours=4)
+        assert self.endings.ending() is None
+
+    def test_components(self):
+        self.state.watch.curr_time += timedelta(days=6)
+        for component in self.state.device_state.COMPONENTS[:4]:
+            self.state.device_state.build_component(component)
+        assert self.endings.ending() == "partial_victory"
+        self.state.device_state.remove_component("device-frame")
+        self.assert_matches()
+        assert self.endings.ending() == "victory"
+
+    def test_flags(self):
+        self.state.watch.curr_time += timedelta(days=5)
+        self.state.journal_read = True
+        assert self.endings.secret_ending() is False
+        self.state.mirror_seen = True
+        assert self.endings.secret_ending() is True
+        self.state.device_activated = True
+        assert self.endings.ending() == "defeat"
+        self.assert_matches()
+
+
 class TestExamineSecretEndingTrigger:
     """Tests that GameState.Examine() triggers secret ending correctly."""
 
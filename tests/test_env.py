@@ -0,0 +1,107 @@
+"""
+Tests for the Gym-style game environments.
+"""
+
+import pytest
+
+from src.env import (ENDING_REWARDS, OBSERVATION_FIELDS, OBSERVATION_SIZE, GameEnv,
+                     VectorEnv)
+
+
+def field(obs, name):
+    return obs[OBSERVATION_FIELDS.index(name)]
+
+
+def rows(observations):
+    return [list(row) for row in observations]
+
+
+class TestGameEnv:
+    def setup_method(self):
+        self.env = GameEnv()
+
+    def test_reset_observation(self):
+        obs, info = self.env.reset()
+        assert len(obs) == OBSERVATION_SIZE
+        assert field(obs, "room:main") == 1.0
+        assert field(obs, "carrying:watch") == 1.0
+        assert field(obs, "feel") == 50.0
+        assert field(obs, "balance") == 100.0
+        assert field(obs, "day") == 1.0
+        assert any("You wake up" in message for message in info["messages"])
+
+    def test_step_plays_input(self):
+        self.env.reset()
+        obs, reward, done, info = self.env.step("go to closet")
+        assert field(obs, "room:closet") == 1.0
+        assert (reward, done) == (0.0, False)
+        assert info["messages"] == ["You are now in the closet"]
+
+    def test_prompt_answers(self):
+        self.env.reset()
+        obs, _, _, info = self.env.step(("ponder", "3"))
+        assert info["messages"] == ["You ponder for 3 hours."]
+        obs, _, _, info = self.env.step("ponder")
+        assert info["messages"] == ["You ponder for 1 hours."]
+        assert field(obs, "feel") == 10.0
+
+    def test_index_action(self):
+        self.env.reset()
+        actions = self.env.legal_actions()
+        _, _, _, info = self.env.step(actions.index("go in bedroom"))
+        assert info["input"] == "go in bedroom"
+
+    def test_reset_restores_world(self):
+        first, _ = self.env.reset()
+        self.env.step("debug items")
+        self.env.step(("ponder", "20"))
+        assert self.env.reset()[0] == first
+
+    def test_ending_reward(self):
+        self.env.reset()
+        done = False
+        while not done:
+            _, reward, done, info = self.env.step(("ponder", "50"))
+        assert info["ending"] == "victory"
+        assert reward == ENDING_REWARDS["victory"]
+        # Further steps do nothing until reset
+        assert self.env.step("ponder")[1:3] == (0.0, True)
+
+
+class TestVectorEnv:
+    def test_batched_step(self):
+        env = VectorEnv(3)
+        observations, _ = env.reset()
+        assert len(observations) == 3
+        observations, rewards, dones, _ = env.step(["go to closet", "ponder", "feel"])
+        assert field(observations[0], "room:closet") == 1.0
+        assert field(observations[1], "feel") == 40.0
+        assert rewards == [0.0, 0.0, 0.0]
+        assert dones == [False, False, False]
+
+    def test_auto_reset(self):
+        env = VectorEnv(2)
+        start, _ = env.reset()
+        while True:
+            observations, rewards, dones, infos = env.step([("ponder", "50"), "feel"])
+            if dones[0]:
+                break
+        assert rewards[0] == ENDING_REWARDS["victory"]
+        assert field(infos[0]["final_observation"], "day") >= 7
+        assert list(observations[0]) == list(start[0])
+        assert dones[1] is False
+
+    def test_action_count_checked(self):
+        with pytest.raises(ValueError):
+            VectorEnv(2).step(["ponder"])
+
+    def test_workers_match_in_process(self):
+        actions = [["go to bedroom", ("ponder", "30"), "debug items"][i % 3] for i in range(5)]
+        local = VectorEnv(5)
+        with VectorEnv(5, workers=2) as sharded:
+            assert rows(sharded.reset()[0]) == rows(local.reset()[0])
+            for _ in range(4):
+                ours, _, _, _ = sharded.step(actions)
+                theirs, _, _, _ = local.step(actions)
+                assert rows(ours) == rows(theirs)
+            assert sharded.legal_actions() == local.legal_actions()
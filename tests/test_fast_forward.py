@@ -0,0 +1,95 @@
+"""
+Tests for the batched sleep-cycle fast-forward.
+"""
+
+from datetime import timedelta
+
+import pytest
+
+from src.fast_forward import fast_forward
+from src.gameloop import new_world, run
+from src.io_interface import MockIO
+
+
+class ScriptedIO(MockIO):
+    """MockIO that raises EOFError when inputs run out, ending the game loop."""
+
+    def get_input(self, prompt: str) -> str:
+        if self.input_index >= len(self.inputs):
+            raise EOFError("No more test inputs available")
+        return super().get_input(prompt)
+
+
+def ponder_hours(hours):
+    """Play a fresh game that only ponders, one hour at a time."""
+    io = ScriptedIO()
+    io.set_inputs(["ponder", "1"] * hours)
+    state = new_world(io)
+    try:
+        run(io, state)
+    except EOFError:
+        pass
+    return state
+
+
+def snapshot(state):
+    return (state.watch.curr_time, state.hero.feel, state.hero.curr_balance,
+            state.alter_ego.current_phase, list(state.alter_ego.orders_placed),
+            state.device_state.get_built_components(), state.game_over, state.ending_type)
+
+
+class TestFastForward:
+    def test_matches_pondering_through_cycles(self):
+        """Three fast-forwarded cycles end where fifteen ponders do."""
+        state = new_world(MockIO())
+        summary = fast_forward(state, cycles=3)
+        assert summary.cycles == 3
+        assert summary.stopped_by == "cycles"
+        assert snapshot(state) == snapshot(ponder_hours(15))
+
+    def test_matches_pondering_through_the_week(self):
+        """Fast-forwarding to the end of the week reaches the same ending."""
+        state = new_world(MockIO())
+        summary = fast_forward(state, cycles=100)
+        assert summary.stopped_by in ("ending", "dream")
+        hours = int((state.watch.curr_time - summary.start_time) / timedelta(hours=1))
+        sleeps = summary.cycles
+        # Each pass-out adds six hours of sleep on top of the pondering
+        assert snapshot(state) == snapshot(ponder_hours(hours - 6 * sleeps))
+
+    def test_summary_records_ae_progress(self):
+        state = new_world(MockIO())
+        summary = fast_forward(state, cycles=3)
+        assert summary.phases == [1, 2, 3]
+        assert summary.orders_placed == state.alter_ego.orders_placed
+        assert summary.balance_change == state.hero.curr_balance - 100
+        assert summary.events_fired > 0
+
+    def test_until_stops_at_last_loop_top(self):
+        state = new_world(MockIO())
+        start = state.watch.curr_time
+        summary = fast_forward(state, until=start + timedelta(hours=2, minutes=30))
+        assert summary.stopped_by == "until"
+        assert summary.cycles == 0
+        assert state.watch.curr_time == start + timedelta(hours=2)
+        assert state.hero.feel == 30
+
+    def test_requires_a_limit(self):
+        with pytest.raises(ValueError):
+            fast_forward(new_world(MockIO()))
+
+    def test_restores_io(self):
+        io = MockIO()
+        state = new_world(io)
+        fast_forward(state, cycles=1)
+        assert state.io is io
+        assert state.hero.io is io
+        assert io.get_all_outputs() == []
+
+    def test_does_nothing_after_game_over(self):
+        state = new_world(MockIO())
+        state.game_over = True
+        start = state.watch.curr_time
+        summary = fast_forward(state, cycles=5)
+        assert summary.stopped_by == "ending"
+        assert state.watch.curr_time == start
@@ -3,6 +3,7 @@ Tests for the main game loop.
 """
 
 import pytest
+from datetime import timedelta
 from src.gameloop import run
 from src.io_interface import MockIO, IOInterface
 from src.inputparser import parse
@@ -114,4 +115,155 @@ class TestGameLoop:
         
         outputs = mock_io.get_all_outputs()
         assert len(outputs) > 0
-        # Should contain inventory output and empty lines after successful commands
\ No newline at end of file
+        # Should contain inventory output and empty lines after successful commands
+
+class FlushCountingIO(GameLoopMockIO):
+    """GameLoopMockIO that records how output was flushed."""
+
+    def __init__(self):
+        super().__init__()
+        self.flushes: List[int] = []
+
+    def flush(self) -> None:
+        self.flushes.append(len(self.outputs))
+
+
+class TestPipelining:
+    def setup_method(self):
+        from src.gameloop import new_world, schedule_checks
+        self.io = FlushCountingIO()
+        self.state = new_world(self.io)
+        schedule_checks(self.state)
+
+    def test_split_commands(self):
+        from src.gameloop import split_commands
+        assert split_commands(" open toolbox ;get hammer from toolbox;; ") == [
+            "open toolbox", "get hammer from toolbox"]
+
+    def test_commands_run_in_order(self):
+        from src.gameloop import play_turn
+        play_turn(self.state, "go to bedroom; go to main; look at watch")
+        assert self.state.hero.GetRoom().name == "main"
+        assert any(line.startswith("The current time is") for line in self.io.outputs)
+        assert self.io.flushes == [len(self.io.outputs)]
+
+    def test_stops_at_first_failure(self):
+        from src.gameloop import play_turn
+        play_turn(self.state, "go to bedroom; dance; go to bathroom")
+        assert self.state.hero.GetRoom().name == "bedroom"
+        assert "Don't understand command." in self.io.outputs
+        play_turn(self.state, "go to kitchen; go to main")
+        assert self.state.hero.GetRoom().name == "bedroom"
+
+    def test_events_fire_between_commands(self):
+        from src.gameloop import play_turn
+        fired = []
+        due = self.state.watch.curr_time + timedelta(hours=2)
+        self.state.event_queue.AddEvent(lambda *_: fired.append(len(self.io.outputs)), due)
+        play_turn(self.state, "ponder; 3; feel")
+        # The event fired after pondering and before checking feel
+        assert len(fired) == 1
+        assert self.io.outputs.index("You ponder for 3 hours.") < fired[0]
+        assert self.io.outputs.index("Feeling okay") >= fired[0]
+
+    def test_stops_when_game_ends(self):
+        from src.gameloop import play_turn
+        play_turn(self.state, "ponder; 200; go to bedroom")
+        assert self.state.game_over
+        assert self.state.hero.GetRoom().name == "main"
+
+    def test_prompts_answered_from_the_line(self):
+        from src.gameloop import play_turn
+        start = self.state.watch.curr_time
+        self.io.set_inputs(["go to bedroom"])
+        play_turn(self.state, "ponder; x; 2; go to bathroom")
+        assert self.state.watch.curr_time == start + timedelta(hours=2)
+        assert "What? Give me a number." in self.io.outputs
+        assert self.state.hero.GetRoom().name == "bathroom"
+        # Answers from the line are not prompted for
+        assert "How many hours?: " not in self.io.outputs
+        assert self.state.io is self.io and self.state.hero.io is self.io
+
+    def test_prompts_fall_back_to_the_player(self):
+        from src.gameloop import play_turn
+        start = self.state.watch.curr_time
+        self.io.set_inputs(["3"])
+        play_turn(self.state, "go to bedroom; ponder")
+        assert self.io.outputs.count("How many hours?: ") == 1
+        assert self.state.watch.curr_time == start + timedelta(hours=3)
+
+    def test_run_flushes_once_per_line(self):
+        self.io.set_inputs(["open toolbox; look at watch", "feel"])
+        with pytest.raises(EOFError):
+            run(self.io, self.state)
+        # One flush per line played, and one when the loop ends
+        assert len(self.io.flushes) == 3
+
+
+class TestAsyncGameLoop:
+    """A whole session driven by an asyncio event loop."""
+
+    INPUTS = ["ponder", "x", "2", "call phone", "592-2874", "duct-tape", "ponder", "200"]
+
+    def test_session_plays_to_the_end(self):
+        import asyncio
+        from src.gameloop import new_world, run_async
+        from src.io_interface import AsyncQueueIO
+
+        async def play():
+            io = AsyncQueueIO()
+            io.feed(*self.INPUTS)
+            state = new_world(io)
+            await asyncio.wait_for(run_async(io, state), 5)
+            return io, state
+
+        io, state = asyncio.run(play())
+        assert state.game_over
+        assert "What? Give me a number." in io.outputs
+        assert "Thanks! We'll get that out to you in a couple days." in io.outputs
+
+        # The same inputs played synchronously say the same things
+        sync_io = GameLoopMockIO()
+        sync_io.set_inputs(list(self.INPUTS))
+        run(sync_io)
+        assert io.outputs == sync_io.get_all_outputs()
+
+    def test_chained_prompts(self):
+        import asyncio
+        from src.gameloop import new_world, run_async
+        from src.io_interface import AsyncQueueIO
+
+        async def play():
+            io = AsyncQueueIO()
+            io.feed("call phone; 592-2874; duct-tape; feel", "ponder; 200")
+            state = new_world(io)
+            await asyncio.wait_for(run_async(io, state), 5)
+            return io, state
+
+        io, state = asyncio.run(play())
+        assert state.game_over
+        thanks = io.outputs.index("Thanks! We'll get that out to you in a couple days.")
+        assert thanks < io.outputs.index("Feeling good")
+        assert "How many hours?: " not in io.outputs
+
+    def test_sessions_interleave(self):
+        import asyncio
+        from src.gameloop import run_async
+        from src.io_interface import AsyncQueueIO
+
+        async def play():
+            sessions = [AsyncQueueIO() for _ in range(20)]
+            tasks = [asyncio.create_task(run_async(io)) for io in sessions]
+            for io in sessions:
+                io.feed("ponder")
+            for _ in range(3):
+                await asyncio.sleep(0)
+            # Every session is parked on ponder's question
+            assert all(io.outputs[-1] == "How many hours?: " for io in sessions)
+            for io in sessions:
+                io.feed("200")
+            await asyncio.wait_for(asyncio.gather(*tasks), 5)
+            return sessions
+
+        sessions = asyncio.run(play())
+        assert all("You ponder for 200 hours." in io.outputs for io in sessions)
@@ -289,6 +289,64 @@ class TestContainer:
         assert len(bananas) == 0
 
 
+class TestWeightTotals:
+    """Test the cached direct and nested weight totals of containers."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.state = GameState(MockIO())
+        self.room = self.state.hero.parent
+
+    @staticmethod
+    def walk(container):
+        """Nested weight the slow way."""
+        return sum(item.weight + (TestWeightTotals.walk(item) if isinstance(item, Container)
+                                  else 0) for item in container.contents)
+
+    def test_nested_totals(self):
+        """Adding to an inner container updates every container above it."""
+        box = Container("box", self.room)
+        box.weight = 5
+        crate = Container("crate", box)
+        crate.weight = 2
+        apple = Object("apple", crate)
+        apple.weight = 3
+
+        assert crate.direct_weight == crate.contents_weight == 3
+        assert box.direct_weight == 2
+        assert box.contents_weight == 5
+        assert box.total_weight == 10
+        assert self.room.contents_weight == self.walk(self.room)
+
+    def test_moves_and_weight_changes(self):
+        """Removes, moves and weight changes keep the totals exact."""
+        box = Container("box", self.room)
+        items = [Object(f"item{i}", box) for i in range(5)]
+        for i, item in enumerate(items):
+            item.weight = i + 1
+        self.state.hero.contents.append(box.contents.pop())
+        del box.contents[:2]
+        box.contents[0] = Object("brick", None)
+        box.contents[0].weight = 40
+        box.contents += [items[0]]
+
+        for container in (box, self.state.hero, self.room, self.state.apartment):
+            assert container.direct_weight == sum(item.weight for item in container.contents)
+            assert container.contents_weight == self.walk(container)
+
+    def test_carry_limit_uses_totals(self):
+        """InventoryRules reads the hero's cached total."""
+        from src.logic.inventory_logic import InventoryRules
+        plywood = Object("plywood-sheet", None)
+        plywood.weight = 90
+        self.state.hero.contents.append(plywood)
+        assert InventoryRules.calculate_total_weight(self.state.hero) == 90
+        assert InventoryRules.can_carry_weight(self.state.hero, 10)
+        assert not InventoryRules.can_carry_weight(self.state.hero, 11)
+        self.state.hero.contents.remove(plywood)
+        assert InventoryRules.can_carry_weight(self.state.hero, 100)
+
+
 class TestWatch:
     """Test the Watch class functionality."""
 
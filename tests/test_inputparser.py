@@ -403,4 +403,112 @@ class TestEdgeCases:
 
         success, args = expand("", "input")
         assert success is False
-        assert args == []
\ No newline at end of file
+        assert args == []
+
+class TestLazyImports:
+    """The command implementations stay off the start-up path."""
+
+    @staticmethod
+    def loaded_modules(code: str) -> set[str]:
+        """Run code in a fresh interpreter and return the src modules it loaded."""
+        import subprocess
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        code += "\nimport sys; print(' '.join(n for n, m in sys.modules.items()" \
+                " if n.startswith('src') and type(m).__name__ == 'module'))"
+        completed = subprocess.run([sys.executable, "-c", code], cwd=repo_root,
+                                   capture_output=True, text=True, check=True)
+        return set(completed.stdout.split())
+
+    def test_gameloop_import_defers_commands(self):
+        """Importing the game loop does not execute game_commands or actions."""
+        loaded = self.loaded_modules("import src.gameloop")
+        assert "src.gameloop" in loaded
+        assert "src.commands.game_commands" not in loaded
+        assert "src.actions" not in loaded
+        assert not any(name.startswith("src.game_actions") for name in loaded)
+
+    def test_first_parse_loads_commands(self):
+        """Parsing a command loads the command implementations on demand."""
+        loaded = self.loaded_modules(
+            "from src.inputparser import parse; parse('inventory')")
+        assert "src.commands.game_commands" in loaded
+
+    def test_command_classes_still_reexported(self):
+        """Command classes remain reachable through the parser module."""
+        from src import inputparser
+        from src.commands.game_commands import PonderCommand
+        assert inputparser.PonderCommand is PonderCommand
+        with pytest.raises(AttributeError):
+            inputparser.NoSuchCommand
+
+
+class TestCommandDispatch:
+    """Parsing reuses shared commands and never builds classes."""
+
+    def test_stateless_commands_are_shared(self):
+        from src.inputparser import parse as parse_command
+        for line in ("inventory", "look at watch", "feel", "undo", "read journal"):
+            assert parse_command(line)[1] is parse_command(line)[1]
+
+    def test_undoable_commands_are_fresh(self):
+        from src.inputparser import parse as parse_command
+        for line in ("take ice bath", "mail check", "go to bedroom"):
+            assert parse_command(line)[1] is not parse_command(line)[1]
+
+    def test_watch_and_history_commands_have_fixed_types(self):
+        from src.inputparser import parse as parse_command
+        from src.commands.game_commands import (
+            DeferredRedoCommand, DeferredUndoCommand, WatchObjectCommand)
+        assert type(parse_command("watch tv")[1]) is WatchObjectCommand
+        assert type(parse_command("watch fridge")[1]) is WatchObjectCommand
+        assert type(parse_command("undo")[1]) is DeferredUndoCommand
+        assert type(parse_command("redo")[1]) is DeferredRedoCommand
+
+    def test_shared_commands_serve_every_game(self):
+        from src.core.game_world import GameState
+        from src.inputparser import parse as parse_command
+        from src.io_interface import MockIO
+        first, second = GameState(MockIO()), GameState(MockIO())
+        second.hero.parent = second.apartment.bedroom
+        command = parse_command("watch tv")[1]
+        assert command.execute(first).success
+        assert not command.execute(second).success
+
+
+class TestParseCache:
+    """Repeated inputs skip template matching."""
+
+    def setup_method(self):
+        from src.inputparser import clear_parse_cache
+        clear_parse_cache()
+
+    def test_hits_and_misses(self):
+        from src.inputparser import parse as parse_command, parse_cache_info
+        parse_command("inventory")
+        parse_command("inventory")
+        parse_command("  inventory ")
+        parse_command("open fridge")
+        info = parse_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (2, 2, 2)
+
+    def test_unknown_input_is_cached(self):
+        from src.inputparser import parse as parse_command, parse_cache_info
+        assert parse_command("fly away") == (False, "Don't understand command.")
+        assert parse_command("fly away") == (False, "Don't understand command.")
+        assert parse_cache_info().hits == 1
+
+    def test_arguments_come_from_the_match(self):
+        from src.inputparser import parse as parse_command
+        first = parse_command("get hammer from toolbox")[1]
+        second = parse_command("get hammer  from toolbox")[1]
+        assert first is not second
+        assert (second.obj_name, second.container_name) == ("hammer", "toolbox")
+
+    def test_prompting_factories_still_prompt(self):
+        from src.inputparser import parse as parse_command, parse_cache_info
+        from src.io_interface import MockIO
+        io = MockIO()
+        io.set_inputs(["2", "5"])
+        assert parse_command("ponder", io)[1].hours == 2
+        assert parse_command("ponder", io)[1].hours == 5
+        assert parse_cache_info().hits == 1
@@ -11,7 +11,11 @@ import os
 # Add parent directory to path so we can import game modules
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.io_interface import IOInterface, ConsoleIO, MockIO
+import asyncio
+
+from src.io_interface import (
+    IOInterface, ConsoleIO, MockIO, AsyncQueueIO, run_dialogue, run_dialogue_async
+)
 
 
 class TestMockIO:
@@ -106,6 +110,62 @@ class TestConsoleIO:
         assert callable(console_io.get_input)
         assert callable(console_io.sleep)
 
+    def test_output_waits_for_flush(self, capsys):
+        """Output is written in one go when flushed."""
+        from src.io_interface import ConsoleIO
+        console_io = ConsoleIO()
+        console_io.output("one")
+        console_io.output("two")
+        assert capsys.readouterr().out == ""
+        console_io.flush()
+        assert capsys.readouterr().out == "one\ntwo\n"
+        console_io.flush()
+        assert capsys.readouterr().out == ""
+
+    def test_prompt_and_sleep_flush_first(self, capsys, monkeypatch):
+        """Nothing is held back while the player reads or waits."""
+        from src.io_interface import ConsoleIO
+        console_io = ConsoleIO()
+        monkeypatch.setattr("builtins.input", lambda prompt: print(prompt) or "yes")
+        console_io.output("question")
+        assert console_io.get_input("> ") == "yes"
+        assert capsys.readouterr().out == "question\n> \n"
+        console_io.output("pause")
+        console_io.sleep(0)
+        assert capsys.readouterr().out == "pause\n"
+
+
+def greeting():
+    """Two-prompt dialogue used by the dialogue driver tests."""
+    name = yield "Name?: "
+    mood = yield "Mood?: "
+    return f"{name} is {mood}"
+
+
+class TestDialogues:
+    """Test driving dialogues with blocking and async IO."""
+
+    def test_run_dialogue(self):
+        mock_io = MockIO()
+        mock_io.set_inputs(["Arthur", "tired"])
+        assert run_dialogue(greeting(), mock_io) == "Arthur is tired"
+        assert mock_io.get_all_outputs() == ["Name?: ", "Mood?: "]
+
+    def test_run_dialogue_async(self):
+        async def talk():
+            io = AsyncQueueIO()
+            task = asyncio.create_task(run_dialogue_async(greeting(), io))
+            await asyncio.sleep(0)
+            assert io.outputs == ["Name?: "]  # parked on the first prompt
+            io.feed("Arthur", "tired")
+            return await task
+
+        assert asyncio.run(talk()) == "Arthur is tired"
+
+    def test_async_io_has_no_blocking_input(self):
+        with pytest.raises(RuntimeError):
+            AsyncQueueIO().get_input("> ")
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,54 @@
+"""
+Tests for the main.py command line.
+"""
+
+import io
+import json
+
+import pytest
+
+import main
+
+
+def write_script(tmp_path, lines):
+    path = tmp_path / "moves.txt"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(path)
+
+
+class TestInteractiveMode:
+    def test_quitting_exits_zero(self, monkeypatch, capsys):
+        def end_of_input(prompt):
+            raise EOFError
+        monkeypatch.setattr("builtins.input", end_of_input)
+        assert main.main([]) == 0
+
+
+class TestScriptMode:
+    def test_script_without_ending(self, tmp_path, capsys):
+        path = write_script(tmp_path, ["# look around", "inventory"])
+        assert main.main(["--script", path]) == main.EXIT_CODES[None]
+        out = capsys.readouterr().out
+        assert "You are carrying the following:" in out
+        assert "What do we do next?" not in out
+
+    def test_victory_exit_code(self, tmp_path, capsys):
+        path = write_script(tmp_path, ["ponder", "50"] * 30)
+        assert main.main(["--script", path]) == main.EXIT_CODES["victory"] == 0
+
+    def test_jsonl_from_stdin(self, monkeypatch, capsys):
+        monkeypatch.setattr("sys.stdin", io.StringIO("inventory\n"))
+        assert main.main(["--script", "-", "--format", "jsonl"]) == 20
+        records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert records[0]["input"] is None
+        assert records[1]["input"] == "inventory"
+        assert "     watch" in records[1]["output"]
+        assert records[-1] == {"ending": None}
+
+    def test_missing_script(self, tmp_path, capsys):
+        assert main.main(["--script", str(tmp_path / "missing.txt")]) == 2
+        assert "Cannot read script" in capsys.readouterr().err
+
+    def test_format_requires_script(self):
+        with pytest.raises(SystemExit):
+            main.main(["--format", "jsonl"])
@@ -0,0 +1,88 @@
+"""
+Tests for the declarative construction and teardown recipes.
+"""
+
+from collections import Counter
+
+from src.commands.turn_context import TurnContext
+from src.core.device_state import DeviceState
+from src.core.game_objects import Object
+from src.core.game_world import GameState
+from src.io_interface import MockIO
+from src.recipes import AE_PHASE_BUILDS, RECIPES, Recipe, apartment_items
+
+
+class TestRecipe:
+    def test_items_multiset(self):
+        recipe = RECIPES["device-frame"]
+        assert recipe.items == Counter(
+            {"plywood-sheet": 1, "metal-brackets": 1, "box-of-nails": 1, "hammer": 1})
+
+    def test_has_items_is_inclusion(self):
+        recipe = Recipe("twin", consumes=("bolt", "bolt"), tools=("wrench",))
+        assert recipe.has_items(Counter({"bolt": 2, "wrench": 1, "sock": 4}))
+        assert not recipe.has_items(Counter({"bolt": 1, "wrench": 1}))
+        assert recipe.missing_items(Counter({"bolt": 1})) == ["bolt", "wrench"]
+
+    def test_components_ready(self):
+        device = DeviceState()
+        wiring = RECIPES["wiring-harness"]
+        assert not wiring.components_ready(device)
+        device.build_component("device-frame")
+        assert wiring.components_ready(device)
+
+    def test_teardown_requires_its_component(self):
+        device = DeviceState()
+        recipe = RECIPES["remove-battery"]
+        assert not recipe.components_ready(device)
+        device.build_component("power-core")
+        assert recipe.components_ready(device)
+
+    def test_room_rules(self):
+        assert RECIPES["cut-wires"].in_place("bedroom")
+        assert not RECIPES["cut-wires"].in_place("main")
+        assert RECIPES["barricade-bedroom"].in_place("main")
+        assert not RECIPES["barricade-bedroom"].in_place("bedroom")
+
+    def test_every_component_has_a_build(self):
+        built = [recipe.builds for recipes in AE_PHASE_BUILDS.values() for recipe in recipes]
+        assert sorted(built) == sorted(DeviceState.COMPONENTS)
+
+
+class TestApartmentItems:
+    def setup_method(self):
+        self.state = GameState(MockIO())
+
+    def test_counts_everything_once(self):
+        Object("copper-wire", self.state.apartment.main.toolbox)
+        Object("copper-wire", self.state.hero)
+        counts, found = apartment_items(self.state)
+        assert counts["copper-wire"] == 2
+        assert counts["watch"] == 1
+        # The hero's inventory is searched first
+        assert found["copper-wire"][0].parent is self.state.hero
+
+    def test_searches_depth_first(self):
+        Object("hammer", self.state.apartment.bathroom)
+        in_cabinet = Object("hammer", self.state.apartment.main.cabinet)
+        _, found = apartment_items(self.state)
+        # Everything in the main room, cabinet included, comes before the bathroom
+        assert found["hammer"][0] is in_cabinet
+
+
+class TestHeroRecipes:
+    def setup_method(self):
+        self.state = GameState(MockIO())
+
+    def test_allows_uses_inventory(self):
+        recipe = RECIPES["barricade-bedroom"]
+        assert not recipe.allows(self.state, TurnContext(self.state))
+        for name in ("hammer", "box-of-nails", "plywood-sheet"):
+            Object(name, self.state.hero)
+        assert recipe.allows(self.state, TurnContext(self.state))
+
+    def test_charge(self):
+        start = self.state.watch.curr_time
+        RECIPES["nail-self-in"].charge(self.state)
+        assert (self.state.watch.curr_time - start).total_seconds() == 2 * 3600
+        assert self.state.hero.feel == 30
@@ -0,0 +1,59 @@
+"""
+Tests for ScriptIO, the non-interactive I/O behind main.py --script.
+"""
+
+import io
+import json
+
+import pytest
+
+from src.scriptio import ScriptIO, script_lines
+
+
+class TestScriptLines:
+    def test_strips_line_endings_and_comments(self):
+        lines = ["inventory\n", "# a comment\n", "  # indented comment\n", "\n", "feel\r\n"]
+        assert list(script_lines(lines)) == ["inventory", "", "feel"]
+
+
+class TestScriptIO:
+    def test_reads_lines_then_raises_eof(self):
+        script = ScriptIO(["feel", "balance"], io.StringIO())
+        assert script.get_input("What do we do next?: ") == "feel"
+        assert script.get_input("What do we do next?: ") == "balance"
+        with pytest.raises(EOFError):
+            script.get_input("What do we do next?: ")
+        assert script.inputs_read == 2
+
+    def test_text_has_no_prompts(self):
+        stream = io.StringIO()
+        script = ScriptIO(["feel"], stream)
+        script.output("Hello")
+        script.get_input("What do we do next?: ")
+        script.output("World")
+        script.close(None)
+        assert stream.getvalue() == "Hello\nWorld\n"
+
+    def test_sleep_returns_at_once(self):
+        ScriptIO([], io.StringIO()).sleep(3600)
+
+    def test_jsonl_records_per_input(self):
+        stream = io.StringIO()
+        script = ScriptIO(["feel", "balance"], stream, "jsonl")
+        script.output("Intro")
+        script.get_input("> ")
+        script.output("You feel fine.")
+        script.flush()
+        script.get_input("> ")
+        script.close("victory")
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert records == [
+            {"input": None, "output": ["Intro"]},
+            {"input": "feel", "output": ["You feel fine."]},
+            {"input": "balance", "output": []},
+            {"ending": "victory"},
+        ]
+
+    def test_unknown_format(self):
+        with pytest.raises(ValueError):
+            ScriptIO([], io.StringIO(), "xml")
@@ -0,0 +1,92 @@
+"""
+Tests for the batched Monte Carlo simulation of the Alter Ego economy.
+"""
+
+import pytest
+
+from src import simulation
+from src.simulation import SpendingPolicy, simulate, validate_against_engine
+
+
+MIXED_POLICY = SpendingPolicy(
+    {
+        "copper-coil": 0.5,
+        "battery-pack": 0.5,
+        "crystal-oscillator": 0.5,
+        "spicy-food": 0.8,
+        "ice-cubes": 0.5,
+        "signal-amplifier": 0.4,
+        "hammer": 0.3,
+    },
+    ponder_hours=2,
+    eats=["spicy-food", "ice-cubes"],
+)
+
+
+class TestSpendingPolicy:
+    def test_rejects_unknown_item(self):
+        with pytest.raises(ValueError):
+            SpendingPolicy({"flux-capacitor": 0.5})
+
+    def test_rejects_bad_probability(self):
+        with pytest.raises(ValueError):
+            SpendingPolicy({"hammer": 1.5})
+
+    def test_rejects_non_food(self):
+        with pytest.raises(ValueError):
+            SpendingPolicy(eats=["hammer"])
+
+    def test_rejects_non_positive_ponder(self):
+        with pytest.raises(ValueError):
+            SpendingPolicy(ponder_hours=0)
+
+
+class TestSimulate:
+    def test_idle_player(self):
+        """With no spending, the AE's own orders leave $4 and build nothing."""
+        result = simulate(SpendingPolicy(), runs=20, seed=1, backend="python")
+        assert result.ending_counts() == {"victory": 20, "partial_victory": 0, "defeat": 0}
+        assert set(result.balances) == {4}
+        assert set(result.components) == {0}
+        assert set(result.phases) == {5}
+        assert result.completion_rate == 0.0
+
+    def test_seeded_batches_are_reproducible(self):
+        first = simulate(MIXED_POLICY, runs=50, seed=7, starting_balance=300, backend="python")
+        second = simulate(MIXED_POLICY, runs=50, seed=7, starting_balance=300, backend="python")
+        assert first.endings == second.endings
+        assert first.balances == second.balances
+        assert first.components == second.components
+        assert [first.plan(run) for run in range(50)] == [second.plan(run) for run in range(50)]
+
+    def test_plans_follow_policy_order(self):
+        result = simulate(MIXED_POLICY, runs=10, seed=3, backend="python")
+        for run in range(result.runs):
+            for cycle_orders in result.plan(run):
+                assert cycle_orders == [item for item in MIXED_POLICY.items
+                                        if item in cycle_orders]
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            simulate(SpendingPolicy(), runs=1, backend="gpu")
+
+    def test_numpy_backend_requires_numpy(self, monkeypatch):
+        monkeypatch.setattr(simulation, "np", None)
+        with pytest.raises(ValueError):
+            simulate(SpendingPolicy(), runs=1, backend="numpy")
+
+
+class TestValidateAgainstEngine:
+    def test_python_backend_matches_engine(self):
+        """Sampled abstract playthroughs end exactly like the real game."""
+        result = simulate(MIXED_POLICY, runs=200, seed=11, starting_balance=300,
+                          backend="python")
+        # The batch should exercise more than one outcome to be meaningful
+        assert len(set(result.components)) > 1
+        assert validate_against_engine(result, sample=15, seed=4) == []
+
+    def test_numpy_backend_matches_engine(self):
+        pytest.importorskip("numpy")
+        result = simulate(MIXED_POLICY, runs=500, seed=11, starting_balance=300,
+                          backend="numpy")
+        assert validate_against_engine(result, sample=15, seed=4) == []
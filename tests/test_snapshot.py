@@ -0,0 +1,100 @@
+"""
+Tests for in-place world snapshots.
+"""
+
+import pytest
+
+from src.core.game_objects import Object
+from src.core.rooms import Closet
+from src.core.snapshot import WorldSnapshot
+from src.gameloop import new_world, run
+from src.io_interface import MockIO
+
+
+class ScriptedIO(MockIO):
+    """MockIO that raises EOFError when inputs run out, ending the game loop."""
+
+    def get_input(self, prompt: str) -> str:
+        if self.input_index >= len(self.inputs):
+            self.outputs.append(prompt)
+            raise EOFError("No more test inputs available")
+        return super().get_input(prompt)
+
+
+def play(inputs, state=None, io=None):
+    """Run the game loop over inputs and return everything it printed."""
+    io = io or ScriptedIO()
+    io.set_inputs(inputs)
+    with pytest.raises(EOFError):
+        run(io, state)
+    return io.get_all_outputs()
+
+
+class TestWorldSnapshot:
+    def setup_method(self):
+        self.state = new_world(MockIO())
+        self.snapshot = WorldSnapshot(self.state)
+
+    def test_restore_returns_same_state(self):
+        """Restoring resets the world in place rather than building a new one."""
+        io = MockIO()
+        assert self.snapshot.restore(io) is self.state
+
+    def test_restore_rebinds_io(self):
+        """Every slot that held the original IO is bound to the new one."""
+        io = MockIO()
+        state = self.snapshot.restore(io)
+        assert state.io is io
+        assert state.hero.io is io
+
+    def test_restore_undoes_mutations(self):
+        """Object moves, new objects and scalar changes are all reverted."""
+        state = self.state
+        start_time = state.watch.curr_time
+        hammer = Object("hammer", state.apartment.main.toolbox)
+        state.hero.contents.append(state.apartment.bedroom.journal)
+        state.apartment.bedroom.bookshelf.contents.clear()
+        state.apartment.closet.state = Closet.State.NAILED
+        state.hero.curr_balance = 3
+        state.device_state.build_component("power-core")
+        state.alter_ego.orders_placed.append("copper-wire")
+        state.journal_read = True
+
+        state = self.snapshot.restore(MockIO())
+
+        assert hammer not in state.apartment.main.toolbox.contents
+        assert state.hero.contents == [state.watch]
+        assert state.apartment.bedroom.bookshelf.contents == [state.apartment.bedroom.journal]
+        assert state.apartment.closet.state == Closet.State.READY
+        assert state.hero.curr_balance == 100
+        assert state.watch.curr_time == start_time
+        assert state.device_state.count_built_components() == 0
+        assert state.alter_ego.orders_placed == []
+        assert state.journal_read is False
+
+    def test_restore_keeps_weight_totals(self):
+        """Cached weight totals come back with the contents they describe."""
+        state = self.state
+        main = state.apartment.main
+        before = (main.direct_weight, main.contents_weight, state.hero.direct_weight)
+        hammer = Object("hammer", main.toolbox)
+        hammer.weight = 15
+        state.hero.contents.append(state.apartment.bedroom.journal)
+
+        state = self.snapshot.restore(MockIO())
+
+        assert (main.direct_weight, main.contents_weight, state.hero.direct_weight) == before
+        assert main.toolbox.contents_weight == 0
+        assert state.apartment.bedroom.journal._holders == [state.apartment.bedroom.bookshelf]
+
+    def test_pooled_runs_match_fresh_runs(self):
+        """Games played in a restored world print exactly what fresh games do."""
+        scripts = [
+            ["debug items", "go to closet", "nail self in", "inventory"],
+            ["open toolbox", "look in toolbox", "ponder", "20", "look at watch"],
+            ["balance", "feel", "inventory"],
+        ]
+        for inputs in scripts:
+            pooled_io = ScriptedIO()
+            pooled = play(inputs, self.snapshot.restore(pooled_io), pooled_io)
+            assert pooled == play(inputs)
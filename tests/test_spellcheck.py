@@ -0,0 +1,138 @@
+"""
+Tests for typo-tolerant word lookup and parser spelling correction.
+"""
+
+from unittest.mock import patch
+
+from src.core.game_objects import Object
+from src.core.game_world import GameState
+from src.inputparser import clear_parse_cache, correct_spelling, corrector, parse
+from src.io_interface import MockIO
+from src.spellcheck import BKTree, Corrector, edit_distance, nearest
+
+
+class TestEditDistance:
+    def test_basic_edits(self):
+        assert edit_distance("fridge", "fridge") == 0
+        assert edit_distance("fridg", "fridge") == 1
+        assert edit_distance("kitten", "sitting") == 3
+        assert edit_distance("", "tv") == 2
+
+    def test_transposition_is_one_edit(self):
+        assert edit_distance("opne", "open") == 1
+        assert edit_distance("inventroy", "inventory") == 1
+        # A transposition followed by an insertion between the pair
+        assert edit_distance("ca", "abc") == 2
+
+
+class TestBKTree:
+    def setup_method(self):
+        self.words = ["open", "close", "closet", "bedroom", "bathroom", "feel", "fridge"]
+        self.tree = BKTree(self.words)
+
+    def test_search_matches_brute_force(self):
+        for query in ("opne", "closte", "bedrom", "fel", "xyz", "bathrom"):
+            for max_distance in (0, 1, 2):
+                expected = sorted((edit_distance(query, word), word) for word in self.words
+                                  if edit_distance(query, word) <= max_distance)
+                assert self.tree.search(query, max_distance) == expected
+
+    def test_membership(self):
+        assert "closet" in self.tree
+        assert len(self.tree) == len(self.words)
+
+    def test_nearest_reports_ties(self):
+        assert nearest((self.tree,), "closr") == ["close"]
+        assert nearest((BKTree(["cat", "car"]),), "caz") == ["car", "cat"]
+        # Short words are never corrected
+        assert nearest((self.tree,), "tv") == []
+
+
+class TestCorrector:
+    def setup_method(self):
+        self.state = GameState(MockIO())
+        self.corrector = Corrector(["open", "go", "to"], ["hammer"])
+
+    def test_follows_the_world_names(self):
+        self.corrector.update(self.state.apartment)
+        assert "fridge" in self.corrector.names
+        # Moving the hero changes the world but not its names
+        names = self.corrector.names
+        self.state.hero.parent = self.state.apartment.bedroom
+        self.corrector.update(self.state.apartment)
+        assert self.corrector.names is names
+        # New names are added in place
+        tape = Object("duct-tape", self.state.apartment.main)
+        self.corrector.update(self.state.apartment)
+        assert self.corrector.names is names
+        assert self.corrector.name_for("duct-tpae") == "duct-tape"
+        # A name that is gone forces a rebuild
+        self.state.apartment.main.contents.remove(tape)
+        self.corrector.update(self.state.apartment)
+        assert self.corrector.rebuilds == 1
+        assert self.corrector.name_for("duct-tpae") is None
+
+    def test_fixed_names_are_known(self):
+        self.corrector.update(self.state.apartment)
+        assert self.corrector.known("hammer")
+        assert self.corrector.known("fridge")
+        assert not self.corrector.known("fridg")
+
+
+class TestParseCorrection:
+    def setup_method(self):
+        clear_parse_cache()
+        self.io = MockIO()
+        self.state = GameState(self.io)
+        self.world = self.state.apartment
+
+    def test_command_word_typo(self):
+        ok, command = parse("inventroy", self.io, self.world)
+        assert ok and type(command).__name__ == "InventoryCommand"
+        assert self.io.outputs == ['(Taking that as "inventory".)', ""]
+
+    def test_typos_in_command_and_name(self):
+        ok, command = parse("opne fridg", self.io, self.world)
+        assert ok and command.object_name == "fridge"
+
+    def test_argument_typo(self):
+        ok, command = parse("go to bedrom", self.io, self.world)
+        assert ok and command.room_name == "bedroom"
+        assert self.io.outputs == ['(Taking that as "go to bedroom".)', ""]
+
+    def test_known_and_unknown_arguments_untouched(self):
+        assert correct_spelling("go to bedroom", self.world) is None
+        assert correct_spelling("cancel order duct-tape", self.world) is None
+        assert correct_spelling("examine unicorn", self.world) is None
+
+    def test_ambiguous_correction_is_suggested(self):
+        Object("cat", self.world.main)
+        Object("car", self.world.main)
+        assert correct_spelling("examine caz", self.world) is None
+        ok, message = parse("eaxmine caz", self.io, self.world)
+        assert not ok
+        assert message == 'Don\'t understand command. Did you mean "examine car"?'
+        assert self.io.outputs == []
+
+    def test_no_world_no_correction(self):
+        assert parse("inventroy") == (False, "Don't understand command.")
+
+    def test_hopeless_input(self):
+        assert parse("dance", self.io, self.world) == (False, "Don't understand command.")
+        assert self.io.outputs == []
+
+    def test_index_shared_between_parses(self):
+        parse("inventroy", self.io, self.world)
+        names = corrector().names
+        parse("opne fridge", self.io, self.world)
+        assert corrector().names is names
+
+    def test_known_words_skip_the_world_walk(self):
+        parse("opne fridge", self.io, self.world)
+        Object("duct-tape", self.world.main)
+        with patch.object(Corrector, "update", autospec=True) as update:
+            assert correct_spelling("examine fridge", self.world) is None
+            assert correct_spelling("go to bedroom", self.world) is None
+            assert update.call_count == 0
+            correct_spelling("examine duct-tpae", self.world)
+            assert update.call_count == 1
@@ -0,0 +1,153 @@
+"""
+Tests for the streaming transcript recorder.
+"""
+
+import gzip
+
+import pytest
+
+from src.io_interface import MockIO
+from src.transcript import TranscriptIO, iter_transcript
+from src.gameloop import new_world, run
+
+
+class ExhaustibleMockIO(MockIO):
+    """MockIO that raises EOFError when inputs run out, ending the game loop."""
+
+    def get_input(self, prompt: str) -> str:
+        if self.input_index >= len(self.inputs):
+            self.outputs.append(prompt)
+            raise EOFError("No more test inputs available")
+        return super().get_input(prompt)
+
+
+class BufferingMockIO(ExhaustibleMockIO):
+    """Holds output back until flushed, like ConsoleIO; delivered holds what got out."""
+
+    def __init__(self):
+        super().__init__()
+        self.pending: list[str] = []
+        self.delivered: list[str] = []
+
+    def output(self, message: str) -> None:
+        super().output(message)
+        self.pending.append(message)
+
+    def flush(self) -> None:
+        self.delivered += self.pending
+        self.pending.clear()
+
+    def get_input(self, prompt: str) -> str:
+        self.flush()
+        self.delivered.append(prompt)
+        return super().get_input(prompt)
+
+
+def gzip_members(path: str) -> int:
+    """Number of gzip members in a file."""
+    with open(path, "rb") as f:
+        return f.read().count(b"\x1f\x8b\x08")
+
+
+class TestTranscriptIO:
+    def test_records_outputs_and_prompts(self, tmp_path):
+        """Outputs and prompts are recorded in order, like MockIO."""
+        inner = MockIO()
+        inner.set_inputs(["yes"])
+        path = str(tmp_path / "t.gz")
+        tio = TranscriptIO(inner, path)
+
+        tio.output("Hello")
+        assert tio.get_input("Continue?: ") == "yes"
+        tio.output("Bye")
+        tio.close()
+
+        assert list(iter_transcript(path)) == ["Hello", "Continue?: ", "Bye"]
+        assert inner.get_all_outputs() == ["Hello", "Continue?: ", "Bye"]
+
+    def test_multiline_messages_round_trip(self, tmp_path):
+        """Embedded newlines do not split records."""
+        path = str(tmp_path / "t.gz")
+        tio = TranscriptIO(MockIO(), path)
+        tio.output("line one\nline two")
+        assert list(tio.iter_lines()) == ["line one\nline two"]
+
+    def test_chunks_are_separate_gzip_members(self, tmp_path):
+        """Each full chunk is flushed to disk as it fills up."""
+        path = str(tmp_path / "t.gz")
+        tio = TranscriptIO(MockIO(), path, chunk_size=3)
+        for i in range(7):
+            tio.output(f"msg {i}")
+
+        assert tio.chunks_written == 2
+        with gzip.open(path, "rt") as f:
+            assert len(f.readlines()) == 6
+
+        tio.close()
+        assert tio.chunks_written == 3
+        assert list(iter_transcript(path)) == [f"msg {i}" for i in range(7)]
+
+    def test_tail_is_bounded(self, tmp_path):
+        """Only the most recent records stay in memory."""
+        tio = TranscriptIO(MockIO(), str(tmp_path / "t.gz"), tail_size=2)
+        for i in range(5):
+            tio.output(str(i))
+        assert list(tio.tail) == ["3", "4"]
+        assert tio.line_count == 5
+
+    def test_iter_lines_is_lazy(self, tmp_path):
+        """iter_lines returns an iterator, not a materialized list."""
+        tio = TranscriptIO(MockIO(), str(tmp_path / "t.gz"))
+        tio.output("a")
+        lines = tio.iter_lines()
+        assert next(lines) == "a"
+
+    def test_closed_transcript_rejects_output(self, tmp_path):
+        """Recording after close is an error."""
+        tio = TranscriptIO(MockIO(), str(tmp_path / "t.gz"))
+        tio.close()
+        with pytest.raises(ValueError):
+            tio.output("late")
+
+    def test_game_transcript_matches_mock_io(self, tmp_path):
+        """A full game run produces the same transcript as MockIO records."""
+        inner = ExhaustibleMockIO()
+        inner.set_inputs(["balance", "inventory"])
+        path = str(tmp_path / "game.gz")
+        with TranscriptIO(inner, path, chunk_size=4) as tio:
+            with pytest.raises(EOFError):
+                run(tio)
+
+        assert list(iter_transcript(path)) == inner.get_all_outputs()
+
+    def test_turn_flushes_reach_inner_io_not_the_file(self, tmp_path):
+        """Per-turn flushes deliver the wrapped IO's output without writing chunks."""
+        inner = BufferingMockIO()
+        inner.set_inputs(["look at watch"] * 50)
+        path = str(tmp_path / "game.gz")
+        with TranscriptIO(inner, path, chunk_size=512) as tio:
+            with pytest.raises(EOFError):
+                run(tio)
+            assert tio.chunks_written == 0
+
+        assert tio.chunks_written == 1
+        assert gzip_members(path) == 1
+        assert inner.pending == []
+        assert inner.delivered == inner.get_all_outputs()
+        assert list(iter_transcript(path)) == inner.get_all_outputs()
+
+    def test_ending_reaches_buffering_io(self, tmp_path):
+        """The game's last words are flushed through to the wrapped IO."""
+        inner = BufferingMockIO()
+        inner.set_inputs(["ponder", "200"])
+        tio = TranscriptIO(inner, str(tmp_path / "game.gz"))
+        state = new_world(tio)
+        run(tio, state)
+
+        assert state.game_over
+        assert inner.pending == []
+        assert inner.delivered == inner.get_all_outputs()
+
+    def test_missing_file_yields_nothing(self, tmp_path):
+        """Reading a transcript that was never written yields no records."""
+        assert list(iter_transcript(str(tmp_path / "none.gz"))) == []
@@ -0,0 +1,81 @@
+"""
+Tests for shared per-turn lookups and action-space enumeration.
+"""
+
+from unittest.mock import patch
+
+from src.commands.game_commands import DebugItemsCommand, EnterRoomCommand, OpenThingCommand
+from src.commands.turn_context import TurnContext, candidate_commands, executable_commands
+from src.core.characters import Hero
+from src.core.game_world import GameState
+from src.io_interface import MockIO
+
+
+def describe(commands):
+    return sorted(command.description for command in commands)
+
+
+class TestTurnContext:
+    def setup_method(self):
+        self.state = GameState(MockIO())
+
+    def test_room_resolved_once(self):
+        context = TurnContext(self.state)
+        with patch.object(Hero, "GetRoom", autospec=True,
+                          side_effect=lambda hero: self.state.apartment.main) as get_room:
+            for command in candidate_commands(context):
+                command.can_execute(self.state, context)
+        assert get_room.call_count == 1
+
+    def test_lookups(self):
+        context = TurnContext(self.state)
+        assert context.room is self.state.apartment.main
+        assert "watch" in context.inventory
+        assert "fridge" in context.room_items
+        assert "fridge" not in context.open_containers
+        assert context.holding("watch")
+        assert not context.holding("watch", "hammer")
+
+
+class TestExecutableCommands:
+    def setup_method(self):
+        self.state = GameState(MockIO())
+
+    def assert_matches_individual_checks(self):
+        """The shared-context answer equals checking each command on its own."""
+        candidates = candidate_commands(TurnContext(self.state))
+        expected = [command for command in candidates if command.can_execute(self.state)]
+        assert describe(executable_commands(self.state)) == describe(expected)
+
+    def test_start_of_game(self):
+        descriptions = describe(executable_commands(self.state))
+        assert "Make a phone call" in descriptions
+        assert not any(d.startswith("Nail") for d in descriptions)
+        self.assert_matches_individual_checks()
+
+    def test_no_op_commands_left_out(self):
+        descriptions = describe(executable_commands(self.state))
+        assert "Enter room: main" not in descriptions
+        assert "Examine me" not in descriptions
+        assert "Close toolbox" not in descriptions
+        assert "Open toolbox" in descriptions
+        assert not any(d.startswith("Get watch") for d in descriptions)
+        OpenThingCommand("toolbox").execute(self.state)
+        descriptions = describe(executable_commands(self.state))
+        assert "Close toolbox" in descriptions
+        assert "Open toolbox" not in descriptions
+
+    def test_after_moving_and_opening(self):
+        OpenThingCommand("fridge").execute(self.state)
+        self.assert_matches_individual_checks()
+        DebugItemsCommand().execute(self.state)
+        EnterRoomCommand("closet").execute(self.state)
+        descriptions = describe(executable_commands(self.state))
+        assert "Nail self into closet" in descriptions
+        assert "Make a phone call" not in descriptions
+        self.assert_matches_individual_checks()
+
+    def test_commands_are_fresh_instances(self):
+        first = executable_commands(self.state)
+        second = executable_commands(self.state)
+        assert not {id(command) for command in first} & {id(command) for command in second}
@@ -9,22 +9,37 @@ runs the game with those inputs, and verifies the output matches the expected pa
 import re
 import sys
 import os
-from typing import List, Tuple, Optional, NamedTuple
+import time
+from typing import Iterable, List, Tuple, Optional, NamedTuple
 from dataclasses import dataclass
 
 # Add parent directory to path so we can import game modules
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.gameloop import run
+from src.gameloop import run, new_world
+from src.gamestate import GameState
+from src.core.snapshot import WorldSnapshot
 from src.io_interface import MockIO
+from src.transcript import TranscriptIO, iter_transcript
 
 
 class TestMockIO(MockIO):
     """Enhanced MockIO that raises exception when inputs are exhausted."""
-    
+
+    def __init__(self, keep_outputs: bool = True):
+        super().__init__()
+        # Streaming runs record through a TranscriptIO instead
+        self.keep_outputs = keep_outputs
+
+    def output(self, message: str) -> None:
+        """Store output message unless recording is delegated elsewhere."""
+        if self.keep_outputs:
+            self.outputs.append(message)
+
     def get_input(self, prompt: str) -> str:
         """Return pre-configured input response, raise EOFError when exhausted."""
-        self.outputs.append(prompt)  # Store prompt as output too
+        if self.keep_outputs:
+            self.outputs.append(prompt)  # Store prompt as output too
         if self.input_index < len(self.inputs):
             response = self.inputs[self.input_index]
             self.input_index += 1
@@ -33,6 +48,39 @@ class TestMockIO(MockIO):
         raise EOFError("No more test inputs available")
 
 
+class WorldPool:
+    """
+    Reuses one pristine game world across many test scripts.
+
+    The world is built once and snapshotted; each acquire() restores it in
+    place and binds it to the script's IO. Scripts run sequentially, so a
+    single pooled world is enough. Setup time is accumulated for reporting.
+    """
+
+    def __init__(self):
+        start = time.perf_counter()
+        self.state = new_world(MockIO())
+        self.snapshot = WorldSnapshot(self.state)
+        self.build_seconds = time.perf_counter() - start
+        self.setup_seconds = 0.0
+        self.acquired = 0
+
+    def acquire(self, io: MockIO) -> GameState:
+        """Return the pooled world reset to its pristine state and bound to io."""
+        start = time.perf_counter()
+        state = self.snapshot.restore(io)
+        self.setup_seconds += time.perf_counter() - start
+        self.acquired += 1
+        return state
+
+    def report(self) -> str:
+        """One-line summary of world setup cost."""
+        per_script = self.setup_seconds / self.acquired if self.acquired else 0.0
+        return (f"World setup: built once in {self.build_seconds * 1e3:.2f} ms, "
+                f"{self.acquired} restores totalling {self.setup_seconds * 1e3:.2f} ms "
+                f"({per_script * 1e6:.1f} us/script)")
+
+
 class CheckDirective(NamedTuple):
     """Represents a CHECK directive from the test file."""
     line_number: int
@@ -99,94 +147,149 @@ def parse_test_file(filename: str) -> TestCase:
     return TestCase(inputs, checks, filename)
 
 
-def run_game_with_inputs(inputs: List[str]) -> List[str]:
-    """Run the game with the given inputs and return all output lines."""
-    mock_io = TestMockIO()
+def run_game_with_inputs(inputs: List[str],
+                         transcript_path: Optional[str] = None,
+                         pool: Optional[WorldPool] = None) -> Iterable[str]:
+    """
+    Run the game with the given inputs and return all output lines.
+
+    With transcript_path, output is streamed to a compressed transcript
+    instead of being kept in memory, and a lazy iterator over it is returned.
+    With a pool, the pooled pristine world is reset and reused instead of
+    building a new one.
+    """
+    mock_io = TestMockIO(keep_outputs=transcript_path is None)
     mock_io.set_inputs(inputs)
+    game_io = mock_io if transcript_path is None else TranscriptIO(mock_io, transcript_path)
+    state = pool.acquire(game_io) if pool is not None else None
     
     try:
         # Run the game with mock I/O
-        run(mock_io)
+        run(game_io, state)
     except (EOFError, KeyboardInterrupt):
         # Game exits when it runs out of inputs, that's expected
         pass
     except Exception as e:
         # Capture any other exceptions but continue with output checking
         print(f"Warning: Game execution ended with exception: {e}", file=sys.stderr)
-    
+
+    if isinstance(game_io, TranscriptIO):
+        game_io.close()
+        return game_io.iter_lines()
     return mock_io.get_all_outputs()
 
 
-def check_output(outputs: List[str], checks: List[CheckDirective]) -> Tuple[bool, Optional[str]]:
+class CompiledChecks:
     """
-    Check if the output matches the CHECK directives.
-    Returns (success, error_message).
+    A test's CHECK directives compiled into a single-pass matcher.
+
+    Patterns are normalized once at compile time and every output line is
+    normalized at most once, as the scan reaches it. CHECK-NOT directives
+    are held as pending patterns and tested against each line scanned on
+    the way to the next positive match, so no line is ever revisited and
+    matching stops at the first failure.
     """
-    output_index = 0
-    check_index = 0
-    
-    while check_index < len(checks):
-        check = checks[check_index]
-        
-        if check.directive_type == "CHECK":
-            # Find the pattern starting from current output position
-            found = False
-            for i in range(output_index, len(outputs)):
-                if normalize_whitespace(check.pattern) in normalize_whitespace(outputs[i]):
-                    output_index = i + 1
-                    found = True
+
+    def __init__(self, checks: List[CheckDirective]):
+        self.checks = checks
+        self.patterns = [normalize_whitespace(check.pattern) for check in checks]
+
+    def match(self, outputs: Iterable[str]) -> Tuple[bool, Optional[str]]:
+        """
+        Match output lines (any iterable, consumed lazily) against the checks.
+        Returns (success, error_message).
+        """
+        lines = enumerate(outputs)
+        pending_nots: List[int] = []
+
+        for check_index, check in enumerate(self.checks):
+            pattern = self.patterns[check_index]
+
+            if check.directive_type == "CHECK-NOT":
+                pending_nots.append(check_index)
+                continue
+
+            if check.directive_type == "CHECK-NEXT":
+                entry = next(lines, None)
+                if entry is None:
+                    return False, f"CHECK-NEXT at line {check.line_number} failed:\n" \
+                                 f"  Expected: {check.pattern}\n" \
+                                 f"  But no more output lines available"
+                index, line = entry
+                normalized = normalize_whitespace(line)
+                if pattern not in normalized:
+                    error = self._check_nots(pending_nots, index, line, normalized)
+                    return False, error or f"CHECK-NEXT at line {check.line_number} failed:\n" \
+                                           f"  Expected: {check.pattern}\n" \
+                                           f"  Got: {line}"
+                pending_nots.clear()
+                continue
+
+            # CHECK: scan forward to the first matching line
+            scanned = 0
+            for index, line in lines:
+                scanned += 1
+                normalized = normalize_whitespace(line)
+                if pattern in normalized:
                     break
-            
-            if not found:
+                error = self._check_nots(pending_nots, index, line, normalized)
+                if error:
+                    return False, error
+            else:
                 return False, f"CHECK at line {check.line_number} failed:\n" \
                              f"  Expected: {check.pattern}\n" \
-                             f"  Searched through {len(outputs) - output_index} remaining output lines"
-        
-        elif check.directive_type == "CHECK-NEXT":
-            # Check the very next output line
-            if output_index >= len(outputs):
-                return False, f"CHECK-NEXT at line {check.line_number} failed:\n" \
-                             f"  Expected: {check.pattern}\n" \
-                             f"  But no more output lines available"
-            
-            if normalize_whitespace(check.pattern) not in normalize_whitespace(outputs[output_index]):
-                return False, f"CHECK-NEXT at line {check.line_number} failed:\n" \
-                             f"  Expected: {check.pattern}\n" \
-                             f"  Got: {outputs[output_index]}"
-            
-            output_index += 1
-        
-        elif check.directive_type == "CHECK-NOT":
-            # Find the next non-CHECK-NOT directive to determine the search range
-            search_end = len(outputs)
-            for next_check_idx in range(check_index + 1, len(checks)):
-                next_check = checks[next_check_idx]
-                if next_check.directive_type != "CHECK-NOT":
-                    # Find where this next check matches to limit our search
-                    for i in range(output_index, len(outputs)):
-                        if normalize_whitespace(next_check.pattern) in normalize_whitespace(outputs[i]):
-                            search_end = i
-                            break
-                    break
-            
-            # Check that the pattern does NOT appear in the range
-            for i in range(output_index, search_end):
-                if normalize_whitespace(check.pattern) in normalize_whitespace(outputs[i]):
-                    return False, f"CHECK-NOT at line {check.line_number} failed:\n" \
-                                 f"  Pattern should not appear: {check.pattern}\n" \
-                                 f"  But found in output line {i}: {outputs[i]}"
-            
-            # CHECK-NOT doesn't advance the output index
-        
-        check_index += 1
-    
-    return True, None
+                             f"  Searched through {scanned} remaining output lines"
+            pending_nots.clear()
+
+        # Trailing CHECK-NOTs cover the rest of the output
+        if pending_nots:
+            for index, line in lines:
+                error = self._check_nots(pending_nots, index, line, normalize_whitespace(line))
+                if error:
+                    return False, error
+
+        return True, None
 
+    def _check_nots(self, pending_nots: List[int], index: int,
+                    line: str, normalized: str) -> Optional[str]:
+        """Return an error message if a pending CHECK-NOT pattern appears in the line."""
+        for check_index in pending_nots:
+            if self.patterns[check_index] in normalized:
+                check = self.checks[check_index]
+                return f"CHECK-NOT at line {check.line_number} failed:\n" \
+                       f"  Pattern should not appear: {check.pattern}\n" \
+                       f"  But found in output line {index}: {line}"
+        return None
 
-def run_filecheck(test_filename: str, verbose: bool = False) -> bool:
+
+def compile_checks(checks: List[CheckDirective]) -> CompiledChecks:
+    """Compile CHECK directives into a reusable single-pass matcher."""
+    return CompiledChecks(checks)
+
+
+def check_output(outputs: Iterable[str], checks: List[CheckDirective]) -> Tuple[bool, Optional[str]]:
+    """
+    Check if the output matches the CHECK directives.
+    Returns (success, error_message).
+    """
+    return compile_checks(checks).match(outputs)
+
+
+def _output_lines(outputs: Iterable[str], transcript_path: Optional[str]) -> Iterable[str]:
+    """Return a fresh pass over the outputs (re-reading a streamed transcript)."""
+    return outputs if transcript_path is None else iter_transcript(transcript_path)
+
+
+def run_filecheck(test_filename: str, verbose: bool = False,
+                  transcript_path: Optional[str] = None,
+                  pool: Optional[WorldPool] = None) -> bool:
     """
     Run FileCheck on a test file.
     Returns True if all checks pass, False otherwise.
+
+    With transcript_path, the game output is streamed to a compressed
+    transcript and matched lazily instead of being held in memory.
+    With a pool, the script runs in the pooled world (see WorldPool).
     """
     try:
         # Parse the test file
@@ -198,16 +301,18 @@ def run_filecheck(test_filename: str, verbose: bool = False) -> bool:
             print(f"Checks: {len(test_case.checks)} directives")
         
         # Run the game with inputs
-        outputs = run_game_with_inputs(test_case.inputs)
+        outputs = run_game_with_inputs(test_case.inputs, transcript_path, pool)
         
         if verbose:
-            print(f"Game produced {len(outputs)} output lines")
+            if transcript_path is None:
+                print(f"Game produced {len(outputs)} output lines")
             print("Game output:")
-            for i, output in enumerate(outputs):
+            for i, output in enumerate(_output_lines(outputs, transcript_path)):
                 print(f"  {i:3}: {output}")
         
         # Check the outputs against CHECK directives
-        success, error_msg = check_output(outputs, test_case.checks)
+        success, error_msg = check_output(_output_lines(outputs, transcript_path),
+                                          test_case.checks)
         
         if success:
             if verbose:
@@ -218,7 +323,7 @@ def run_filecheck(test_filename: str, verbose: bool = False) -> bool:
             print(error_msg)
             if verbose:
                 print("\nFull game output:")
-                for i, output in enumerate(outputs):
+                for i, output in enumerate(_output_lines(outputs, transcript_path)):
                     print(f"  {i:3}: {output}")
             return False
     
@@ -233,13 +338,14 @@ def run_filecheck(test_filename: str, verbose: bool = False) -> bool:
 def main():
     """Main entry point for the filecheck tool."""
     if len(sys.argv) < 2:
-        print("Usage: python filecheck.py <test_file> [--verbose]")
+        print("Usage: python filecheck.py <test_file> [--verbose] [--transcript FILE]")
         print("       python filecheck.py --help")
         sys.exit(1)
     
     if sys.argv[1] == '--help':
         print(__doc__)
-        print("\nUsage: python filecheck.py <test_file> [--verbose]")
+        print("\nUsage: python filecheck.py <test_file> [--verbose] [--transcript FILE]")
+        print("\n  --transcript FILE  Stream output to a compressed transcript instead of memory")
         print("\nTest file format:")
         print("  # CHECK: <pattern>     - Find pattern anywhere in remaining output")
         print("  # CHECK-NEXT: <pattern> - Find pattern in the very next output line")
@@ -254,8 +360,15 @@ def main():
     
     test_file = sys.argv[1]
     verbose = '--verbose' in sys.argv
+    transcript_path = None
+    if '--transcript' in sys.argv:
+        flag_index = sys.argv.index('--transcript')
+        if flag_index + 1 >= len(sys.argv):
+            print("--transcript requires a file path")
+            sys.exit(1)
+        transcript_path = sys.argv[flag_index + 1]
     
-    success = run_filecheck(test_file, verbose)
+    success = run_filecheck(test_file, verbose, transcript_path)
     sys.exit(0 if success else 1)
 
 
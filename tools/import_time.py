@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Import-time measurement for the game's start-up path.
+
+Runs `python -X importtime -c "import <module>"` in fresh interpreters
+several times, keeps the fastest sample for every module, and reports the
+total start-up cost together with the slowest src/ modules. Every module
+listed is loaded before the first prompt appears, so this is also a quick
+way to check that nothing heavy crept back onto the start-up path.
+"""
+
+import os
+import subprocess
+import sys
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(TOOLS_DIR)
+DEFAULT_MODULE = "src.gameloop"
+DEFAULT_RUNS = 5
+
+
+def sample_import_times(module: str) -> dict[str, tuple[int, int]]:
+    """
+    Import module in a fresh interpreter.
+
+    Returns {module name: (self microseconds, cumulative microseconds)}.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    )
+    times: dict[str, tuple[int, int]] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def measure(module: str, runs: int) -> dict[str, tuple[int, int]]:
+    """Best-of-runs self and cumulative import times for every module."""
+    best: dict[str, tuple[int, int]] = {}
+    for _ in range(runs):
+        for name, (self_us, cumulative_us) in sample_import_times(module).items():
+            if name in best:
+                self_us = min(self_us, best[name][0])
+                cumulative_us = min(cumulative_us, best[name][1])
+            best[name] = (self_us, cumulative_us)
+    return best
+
+
+def report(module: str, times: dict[str, tuple[int, int]], top: int) -> str:
+    """Format a start-up report."""
+    src_modules = sorted((name for name in times if name == "src" or name.startswith("src.")),
+                         key=lambda name: times[name][0], reverse=True)
+    lines = [
+        f"import {module}: {times[module][1] / 1000:.1f} ms "
+        f"({len(times)} modules, {len(src_modules)} from src)",
+        "",
+        f"{'self ms':>8} {'cumul ms':>9}  module",
+    ]
+    for name in src_modules[:top]:
+        self_us, cumulative_us = times[name]
+        lines.append(f"{self_us / 1000:8.2f} {cumulative_us / 1000:9.2f}  {name}")
+    return "\n".join(lines)
+
+
+def main():
+    """Measure and print the import time of the start-up module."""
+    if '--help' in sys.argv:
+        print(__doc__)
+        print("Usage: python import_time.py [module] [--runs N] [--top N]")
+        print(f"\n  module    Module to import (default: {DEFAULT_MODULE})")
+        print(f"  --runs N  Number of fresh interpreters to sample (default: {DEFAULT_RUNS})")
+        print("  --top N   Number of src modules to list (default: all)")
+        return 0
+
+    args = sys.argv[1:]
+    options = {}
+    for flag in ('--runs', '--top'):
+        if flag in args:
+            flag_index = args.index(flag)
+            if flag_index + 1 >= len(args) or not args[flag_index + 1].isdigit():
+                print(f"{flag} requires a number")
+                return 1
+            options[flag] = int(args[flag_index + 1])
+            del args[flag_index:flag_index + 2]
+    module = args[0] if args else DEFAULT_MODULE
+
+    times = measure(module, max(1, options.get('--runs', DEFAULT_RUNS)))
+    print(report(module, times, options.get('--top', len(times))))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
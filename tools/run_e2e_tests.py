@@ -4,12 +4,34 @@ End-to-end test runner for the game.
 
 This script finds all .txt files in the tools directory and runs them through
 the FileCheck tool to verify game functionality.
+
+With --changed, each script runs under a lightweight profiling hook that
+records which src/ modules, functions and command classes it exercised.
+The record is cached next to this script, and later --changed runs only
+execute scripts whose script file, or whose exercised functions or
+module-level code, changed since they last passed.
+
+Scripts share one pooled world that is restored from a snapshot before
+each run (see filecheck.WorldPool); pass --no-pool to build a fresh world
+per script. With --changed the pooled world is built under the profiling
+hook as well, and the code that built it counts as exercised by every
+script.
 """
 
+import ast
+import hashlib
+import json
 import os
 import sys
 import glob
-from filecheck import run_filecheck
+from filecheck import run_filecheck, WorldPool
+from src import inputparser
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(TOOLS_DIR)
+SRC_DIR = os.path.join(REPO_ROOT, "src")
+DEPS_CACHE = os.path.join(TOOLS_DIR, ".e2e_deps.json")
+DEPS_CACHE_VERSION = 1
 
 
 def find_test_files(directory: str) -> list[str]:
@@ -18,38 +40,247 @@ def find_test_files(directory: str) -> list[str]:
     return glob.glob(pattern)
 
 
+def file_digest(path: str) -> str | None:
+    """Return the SHA-1 of a file's contents, or None if it does not exist."""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def runner_digest() -> str:
+    """Digest of the test harness itself; a change forces a full run."""
+    digests = [file_digest(os.path.join(TOOLS_DIR, name)) or ""
+               for name in ("filecheck.py", "run_e2e_tests.py")]
+    return hashlib.sha1("".join(digests).encode()).hexdigest()
+
+
+class SourceIndex:
+    """
+    Function-level digests for one source file.
+
+    Each top-level function and method (with its decorators and nested
+    functions) gets its own digest; everything else in the file (imports,
+    constants, class attributes) is folded into a single module digest.
+    """
+
+    def __init__(self, path: str) -> None:
+        with open(path, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        self.spans: list[tuple[int, int, str]] = []
+        self._collect(ast.parse("\n".join(lines)).body, "")
+
+        self.functions: dict[str, str] = {}
+        covered: set[int] = set()
+        for start, end, qualname in self.spans:
+            segment = "\n".join(lines[start - 1:end])
+            self.functions[qualname] = hashlib.sha1(segment.encode()).hexdigest()
+            covered.update(range(start, end + 1))
+        residue = "\n".join(line for number, line in enumerate(lines, 1)
+                            if number not in covered)
+        self.module_digest = hashlib.sha1(residue.encode()).hexdigest()
+
+    def _collect(self, body: list, prefix: str) -> None:
+        for node in body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                start = min([node.lineno] + [d.lineno for d in node.decorator_list])
+                self.spans.append((start, node.end_lineno, prefix + node.name))
+            elif isinstance(node, ast.ClassDef):
+                self._collect(node.body, prefix + node.name + ".")
+
+    def function_at(self, line: int) -> str | None:
+        """Qualified name of the outermost function containing a line."""
+        for start, end, qualname in self.spans:
+            if start <= line <= end:
+                return qualname
+        return None
+
+
+_source_indexes: dict[str, SourceIndex | None] = {}
+
+
+def source_index(path: str) -> SourceIndex | None:
+    """Return the (memoized) SourceIndex for a file, or None if it is gone."""
+    if path not in _source_indexes:
+        try:
+            _source_indexes[path] = SourceIndex(path)
+        except (OSError, SyntaxError):
+            _source_indexes[path] = None
+    return _source_indexes[path]
+
+
+class DependencyTracer:
+    """
+    Records the code objects and command classes exercised while active.
+
+    Uses sys.setprofile, which only fires on call/return events, so the
+    overhead is a set insertion per Python-level call.
+    """
+
+    def __init__(self) -> None:
+        self.codes: set = set()
+        self.commands: set[str] = set()
+
+    def _profile(self, frame, event, arg) -> None:
+        if event != "call":
+            return
+        code = frame.f_code
+        self.codes.add(code)
+        if code.co_name == "execute":
+            owner = frame.f_locals.get("self")
+            if owner is not None:
+                self.commands.add(type(owner).__name__)
+
+    def __enter__(self) -> "DependencyTracer":
+        sys.setprofile(self._profile)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        sys.setprofile(None)
+
+    def dependencies(self, setup: "DependencyTracer | None" = None) -> dict:
+        """
+        Digests of the src/ code that ran: module-level digests for every
+        touched file and per-function digests for every executed function.
+        The code recorded by a setup tracer (such as the one that watched
+        the pooled world being built) counts as run too.
+        """
+        src_prefix = SRC_DIR + os.sep
+        modules: dict[str, str] = {}
+        functions: dict[str, str] = {}
+        codes = self.codes | setup.codes if setup is not None else self.codes
+        for code in codes:
+            path = os.path.abspath(code.co_filename)
+            if not path.startswith(src_prefix):
+                continue
+            index = source_index(path)
+            if index is None:
+                continue
+            module = os.path.relpath(path, REPO_ROOT)
+            modules[module] = index.module_digest
+            qualname = index.function_at(code.co_firstlineno)
+            if qualname is not None:
+                functions[f"{module}::{qualname}"] = index.functions[qualname]
+        return {"modules": modules, "functions": functions}
+
+
+def load_deps_cache() -> dict | None:
+    """Load the dependency cache; None if missing, corrupt or from another harness."""
+    try:
+        with open(DEPS_CACHE, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cache.get("version") != DEPS_CACHE_VERSION or cache.get("runner") != runner_digest():
+        return None
+    return cache
+
+
+def save_deps_cache(scripts: dict) -> None:
+    """Write the dependency cache."""
+    cache = {"version": DEPS_CACHE_VERSION, "runner": runner_digest(), "scripts": scripts}
+    with open(DEPS_CACHE, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=1, sort_keys=True)
+
+
+def is_stale(test_file: str, record: dict | None) -> bool:
+    """Whether a script, or any code it exercised, changed since its record."""
+    if record is None or record.get("script") != file_digest(test_file):
+        return True
+    for module, digest in record.get("modules", {}).items():
+        index = source_index(os.path.join(REPO_ROOT, module))
+        if index is None or index.module_digest != digest:
+            return True
+    for key, digest in record.get("functions", {}).items():
+        module, qualname = key.split("::", 1)
+        index = source_index(os.path.join(REPO_ROOT, module))
+        if index is None or index.functions.get(qualname) != digest:
+            return True
+    return False
+
+
 def main():
     """Run all end-to-end tests."""
-    tools_dir = os.path.dirname(os.path.abspath(__file__))
-    test_files = find_test_files(tools_dir)
-    
+    test_files = find_test_files(TOOLS_DIR)
+
     if not test_files:
         print("No test files found in tools directory")
         return 0
-    
+
     verbose = '--verbose' in sys.argv
-    
+    incremental = '--changed' in sys.argv
+    pool = None
+    setup = None
+    if '--no-pool' not in sys.argv:
+        if incremental:
+            # The pooled world is built once, before any script is traced;
+            # every script depends on the constructors that built it
+            with DependencyTracer() as setup:
+                pool = WorldPool()
+        else:
+            pool = WorldPool()
+
+    records: dict = {}
+    selected = sorted(test_files)
+    if incremental:
+        cache = load_deps_cache()
+        if cache is None:
+            print("No valid dependency cache; running the full suite.")
+        else:
+            records = cache["scripts"]
+            selected = [test_file for test_file in selected
+                        if is_stale(test_file, records.get(os.path.basename(test_file)))]
+
     passed = 0
     failed = 0
-    
-    print(f"Running {len(test_files)} end-to-end tests...")
+    skipped = len(test_files) - len(selected)
+
+    print(f"Running {len(selected)} end-to-end tests...")
     print()
-    
-    for test_file in sorted(test_files):
+
+    for test_file in selected:
         test_name = os.path.basename(test_file)
         print(f"Running {test_name}...")
-        
-        success = run_filecheck(test_file, verbose)
+
+        if incremental:
+            # Cached parses would hide the template matching from the trace
+            inputparser.clear_parse_cache()
+            with DependencyTracer() as tracer:
+                success = run_filecheck(test_file, verbose, pool=pool)
+        else:
+            success = run_filecheck(test_file, verbose, pool=pool)
+
         if success:
             print(f"PASS: {test_name}")
             passed += 1
         else:
             print(f"FAIL: {test_name}")
             failed += 1
+
+        if incremental:
+            if success:
+                records[test_name] = {
+                    "script": file_digest(test_file),
+                    **tracer.dependencies(setup),
+                    "commands": sorted(tracer.commands),
+                }
+            else:
+                # Failing scripts always rerun until they pass again
+                records.pop(test_name, None)
         print()
-    
-    print(f"Results: {passed} passed, {failed} failed")
-    
+
+    if incremental:
+        known = {os.path.basename(test_file) for test_file in test_files}
+        save_deps_cache({name: record for name, record in records.items() if name in known})
+
+    summary = f"Results: {passed} passed, {failed} failed"
+    if skipped:
+        summary += f", {skipped} skipped (unchanged)"
+    print(summary)
+    if pool is not None:
+        print(pool.report())
+
     if failed > 0:
         print("Some tests failed!")
         return 1
@@ -59,4 +290,4 @@ def main():
 
 
 if __name__ == '__main__':
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())